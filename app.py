@@ -4,12 +4,27 @@ Music Concierge Support Dashboard
 A lightweight customtkinter-based support dashboard.
 """
 
+import hashlib
+import json
 import os
+import queue
+import random
 import re
+import struct
 import sys
+import threading
+import time
 import tkinter as tk
-from datetime import datetime
-from tkinter import Canvas
+import zipfile
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from itertools import accumulate, repeat
+from operator import add
+from tkinter import Canvas, ttk
 from xml.etree import ElementTree as ET
 
 import customtkinter as ctk
@@ -35,6 +50,87 @@ SIDEBAR_W     = 200        # Narrower sidebar
 
 KV_BASE     = r"C:\Kaleidovision\config\kv"
 
+# ── Shared fonts ───────────────────────────────────────────────────────────────
+# Every CTkFont is a Tk named font that customtkinter rescales on DPI changes, so
+# widgets share one instance per (size, weight, family) instead of building their own.
+_font_cache: dict[tuple, ctk.CTkFont] = {}
+
+
+def get_font(size: int = 12, weight: str = "normal", family: str | None = None) -> ctk.CTkFont:
+    """Return the shared font for this style. Never configure() it - create a private CTkFont for that."""
+    key = (size, weight, family)
+    font = _font_cache.get(key)
+    if font is None:
+        if family is None:
+            font = _font_cache[key] = ctk.CTkFont(size=size, weight=weight)
+        else:
+            font = _font_cache[key] = ctk.CTkFont(family=family, size=size, weight=weight)
+    return font
+
+
+# ── Render mode (remote sessions) ──────────────────────────────────────────────
+def detect_remote_session() -> bool:
+    """Best-effort check for a Remote Desktop session."""
+    # SESSIONNAME is "Console" locally and "RDP-Tcp#N" over Remote Desktop
+    if os.environ.get("SESSIONNAME", "").upper().startswith("RDP"):
+        return True
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            SM_REMOTESESSION = 0x1000
+            return bool(ctypes.windll.user32.GetSystemMetrics(SM_REMOTESESSION))
+        except Exception:
+            return False
+    return False
+
+
+class RenderMode:
+    """
+    Low-redraw switch for remote sessions, where every repaint costs bandwidth.
+    When on, hover highlighting and the log viewer's scroll flash are off,
+    the clock ticks per minute and the background canvas is left alone.
+    """
+
+    # Widgets whose hover effect is turned off in low-redraw mode
+    _HOVER_WIDGETS = (ctk.CTkButton, ctk.CTkScrollbar, ctk.CTkSwitch)
+
+    def __init__(self):
+        self.low_redraw = False
+        self._listeners = []
+
+    def load(self):
+        """Apply the saved choice ("auto", "remote" or "normal"); auto detects RDP."""
+        choice = load_ui_settings().get("render_mode", "auto")
+        self.low_redraw = choice == "remote" or (choice == "auto" and detect_remote_session())
+
+    def set_low_redraw(self, enabled: bool):
+        """Switch modes at runtime and remember the choice."""
+        save_ui_setting("render_mode", "remote" if enabled else "normal")
+        if enabled == self.low_redraw:
+            return
+        self.low_redraw = enabled
+        for callback in list(self._listeners):
+            callback(enabled)
+
+    def subscribe(self, callback):
+        """Call callback(low_redraw) whenever the mode changes."""
+        self._listeners.append(callback)
+        return callback
+
+    def apply(self, widget, force: bool = False):
+        """Set hover on every hover-capable widget under *widget* to match the mode."""
+        if not (self.low_redraw or force):
+            return  # New widgets already hover by default
+        stack = [widget]
+        while stack:
+            w = stack.pop()
+            if isinstance(w, self._HOVER_WIDGETS):
+                w.configure(hover=not self.low_redraw)
+            stack.extend(w.winfo_children())
+
+
+RENDER_MODE = RenderMode()
+
 # ── Folder-name datetime parser ────────────────────────────────────────────────
 # Format: YYYY-MM-DD-HHMM  e.g. 2025-10-02-0242  → 2025-10-02 02:42
 _FOLDER_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})-(\d{2})(\d{2})$")
@@ -52,25 +148,84 @@ def _folder_datetime(name: str):
         return None
 
 
+class SnapshotIndex:
+    """
+    The dated (YYYY-MM-DD-HHMM) sub-folders of snapshot base folders such as
+    KV_BASE and each music Channel[N] folder, sorted oldest first and cached
+    per base. A base is only rescanned when its own mtime changes, which is
+    what adding, renaming or removing a sub-folder does.
+    """
+
+    def __init__(self):
+        self._bases = {}  # base -> (mtime_ns, [(datetime, folder_name)])
+        self._lock = threading.Lock()  # detail-view loaders query it from worker threads
+
+    def folders(self, base: str) -> list[tuple[datetime, str]]:
+        """[(datetime, folder_name)] of *base*, oldest first; empty if *base* is missing."""
+        try:
+            mtime = os.stat(base).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._bases.pop(base, None)
+            return []
+        with self._lock:
+            cached = self._bases.get(base)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        folders = []
+        try:
+            for entry in os.scandir(base):
+                if not entry.is_dir():
+                    continue
+                dt = _folder_datetime(entry.name)
+                if dt is not None:
+                    folders.append((dt, entry.name))
+        except OSError as e:
+            print(f"Error scanning snapshot folders in {base}: {e}")
+            return []
+        folders.sort()
+        with self._lock:
+            self._bases[base] = (mtime, folders)
+        return folders
+
+    def latest(self, base: str) -> str | None:
+        """Name of the most recent dated folder in *base*."""
+        folders = self.folders(base)
+        return folders[-1][1] if folders else None
+
+    def previous(self, base: str, folder_name: str) -> str | None:
+        """Name of the dated folder just before *folder_name*, if any."""
+        dt = _folder_datetime(folder_name)
+        if dt is None:
+            return None
+        folders = self.folders(base)
+        i = bisect_left(folders, (dt, folder_name))
+        if i >= len(folders) or folders[i][1] != folder_name:
+            return None
+        return folders[i - 1][1] if i > 0 else None
+
+    def between(self, base: str, start: datetime, end: datetime) -> list[str]:
+        """Names of the dated folders with start <= date <= end, oldest first."""
+        folders = self.folders(base)
+        dates = [dt for dt, _ in folders]
+        lo = bisect_left(dates, start)
+        hi = bisect_right(dates, end)
+        return [name for _, name in folders[lo:hi]]
+
+
+SNAPSHOT_INDEX = SnapshotIndex()
+
+
 def find_latest_xml_file(filename: str, base: str = KV_BASE):
     """
-    Scan *base* for sub-folders matching YYYY-MM-DD-HHMM, pick the latest
-    by datetime, and return (folder_name, full_path_to_xml_file).
+    Pick the latest sub-folder of *base* matching YYYY-MM-DD-HHMM and return
+    (folder_name, full_path_to_xml_file).
     Returns (None, None) if nothing is found.
     """
-    if not os.path.isdir(base):
-        return None, None
-    candidates = []
-    for entry in os.scandir(base):
-        if not entry.is_dir():
-            continue
-        dt = _folder_datetime(entry.name)
-        if dt is not None:
-            candidates.append((dt, entry.name))
-    if not candidates:
+    latest_name = SNAPSHOT_INDEX.latest(base)
+    if latest_name is None:
         return None, None
-    candidates.sort(key=lambda x: x[0], reverse=True)
-    latest_name = candidates[0][1]
     xml_path = os.path.join(base, latest_name, filename)
     return latest_name, xml_path
 
@@ -101,7 +256,7 @@ def pretty_xml(xml_path: str):
             lines.append(f"  @{k} = {v}")
     lines.append("")
 
-    def walk(el, depth=0):
+    for depth, el in walk_xml(root):
         indent = "  " * depth
         attribs = "  ".join(f"{k}={v}" for k, v in el.attrib.items())
         text = (el.text or "").strip()
@@ -111,20 +266,2758 @@ def pretty_xml(xml_path: str):
         if text:
             row += f"  {text}"
         lines.append(row)
+
+    return "\n".join(lines), raw
+
+
+def walk_xml(root):
+    """Yield (depth, element) for everything below *root* in document order, without recursion."""
+    stack = [(0, child) for child in reversed(root)]
+    while stack:
+        depth, el = stack.pop()
+        yield depth, el
+        stack.extend((depth + 1, child) for child in reversed(el))
+
+
+# ── XML tree view ─────────────────────────────────────────────────────────────
+class XMLTreeView(ctk.CTkFrame):
+    """
+    Collapsible view of an XML document. Only the root's children are
+    inserted up front; every other node gets a placeholder row and its real
+    children are inserted the first time it is expanded.
+    """
+
+    _PLACEHOLDER = "…"
+
+    def __init__(self, master, **kw):
+        super().__init__(master, fg_color="transparent", **kw)
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        style = ttk.Style(self)
+        style.configure("XML.Treeview", background="#150D0D", fieldbackground="#150D0D",
+                        foreground=TEXT_BRIGHT, borderwidth=0, rowheight=22,
+                        font=get_font(11, family="Consolas"))
+        style.map("XML.Treeview", background=[("selected", ACCENT)], foreground=[("selected", "#1A0F0A")])
+        style.configure("XML.Treeview.Heading", background=CARD_BG, foreground=TEXT_DIM,
+                        relief="flat", font=get_font(10, "bold"))
+
+        self._tree = ttk.Treeview(self, style="XML.Treeview", columns=("attributes", "text"))
+        self._tree.heading("#0", text="Element", anchor="w")
+        self._tree.heading("attributes", text="Attributes", anchor="w")
+        self._tree.heading("text", text="Text", anchor="w")
+        self._tree.column("#0", width=280, stretch=False)
+        self._tree.column("attributes", width=520)
+        self._tree.column("text", width=200)
+        self._tree.grid(row=0, column=0, sticky="nsew")
+
+        y_scroll = ctk.CTkScrollbar(self, command=self._tree.yview,
+                                    button_color=DIVIDER, button_hover_color=ACCENT)
+        y_scroll.grid(row=0, column=1, sticky="ns")
+        x_scroll = ctk.CTkScrollbar(self, orientation="horizontal", command=self._tree.xview,
+                                    button_color=DIVIDER, button_hover_color=ACCENT)
+        x_scroll.grid(row=1, column=0, sticky="ew")
+        self._tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+
+        self._tree.bind("<<TreeviewOpen>>", self._on_open)
+        # Tree item id -> element whose children haven't been inserted yet
+        self._unexpanded = {}
+
+    def load(self, root):
+        """Show *root* (an Element, or None to clear) with its first level expanded."""
+        self._tree.delete(*self._tree.get_children())
+        self._unexpanded.clear()
+        if root is None:
+            return
+        iid = self._insert("", root)
+        self._expand(iid)
+        self._tree.item(iid, open=True)
+
+    def _insert(self, parent: str, el) -> str:
+        attribs = "  ".join(f"{k}={v}" for k, v in el.attrib.items())
+        text = (el.text or "").strip()
+        iid = self._tree.insert(parent, "end", text=f"<{el.tag}>", values=(attribs, text))
+        if len(el):
+            self._unexpanded[iid] = el
+            self._tree.insert(iid, "end", text=self._PLACEHOLDER)
+        return iid
+
+    def _expand(self, iid: str):
+        el = self._unexpanded.pop(iid, None)
+        if el is None:
+            return
+        self._tree.delete(*self._tree.get_children(iid))
         for child in el:
-            walk(child, depth + 1)
+            self._insert(iid, child)
+
+    def _on_open(self, event):
+        self._expand(self._tree.focus())
+
+
+# ── Override schedule feed ────────────────────────────────────────────────────
+# The feed's element/attribute names vary between feed versions, so fields are
+# recognised by name (case-insensitively) on attributes and leaf child elements.
+_OVERRIDE_FIELDS = (
+    ("profile", ("profile", "profilename", "mediaclip", "name", "filename", "file")),
+    ("days", ("dayofweek", "days", "day", "weekday")),
+    ("from_date", ("indate", "startdate", "fromdate")),
+    ("to_date", ("outdate", "enddate", "todate")),
+    ("start", ("starttime", "start", "from", "begin")),
+    ("end", ("endtime", "finishtime", "end", "to", "until")),
+)
+_OVERRIDE_WINDOW = ("from_date", "to_date", "start", "end")
+_OVERRIDE_ID_KEYS = ("id", "uid", "entityid")
+
+# path -> ((mtime_ns, size), entries)
+_override_parse_cache = {}
+
+
+def _override_entry(el) -> dict | None:
+    """Field dict for one feed element, or None if it carries no time window."""
+    values = {k.lower(): v for k, v in el.attrib.items()}
+    for child in el:
+        if len(child) == 0 and (child.text or "").strip():
+            values.setdefault(child.tag.lower(), child.text.strip())
+    entry = {}
+    used = set()
+    for field, names in _OVERRIDE_FIELDS:
+        for name in names:
+            if name in values and name not in used:
+                entry[field] = values[name]
+                used.add(name)
+                break
+    if not any(field in entry for field in _OVERRIDE_WINDOW):
+        return None
+    ident = next((values[k] for k in _OVERRIDE_ID_KEYS if values.get(k)), None)
+    entry["id"] = ident
+    # Everything else still counts when deciding whether a row changed
+    entry["other"] = tuple(sorted((k, v) for k, v in values.items() if k not in used))
+    return entry
+
+
+def parse_override_schedule(xml_path: str) -> list[dict]:
+    """
+    Override entries of an xmlfeed.musicoverrideschedule feed in document
+    order, each with a stable 'key' for diffing between refreshes. Parsed
+    once per file modification; raises OSError / ET.ParseError.
+    """
+    st = os.stat(xml_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _override_parse_cache.get(xml_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    root = ET.parse(xml_path).getroot()
+    entries = []
+    seen = {}
+    # Outermost elements with a time window are the entries; their children are not searched
+    stack = list(reversed(root))
+    while stack:
+        el = stack.pop()
+        entry = _override_entry(el)
+        if entry is None:
+            stack.extend(reversed(el))
+            continue
+        base = entry["id"] or entry.get("profile") or el.tag
+        seen[base] = seen.get(base, 0) + 1
+        entry["key"] = base if seen[base] == 1 else f"{base}#{seen[base]}"
+        entries.append(entry)
+
+    _override_parse_cache[xml_path] = (stamp, entries)
+    return entries
+
+
+def diff_override_entries(old: list[dict], new: list[dict]) -> tuple[set, set, set]:
+    """Keys (added, changed, removed) going from entries *old* to *new*."""
+    before = {entry["key"]: entry for entry in old}
+    after = {entry["key"]: entry for entry in new}
+    added = after.keys() - before.keys()
+    removed = before.keys() - after.keys()
+    changed = {key for key in after.keys() & before.keys() if after[key] != before[key]}
+    return added, changed, removed
+
+
+# ── cores.xml build diff ──────────────────────────────────────────────────────
+# Children are matched between builds by these attributes; anything else by tag and position
+_DIFF_KEY_ATTRS = {
+    "KvCore": ("APPLICATION", "ID"),
+    "Channel": ("EntityId",),
+    "Program": ("CmdLine",),
+    "Param": ("Name",),
+}
+_XML_HASH_CACHE_MAX = 48
+# (path, mtime_ns, size) -> HashedXMLNode of the whole file
+_xml_hash_cache = OrderedDict()
+_xml_hash_lock = threading.Lock()
+
+
+class HashedXMLNode:
+    """An element with its children keyed for matching and a digest of its whole subtree."""
+
+    __slots__ = ("tag", "attrib", "text", "children", "digest")
+
+    def __init__(self, el):
+        self.tag = el.tag
+        self.attrib = dict(el.attrib)
+        self.text = (el.text or "").strip()
+        self.children = {}  # key -> HashedXMLNode, document order
+        self.digest = b""
+
+
+def _xml_child_keys(el) -> list[str]:
+    """Matching keys for the children of *el*, e.g. KvCore[KL4/145381] or Settings#2."""
+    keys = []
+    counts = {}
+    for child in el:
+        attrs = _DIFF_KEY_ATTRS.get(child.tag, ())
+        if attrs and all(child.get(a) is not None for a in attrs):
+            key = f"{child.tag}[{'/'.join(child.get(a) for a in attrs)}]"
+        else:
+            key = child.tag
+        counts[key] = counts.get(key, 0) + 1
+        keys.append(key if counts[key] == 1 else f"{key}#{counts[key]}")
+    return keys
+
+
+def hash_xml_tree(root) -> HashedXMLNode:
+    """Mirror *root* as HashedXMLNodes, digesting subtrees bottom-up without recursion."""
+    top = HashedXMLNode(root)
+    stack = [(root, top, False)]
+    while stack:
+        el, node, children_done = stack.pop()
+        if children_done:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(repr((node.tag, sorted(node.attrib.items()), node.text)).encode("utf-8"))
+            for key, child in node.children.items():
+                h.update(key.encode("utf-8"))
+                h.update(child.digest)
+            node.digest = h.digest()
+            continue
+        stack.append((el, node, True))
+        for key, child_el in zip(_xml_child_keys(el), el):
+            child = node.children[key] = HashedXMLNode(child_el)
+            stack.append((child_el, child, False))
+    return top
+
+
+def load_hashed_xml(xml_path: str) -> HashedXMLNode:
+    """Hashed tree of an XML file, parsed once per file version; raises OSError / ET.ParseError."""
+    st = os.stat(xml_path)
+    key = (xml_path, st.st_mtime_ns, st.st_size)
+    with _xml_hash_lock:
+        node = _xml_hash_cache.get(key)
+        if node is not None:
+            _xml_hash_cache.move_to_end(key)
+            return node
+    node = hash_xml_tree(ET.parse(xml_path).getroot())
+    with _xml_hash_lock:
+        _xml_hash_cache[key] = node
+        while len(_xml_hash_cache) > _XML_HASH_CACHE_MAX:
+            _xml_hash_cache.popitem(last=False)
+    return node
+
+
+def diff_xml_trees(old: HashedXMLNode, new: HashedXMLNode) -> list[dict]:
+    """
+    Differences between two hashed trees in document order, as dicts with
+    'path' (tuple of child keys), 'kind' ("added", "removed" or "changed"),
+    'node' (the added/removed subtree), 'attrs' [(name, old, new)] and
+    'text' ((old, new) or None). Subtrees with equal digests are skipped
+    without being visited.
+    """
+    changes = []
+    stack = [("compare", (), old, new)]
+    while stack:
+        item = stack.pop()
+        if item[0] == "emit":
+            changes.append(item[1])
+            continue
+        _, path, a, b = item
+        if a.digest == b.digest:
+            continue
+        attrs = [(name, a.attrib.get(name), b.attrib.get(name))
+                 for name in list(a.attrib) + [n for n in b.attrib if n not in a.attrib]
+                 if a.attrib.get(name) != b.attrib.get(name)]
+        text = (a.text, b.text) if a.text != b.text else None
+        if attrs or text:
+            changes.append({'path': path, 'kind': "changed", 'node': b, 'attrs': attrs, 'text': text})
+
+        pending = []
+        for key, child in b.children.items():
+            if key in a.children:
+                pending.append(("compare", path + (key,), a.children[key], child))
+            else:
+                pending.append(("emit", {'path': path + (key,), 'kind': "added", 'node': child,
+                                         'attrs': [], 'text': None}))
+        for key, child in a.children.items():
+            if key not in b.children:
+                pending.append(("emit", {'path': path + (key,), 'kind': "removed", 'node': child,
+                                         'attrs': [], 'text': None}))
+        stack.extend(reversed(pending))
+    return changes
+
+
+# ── Profile snapshot comparison ───────────────────────────────────────────────
+_PROFILE_EXTENSIONS = (".olp", ".djv")
+_PROFILE_INFO_FIELDS = ("NAME", "StartTime", "FinishTime", "DayOfWeek", "INDATE", "OUTDATE", "HIDDEN")
+_PROFILE_HASH_WORKERS = 4
+_PROFILE_FINGERPRINTS_MAX = 4096
+# (path, mtime_ns, size) -> (sha256 hex, fields), least recently used dropped first
+_profile_fingerprints = OrderedDict()
+_profile_fingerprint_lock = threading.Lock()  # filled from the hashing pool's threads
+_profile_hash_pool = None
+
+
+def profile_fingerprint(path: str) -> tuple[str, dict]:
+    """
+    Content hash of a profile plus the fields worth comparing: its INFO
+    scheduling attributes, FREQUENCY-RANGEs and clip count. Cached by
+    (path, mtime, size), so unchanged files are never read twice.
+    """
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    with _profile_fingerprint_lock:
+        cached = _profile_fingerprints.get(key)
+        if cached is not None:
+            _profile_fingerprints.move_to_end(key)
+            return cached
+
+    with open(path, "rb") as f:
+        data = f.read()
+    fields = {}
+    try:
+        root = ET.fromstring(data)
+        info = root.find("INFO")
+        if info is not None:
+            for name in _PROFILE_INFO_FIELDS:
+                fields[name] = info.get(name, "")
+        ranges = root.iterfind("INTER-PROFILE/FREQUENCY-RANGES/FREQUENCY-RANGE")
+        for i, rng in enumerate(ranges, start=1):
+            fields[f"FREQUENCY-RANGE {i}"] = " ".join(f"{k}={v}" for k, v in rng.attrib.items())
+        fields["clips"] = sum(1 for _ in root.iter("PLAY-MEDIA-CLIP"))
+    except ET.ParseError as e:
+        fields["error"] = str(e)
+    result = (hashlib.sha256(data).hexdigest(), fields)
+    with _profile_fingerprint_lock:
+        _profile_fingerprints[key] = result
+        while len(_profile_fingerprints) > _PROFILE_FINGERPRINTS_MAX:
+            _profile_fingerprints.popitem(last=False)
+    return result
+
+
+def list_profile_files(profiles_folder: str) -> dict[str, str]:
+    """{path relative to *profiles_folder*: full path} of the .olp/.djv files under it."""
+    files = {}
+    for root, _, filenames in os.walk(profiles_folder):
+        for filename in filenames:
+            if filename.lower().endswith(_PROFILE_EXTENSIONS):
+                full_path = os.path.join(root, filename)
+                files[os.path.relpath(full_path, profiles_folder)] = full_path
+    return files
+
+
+def compare_profile_sets(old_folder: str, new_folder: str, token: "CancelToken | None" = None) -> list[dict]:
+    """
+    Profiles added, removed or changed going from one Profiles folder to
+    another, sorted by relative path. Changed entries carry 'fields'
+    [(name, old, new)] for the parsed fields that differ; an empty list
+    means only the content (e.g. the clip order) changed. Files are hashed
+    on a small thread pool.
+    """
+    global _profile_hash_pool
+    old_files = list_profile_files(old_folder)
+    new_files = list_profile_files(new_folder)
+    common = sorted(old_files.keys() & new_files.keys())
+
+    if _profile_hash_pool is None:
+        _profile_hash_pool = ThreadPoolExecutor(max_workers=_PROFILE_HASH_WORKERS,
+                                                thread_name_prefix="profile-hash")
+    futures = {}
+    for rel in common:
+        futures[_profile_hash_pool.submit(profile_fingerprint, old_files[rel])] = (rel, 0)
+        futures[_profile_hash_pool.submit(profile_fingerprint, new_files[rel])] = (rel, 1)
+    prints = {rel: [None, None] for rel in common}
+    try:
+        for future in as_completed(futures):
+            if token is not None:
+                token.check()
+            rel, side = futures[future]
+            try:
+                prints[rel][side] = future.result()
+            except OSError as e:
+                prints[rel][side] = (f"error:{e}", {"error": str(e)})
+    except TaskCancelled:
+        for future in futures:
+            future.cancel()
+        raise
+
+    changes = [{'path': rel, 'kind': "added", 'fields': []} for rel in new_files.keys() - old_files.keys()]
+    changes += [{'path': rel, 'kind': "removed", 'fields': []} for rel in old_files.keys() - new_files.keys()]
+    for rel in common:
+        (old_hash, old_fields), (new_hash, new_fields) = prints[rel]
+        if old_hash == new_hash:
+            continue
+        fields = [(name, old_fields.get(name), new_fields.get(name))
+                  for name in dict.fromkeys(list(old_fields) + list(new_fields))
+                  if old_fields.get(name) != new_fields.get(name)]
+        changes.append({'path': rel, 'kind': "changed", 'fields': fields})
+    changes.sort(key=lambda change: change['path'].lower())
+    return changes
+
+
+# ── Weekly schedule resolver ──────────────────────────────────────────────────
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+def _dow_matches(dow: str, day: datetime) -> bool:
+    """True if a profile's DayOfWeek (0 = every day, 1 = Sunday … 7 = Saturday) includes *day*."""
+    if dow in ("", "0"):
+        return True
+    return dow.isdigit() and 1 <= int(dow) <= 7 and (int(dow) + 5) % 7 == day.weekday()
+
+
+def _hhmm_minutes(value: str) -> int | None:
+    """Minutes past midnight of an HHMM (or HH:MM) time, else None."""
+    value = (value or "").replace(":", "")
+    if len(value) != 4 or not value.isdigit():
+        return None
+    hours, minutes = int(value[:2]), int(value[2:])
+    if minutes > 59 or hours > 24 or (hours == 24 and minutes):
+        return None  # 2400 is the only time past 2359
+    return hours * 60 + minutes
+
+
+def _schedule_stamp(value: str, year: int | None = None) -> datetime | None:
+    """datetime of a YYYYMMDDHHmm stamp; a literal YYYY (yearly ranges) is replaced by *year*."""
+    if not value or len(value) < 8:
+        return None
+    if value.startswith("YYYY"):
+        if year is None:
+            return None
+        value = f"{year:04d}{value[4:]}"
+    try:
+        return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]),
+                        int(value[8:10] or 0), int(value[10:12] or 0))
+    except ValueError:
+        return None
+
+
+def _window_minutes(start_min: int, end_min: int) -> tuple[int, int]:
+    """
+    Minutes from midnight a start/finish pair covers. A finish ending in :59
+    (0559, 2359) runs to the end of that minute, and a finish at or before
+    the start runs past midnight.
+    """
+    if end_min % 60 == 59 and end_min != start_min:
+        end_min += 1
+    if end_min <= start_min:
+        end_min += 24 * 60
+    return start_min, end_min
+
+
+def _daily_window(day: datetime, start: str, end: str):
+    """(start, end) datetimes of an HHMM window on *day* (see _window_minutes)."""
+    start_min, end_min = _hhmm_minutes(start), _hhmm_minutes(end)
+    if start_min is None or end_min is None:
+        return None
+    start_min, end_min = _window_minutes(start_min, end_min)
+    return day + timedelta(minutes=start_min), day + timedelta(minutes=end_min)
+
+
+def schedule_entry(file_info: dict, range_index: int | None = None) -> dict:
+    """What the resolver reports for a profile, or for one FREQUENCY-RANGE of an overlay."""
+    schedule = file_info['schedule']
+    frequency = None
+    if range_index is not None:
+        value = schedule['frequency_ranges'][range_index]['frequency']
+        frequency = int(value) if value.lstrip("-").isdigit() else None
+    return {
+        'name': schedule.get('name') or file_info['name'],
+        'file': file_info['name'],
+        'path': file_info['path'],
+        'kind': "overlay" if file_info['name'].lower().endswith(".olp") else "profile",
+        'hidden': schedule.get('hidden') == "YES",
+        'frequency': frequency,
+    }
+
+
+def profile_windows(file_info: dict, day: datetime):
+    """
+    Yield (start, end, range_index) for the windows a profile opens on *day*
+    (a midnight). Normal profiles use their INFO StartTime/FinishTime and
+    DayOfWeek (range_index None); overlays with FREQUENCY-RANGEs use each
+    yearly range's STARTTIME/ENDTIME instead. Windows are clipped to INFO
+    INDATE/OUTDATE.
+    """
+    schedule = file_info['schedule']
+    is_overlay = file_info['name'].lower().endswith(".olp")
+    valid_from = _schedule_stamp(schedule.get('indate', ''))
+    valid_to = _schedule_stamp(schedule.get('outdate', ''))
+
+    windows = []
+    if is_overlay and schedule.get('frequency_ranges'):
+        for i, rng in enumerate(schedule['frequency_ranges']):
+            # Yearly ranges may run over New Year, so try the range starting last year too
+            for year in (day.year - 1, day.year):
+                range_start = _schedule_stamp(rng['indate'], year)
+                range_end = _schedule_stamp(rng['outdate'], year)
+                if range_start is None or range_end is None:
+                    continue
+                if range_end <= range_start:
+                    range_end = _schedule_stamp(rng['outdate'], year + 1) or range_end
+                if range_end.hour == range_end.minute == 0:
+                    range_end += timedelta(days=1)  # OUTDATE day is included; the next range starts the day after
+                if range_start <= day < range_end:
+                    window = _daily_window(day, rng['starttime'], rng['endtime'])
+                    if window is not None:
+                        windows.append((*window, i))
+                    break
+    elif _dow_matches(schedule.get('raw_day', ''), day):
+        window = _daily_window(day, schedule.get('raw_start', ''), schedule.get('raw_end', ''))
+        if window is not None:
+            windows.append((*window, None))
+
+    for start, end, range_index in windows:
+        if valid_from is not None and start < valid_from:
+            start = valid_from
+        if valid_to is not None and end > valid_to:
+            end = valid_to
+        if start < end:
+            yield start, end, range_index
+
+
+class ScheduleIndex:
+    """
+    What a channel's profiles and overlays play over a date range. The play
+    windows' boundaries split the range into segments with a fixed set of
+    active entries, so "what plays at …" is a bisect over the boundaries and
+    a timeline slice is a bisect plus the segments it covers.
+    """
+
+    def __init__(self, files: list[dict], start: datetime, days: int = 7):
+        self.start = start
+        self.end = start + timedelta(days=days)
+        self.intervals = []
+        entries = {}  # (file index, range index) -> entry, so repeats of a window share one
+        # Windows opened the day before can still be running at the start
+        day = start.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+        while day < self.end:
+            for n, file_info in enumerate(files):
+                for win_start, win_end, range_index in profile_windows(file_info, day):
+                    win_start, win_end = max(win_start, self.start), min(win_end, self.end)
+                    if win_start < win_end:
+                        entry = entries.get((n, range_index))
+                        if entry is None:
+                            entry = entries[(n, range_index)] = schedule_entry(file_info, range_index)
+                        self.intervals.append((win_start, win_end, entry))
+            day += timedelta(days=1)
+
+        events = sorted(
+            [(s, 1, id(e), e) for s, _, e in self.intervals] + [(e_, -1, id(e), e) for _, e_, e in self.intervals],
+            key=lambda ev: (ev[0], ev[1])
+        )
+        self._bounds = [self.start]
+        self._active = [()]
+        counts = {}
+        by_id = {}
+        i = 0
+        while i < len(events):
+            when = events[i][0]
+            while i < len(events) and events[i][0] == when:
+                _, delta, key, entry = events[i]
+                counts[key] = counts.get(key, 0) + delta
+                by_id[key] = entry
+                if counts[key] == 0:
+                    del counts[key]
+                i += 1
+            active = tuple(sorted((by_id[k] for k in counts),
+                                  key=lambda e: (e['kind'] != "profile", e['name'].lower())))
+            if when == self._bounds[-1]:
+                self._active[-1] = active
+            elif active != self._active[-1]:
+                self._bounds.append(when)
+                self._active.append(active)
+
+    def active_at(self, when: datetime) -> tuple:
+        """Entries playing at *when* (empty outside the indexed range)."""
+        if not self.start <= when < self.end:
+            return ()
+        return self._active[bisect_right(self._bounds, when) - 1]
+
+    def active_at_weekday(self, weekday: int, minutes: int) -> tuple:
+        """Entries playing on *weekday* (0 = Monday) at *minutes* past midnight in the indexed week."""
+        offset = (weekday - self.start.weekday()) % 7
+        day = self.start.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=offset)
+        return self.active_at(day + timedelta(minutes=minutes))
+
+    def segments(self, start: datetime | None = None, end: datetime | None = None) -> list[tuple]:
+        """[(start, end, entries)] covering start..end, each with an unchanging set of entries."""
+        start = max(start or self.start, self.start)
+        end = min(end or self.end, self.end)
+        if start >= end:
+            return []
+        first = bisect_right(self._bounds, start) - 1
+        last = bisect_left(self._bounds, end)
+        result = []
+        for i in range(first, last):
+            seg_start = max(self._bounds[i], start)
+            seg_end = min(self._bounds[i + 1] if i + 1 < len(self._bounds) else self.end, end)
+            if seg_start < seg_end:
+                result.append((seg_start, seg_end, self._active[i]))
+        return result
+
+
+def week_start(when: datetime | None = None) -> datetime:
+    """Monday 00:00 of the week containing *when* (default: now)."""
+    when = when or datetime.now()
+    return datetime(when.year, when.month, when.day) - timedelta(days=when.weekday())
+
+
+# ── Schedule conflicts and gaps ───────────────────────────────────────────────
+_DAY_MINUTES = 24 * 60
+_WEEK_MINUTES = 7 * _DAY_MINUTES
+_ANALYSIS_DAYS = 366  # date changes further ahead than this are not reported
+
+
+def format_week_minute(minute: int) -> str:
+    """'Tue 14:00' for a position in minutes from Monday 00:00."""
+    day, rest = divmod(minute % _WEEK_MINUTES, _DAY_MINUTES)
+    return f"{_WEEKDAY_NAMES[day][:3]} {rest // 60:02d}:{rest % 60:02d}"
+
+
+def _format_week_span(start: int, end: int) -> str:
+    if end - start <= _DAY_MINUTES and start // _DAY_MINUTES == (end - 1) // _DAY_MINUTES:
+        end_text = format_week_minute(end)[4:] if end % _DAY_MINUTES else "24:00"
+        return f"{format_week_minute(start)}–{end_text}"
+    return f"{format_week_minute(start)} → {format_week_minute(end)}"
+
+
+def _wrap_issue(start: int, end: int, dow: str) -> str | None:
+    """Message for a StartTime/FinishTime pair that runs past midnight, if it looks suspect."""
+    if end > start or end == 0:
+        return None  # a FinishTime of 0000 ends at midnight
+    hhmm = lambda m: f"{m // 60:02d}:{m % 60:02d}"
+    if start == end:
+        return f"Starts and finishes at {hhmm(start)}: plays a full 24 hours, across midnight"
+    if (start - end) % _DAY_MINUTES == 1:
+        return f"Finishes 1 minute before it starts ({hhmm(start)}–{hhmm(end)}): plays round the clock, across midnight"
+    if dow in ("", "0"):
+        return f"Runs past midnight ({hhmm(start)}–{hhmm(end)}) into the next day"
+    if dow.isdigit() and 1 <= int(dow) <= 7:
+        next_day = _WEEKDAY_NAMES[(int(dow) + 6) % 7]
+        return f"Runs past midnight ({hhmm(start)}–{hhmm(end)}) into {next_day}"
+    return None
+
+
+def analyse_profile_schedules(files: list[dict], today: datetime | None = None) -> dict:
+    """
+    Sweep a channel's normal profiles over the week (overlays are meant to
+    overlap, so they are left out), once for each stretch of dates in the
+    coming year in which the same profiles are within INDATE/OUTDATE.
+    Returns:
+      'overlaps' [(file_a, file_b, [(start, end)], first_date)],
+      'gaps'     [(start, end, first_date)],
+      'wraps'    [(file, message)],
+      'by_file'  {path: [message]}  (for flagging file cards),
+    with week positions in minutes from Monday 00:00.
+    """
+    today = today or datetime.now()
+    today = datetime(today.year, today.month, today.day)
+    by_file = {}
+    wraps = []
+    profiles = []  # (file_info, valid_from, valid_to)
+    events = []    # (week minute, 0 = end / 1 = start, profile index, window id, window end)
+    for file_info in files:
+        if file_info['name'].lower().endswith(".olp"):
+            continue
+        schedule = file_info.get('schedule') or {}
+        start = _hhmm_minutes(schedule.get('raw_start', ''))
+        end = _hhmm_minutes(schedule.get('raw_end', ''))
+        if start is None or end is None:
+            continue
+        valid_from = _schedule_stamp(schedule.get('indate', '')) or datetime.min
+        valid_to = _schedule_stamp(schedule.get('outdate', '')) or datetime.max
+        if valid_to <= today:
+            continue  # expired
+        dow = schedule.get('raw_day', '')
+        message = _wrap_issue(start, end, dow)
+        if message:
+            wraps.append((file_info, message))
+            by_file.setdefault(file_info['path'], []).append(message)
+        start, end = _window_minutes(start, end)
+        if dow in ("", "0"):
+            days = range(7)
+        elif dow.isdigit() and 1 <= int(dow) <= 7:
+            days = [(int(dow) + 5) % 7]
+        else:
+            continue
+        n = len(profiles)
+        profiles.append((file_info, valid_from, valid_to))
+        for day in days:
+            win_start, win_end = day * _DAY_MINUTES + start, day * _DAY_MINUTES + end
+            # Sunday night windows carry on into Monday morning
+            pieces = ([(win_start, _WEEK_MINUTES), (0, win_end - _WEEK_MINUTES)]
+                      if win_end > _WEEK_MINUTES else [(win_start, win_end)])
+            for piece_start, piece_end in pieces:
+                window = len(events)
+                events.append((piece_start, 1, n, window, piece_end))
+                events.append((piece_end, 0, n, window, piece_end))
+    # Ends sort before starts at the same minute, so back-to-back profiles do not overlap
+    events.sort(key=lambda ev: (ev[0], ev[1]))
+
+    # Stretches of dates with a constant set of valid profiles
+    horizon = today + timedelta(days=_ANALYSIS_DAYS)
+    points = sorted({today} | {d for _, vf, vt in profiles for d in (vf, vt) if today < d < horizon})
+    overlaps = {}  # (a, b) -> (spans, first_date)
+    gaps = {}      # (start, end) -> first_date
+    swept = set()
+    for epoch_start in points:
+        members = frozenset(n for n, (_, vf, vt) in enumerate(profiles) if vf <= epoch_start < vt)
+        if members in swept:
+            continue
+        swept.add(members)
+
+        active = {}  # window id -> (profile index, window end)
+        epoch_gaps = []
+        gap_start = 0
+        for minute, kind, n, window, window_end in events:
+            if n not in members:
+                continue
+            if kind == 0:
+                active.pop(window, None)
+                if not active:
+                    gap_start = minute
+                continue
+            if not active and minute > gap_start:
+                epoch_gaps.append((gap_start, minute))
+            for other, other_end in active.values():
+                if other != n:
+                    pair = (other, n) if other < n else (n, other)
+                    overlaps.setdefault(pair, (set(), epoch_start))[0].add(
+                        (minute, other_end if other_end < window_end else window_end))
+            active[window] = (n, window_end)
+        if not active and gap_start < _WEEK_MINUTES:
+            epoch_gaps.append((gap_start, _WEEK_MINUTES))
+        # A gap over the Sunday→Monday boundary is one gap
+        if len(epoch_gaps) > 1 and epoch_gaps[0][0] == 0 and epoch_gaps[-1][1] == _WEEK_MINUTES:
+            first_gap = epoch_gaps.pop(0)
+            epoch_gaps[-1] = (epoch_gaps[-1][0], first_gap[1] + _WEEK_MINUTES)
+        for gap in epoch_gaps:
+            gaps.setdefault(gap, epoch_start)
+
+    overlap_list = []
+    for (a, b), (spans, first) in sorted(overlaps.items()):
+        spans = sorted(spans)
+        file_a, file_b = profiles[a][0], profiles[b][0]
+        overlap_list.append((file_a, file_b, spans, first))
+        shown = _format_week_span(*spans[0]) + (f" +{len(spans) - 1} more" if len(spans) > 1 else "")
+        for this, other in ((file_a, file_b), (file_b, file_a)):
+            other_name = other['schedule'].get('name') or other['name']
+            by_file.setdefault(this['path'], []).append(f"Overlaps {other_name} ({shown})")
+    return {
+        'overlaps': overlap_list,
+        'gaps': [(start, end, first) for (start, end), first in sorted(gaps.items())],
+        'wraps': wraps,
+        'by_file': by_file,
+    }
+
+
+# ── Overlay insertion forecast ────────────────────────────────────────────────
+TRACKS_PER_HOUR = 15  # host profile tracks an hour, at about four minutes a track
+
+
+class OverlayForecast:
+    """
+    Expected overlay insertions per hour over a ScheduleIndex's date range,
+    for all of a channel's overlays at once. An overlay FREQUENCY-RANGE with
+    FREQUENCY n plays 1 in every n + 1 tracks while it is open and a normal
+    profile is playing; overlays without FREQUENCY-RANGEs have no known rate.
+    Each segment adds its rate to a per-minute difference array, a single
+    accumulate() turns that into per-minute rates, and the hours are slice
+    sums of those.
+    """
+
+    def __init__(self, index: "ScheduleIndex", tracks_per_hour: float = TRACKS_PER_HOUR):
+        self.start = index.start
+        self.days = max(0, round((index.end - index.start).total_seconds() / 86400))
+        minutes = self.days * _DAY_MINUTES
+        per_track = tracks_per_hour / 60
+        diff = array('d', bytes(8 * (minutes + 1)))
+        self.by_overlay = {}
+        for seg_start, seg_end, active in index.segments():
+            if not any(entry['kind'] == "profile" for entry in active):
+                continue  # nothing to interrupt
+            shares = [(entry, 1 / (entry['frequency'] + 1)) for entry in active
+                      if entry['kind'] == "overlay" and entry['frequency'] is not None and entry['frequency'] >= 0]
+            if not shares:
+                continue
+            total = sum(share for _, share in shares)
+            scale = 1 / total if total > 1 else 1  # overlays can at most take every track
+            first = int((seg_start - self.start).total_seconds() // 60)
+            last = min(int((seg_end - self.start).total_seconds() // 60), minutes)
+            if first >= last:
+                continue
+            diff[first] += per_track * total * scale
+            diff[last] -= per_track * total * scale
+            for entry, share in shares:
+                name = entry['name']
+                self.by_overlay[name] = self.by_overlay.get(name, 0.0) + per_track * share * scale * (last - first)
+        rates = array('d', accumulate(diff))
+        self.per_hour = array('d', (sum(rates[h * 60:h * 60 + 60]) for h in range(self.days * 24)))
+
+    @property
+    def total(self) -> float:
+        return sum(self.per_hour)
+
+    def per_day(self) -> list[float]:
+        """Expected insertions on each day of the range."""
+        return [sum(self.per_hour[d * 24:d * 24 + 24]) for d in range(self.days)]
+
+    def hour_of_day(self) -> list[float]:
+        """Average expected insertions in each hour of the day (00–23) over the range."""
+        if not self.days:
+            return [0.0] * 24
+        return [sum(self.per_hour[h::24]) / self.days for h in range(24)]
+
+
+# ── Profile playout simulation ────────────────────────────────────────────────
+def load_profile_playlist(path: str) -> dict:
+    """RANDOM-ORDER, ARTIST-CLASH-DISTANCE and the ordered PLAY-MEDIA-CLIP UIDs of a .djv profile."""
+    root = ET.parse(path).getroot()
+    distance = root.get("ARTIST-CLASH-DISTANCE", "0")
+    return {
+        'random': root.get("RANDOM-ORDER", "N").upper() in ("Y", "YES"),
+        'clash_distance': int(distance) if distance.isdigit() else 0,
+        'uids': [clip.get("UID", "") for clip in root.iter("PLAY-MEDIA-CLIP")],
+    }
+
+
+class PlayoutSimulation:
+    """
+    A plausible play sequence for a profile. In order profiles cycle through
+    their clips; RANDOM-ORDER ones play shuffled passes, each pick being the
+    next clip in the pass whose artist has not played within the last
+    ARTIST-CLASH-DISTANCE tracks, drawing on the following pass when the
+    rest of this one cannot (if still none qualifies, the one whose artist
+    played longest ago plays anyway and counts as a clash). Clips are
+    array-backed ids into .uids and the RNG is seeded, so a run is repeatable
+    and a 10k-track day takes milliseconds. *artists* maps clip UID to
+    artist; the profile itself does not name them, so by default every clip
+    counts as its own artist.
+    """
+
+    def __init__(self, playlist: dict, tracks: int, seed: int = 0, artists: dict | None = None):
+        self.seed = seed
+        self.random = playlist['random']
+        self.clash_distance = self.effective_distance = playlist['clash_distance']
+        self.uids = []
+        ids = {}
+        clips = array('I')
+        for uid in playlist['uids']:
+            if uid not in ids:
+                ids[uid] = len(self.uids)
+                self.uids.append(uid)
+            clips.append(ids[uid])
+        artist_ids = {}
+        artist_of = array('I', (artist_ids.setdefault((artists or {}).get(uid, uid), len(artist_ids))
+                                for uid in self.uids))
+
+        self.sequence = array('I')
+        self.clashes = 0
+        if clips:
+            if self.random:
+                self._shuffled(clips, artist_of, len(artist_ids), tracks)
+            else:
+                self.sequence = (clips * (tracks // len(clips) + 1))[:tracks]
+
+        # Play counts, and how many tracks apart each repeat of a clip came
+        self.counts = array('I', bytes(4 * len(self.uids)))
+        self.gaps = array('I')
+        last = array('l', [-1]) * len(self.uids)
+        for pos, clip in enumerate(self.sequence):
+            self.counts[clip] += 1
+            if last[clip] >= 0:
+                self.gaps.append(pos - last[clip])
+            last[clip] = pos
+        self.min_gap = min(self.gaps) if self.gaps else None
+        self.mean_gap = sum(self.gaps) / len(self.gaps) if self.gaps else None
+
+    def _shuffled(self, clips: array, artist_of: array, artist_count: int, tracks: int):
+        rng = random.Random(self.seed)
+        # An artist can at best come back once every other artist has played
+        distance = self.effective_distance = min(self.clash_distance, artist_count - 1)
+        last_played = array('l', [-(distance + 1)]) * artist_count
+        sequence = self.sequence
+        deck = array('I')
+        head = 0
+        for pos in range(tracks):
+            if head >= len(deck):
+                deck = array('I', clips)
+                rng.shuffle(deck)
+                head = 0
+            pick = head
+            if distance:
+                oldest = head
+                while True:
+                    while pick < len(deck) and pos - last_played[artist_of[deck[pick]]] <= distance:
+                        if last_played[artist_of[deck[pick]]] < last_played[artist_of[deck[oldest]]]:
+                            oldest = pick
+                        pick += 1
+                    if pick < len(deck) or len(deck) - head > len(clips):
+                        break
+                    # Nothing left in this pass fits, so shuffle in the next one behind it
+                    deck, pick, oldest = deck[head:], pick - head, oldest - head
+                    head = 0
+                    upcoming = array('I', clips)
+                    rng.shuffle(upcoming)
+                    deck.extend(upcoming)
+                if pick == len(deck):
+                    pick = oldest
+                    self.clashes += 1
+                deck[head], deck[pick] = deck[pick], deck[head]
+            clip = deck[head]
+            head += 1
+            sequence.append(clip)
+            last_played[artist_of[clip]] = pos
+
+    @property
+    def plays(self) -> int:
+        return len(self.sequence)
+
+    @property
+    def unique(self) -> int:
+        return sum(1 for count in self.counts if count)
+
+    @property
+    def repeat_rate(self) -> float:
+        """Share of plays that were a clip already played earlier in the run."""
+        return (self.plays - self.unique) / self.plays if self.plays else 0.0
+
+    def repeats_within(self, tracks: int) -> float:
+        """Share of plays that repeat a clip heard within the previous *tracks* tracks."""
+        return sum(1 for gap in self.gaps if gap <= tracks) / self.plays if self.plays else 0.0
+
+    def most_played(self, limit: int = 5) -> list[tuple[str, int]]:
+        order = sorted(range(len(self.counts)), key=lambda clip: -self.counts[clip])
+        return [(self.uids[clip], self.counts[clip]) for clip in order[:limit] if self.counts[clip]]
+
+
+# ── Log index (line offsets + severity) ───────────────────────────────────────
+# A line is an error if it contains any error keyword, otherwise a warning if it
+# contains a warning keyword. Each pattern starts with a literal so the regex
+# engine can use its fast substring search over the lower-cased file bytes.
+_LOG_ERROR_PATTERNS = [re.compile(p) for p in (
+    rb"error\b", rb"exception\b", rb"fatal\b", rb"critical\b", rb"fail(?:ed|ure)?\b",
+)]
+_LOG_WARNING_PATTERNS = [re.compile(rb"warn(?:ing)?\b")]
+_LOG_INDEX_CACHE_MAX = 32
+
+
+class LogIndex:
+    """Line offsets and error/warning line numbers for one log file."""
+
+    def __init__(self, data: bytes, path: str = "", size: int = 0, mtime: float = 0.0):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.length = len(data)  # uncompressed length (differs from size for archives)
+
+        # Start offset of every line: split + accumulate keeps the whole pass in C
+        parts = data.split(b"\n")
+        last_empty = not parts[-1]
+        self.line_offsets = array("Q", accumulate(map(add, map(len, parts), repeat(1)), initial=0))
+        self.line_offsets.pop()
+        del parts
+        self.line_count = len(self.line_offsets) - (1 if last_empty else 0)
+
+        # Line numbers are 1-based to match tk Text indices
+        lowered = data.lower()
+        errors = self._match_lines(lowered, _LOG_ERROR_PATTERNS)
+        warnings = self._match_lines(lowered, _LOG_WARNING_PATTERNS) - errors
+        del lowered
+        self.error_lines = array("L", sorted(errors))
+        self.warning_lines = array("L", sorted(warnings))
+
+    def _match_lines(self, lowered: bytes, patterns) -> set[int]:
+        lines = set()
+        offsets = self.line_offsets
+        for pattern in patterns:
+            for m in pattern.finditer(lowered):
+                start = m.start()
+                # Require a word boundary before the keyword as well
+                if start and lowered[start - 1:start].isalnum():
+                    continue
+                lines.add(bisect_right(offsets, start))
+        return lines
+
+    def density(self, buckets: int) -> list[tuple[int, int]]:
+        """Return (errors, warnings) counts for *buckets* equal slices of the file."""
+        counts = [[0, 0] for _ in range(max(buckets, 1))]
+        if self.line_count:
+            for kind, lines in enumerate((self.error_lines, self.warning_lines)):
+                for line in lines:
+                    counts[min((line - 1) * buckets // self.line_count, buckets - 1)][kind] += 1
+        return [tuple(c) for c in counts]
+
+
+_log_index_cache: "OrderedDict[tuple, LogIndex]" = OrderedDict()
+
+
+def _log_cache_key(path: str):
+    """Return (path, size, mtime) identifying the current content of *path*."""
+    container, member = split_archive_path(path)
+    st = os.stat(container)
+    key_path = os.path.abspath(container)
+    if member is not None:
+        key_path += _ARCHIVE_MEMBER_SEP + member
+    return (key_path, st.st_size, st.st_mtime)
+
+
+def get_log_index(path: str, data: bytes | None = None) -> LogIndex:
+    """Return the cached LogIndex for *path*, building it from *data* if needed."""
+    key = _log_cache_key(path)
+    index = _log_index_cache.get(key)
+    if index is not None:
+        _log_index_cache.move_to_end(key)
+        return index
+    if data is None:
+        data = read_log_bytes(path)
+    index = LogIndex(data, *key)
+    _log_index_cache[key] = index
+    while len(_log_index_cache) > _LOG_INDEX_CACHE_MAX:
+        _log_index_cache.popitem(last=False)
+    return index
+
+
+# ── Compressed / archived logs ────────────────────────────────────────────────
+# Archived logs are addressed as "<archive>.zip::<member>" or "<file>.log.gz".
+# ":" cannot appear in a Windows file name, so the separator is unambiguous.
+_ARCHIVE_MEMBER_SEP = "::"
+_CHECKPOINT_SPACING = 4 * 1024 * 1024  # uncompressed bytes between checkpoints
+_INFLATE_CHUNK = 256 * 1024
+_ARCHIVE_READERS_MAX = 16
+
+
+def split_archive_path(path: str) -> tuple[str, str | None]:
+    """Return (file on disk, zip member or None) for a log path."""
+    if _ARCHIVE_MEMBER_SEP in path:
+        container, member = path.split(_ARCHIVE_MEMBER_SEP, 1)
+        return container, member
+    return path, None
+
+
+def is_archived_log(path: str) -> bool:
+    container, member = split_archive_path(path)
+    return member is not None or container.lower().endswith(".gz")
+
+
+class ArchivedLogReader:
+    """
+    Streams a .gz log or a .zip member straight from the archive. While
+    inflating it records a copy of the decompressor every _CHECKPOINT_SPACING
+    output bytes, so a later read_range() restarts from the nearest
+    checkpoint instead of the start of the archive and nothing is extracted
+    to disk.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.container, member = split_archive_path(path)
+        self._stored = False
+        if member is None:
+            self._data_start = 0
+            self._data_len = os.path.getsize(self.container)
+            self._wbits = 16 + zlib.MAX_WBITS  # gzip header + deflate
+        else:
+            self._locate_zip_member(member)
+        # (uncompressed offset, compressed offset, decompressor copy or None)
+        self._checkpoints = [(0, 0, None)]
+
+    def _locate_zip_member(self, member: str):
+        with zipfile.ZipFile(self.container) as zf:
+            info = zf.getinfo(member)
+        if info.flag_bits & 0x1:
+            raise OSError(f"Encrypted zip member not supported: {member}")
+        if info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise OSError(f"Unsupported zip compression for {member}")
+        with open(self.container, "rb") as f:
+            f.seek(info.header_offset)
+            header = f.read(30)
+        if header[:4] != b"PK\x03\x04":
+            raise OSError(f"Bad zip local header for {member}")
+        name_len, extra_len = struct.unpack("<HH", header[26:30])
+        self._data_start = info.header_offset + 30 + name_len + extra_len
+        self._data_len = info.compress_size
+        self._stored = info.compress_type == zipfile.ZIP_STORED
+        self._wbits = -zlib.MAX_WBITS  # raw deflate
+
+    def read_all(self) -> bytes:
+        return self.read_range(0, None)
+
+    def read_range(self, start: int, end: int | None) -> bytes:
+        """Return uncompressed bytes [start, end); *end* None reads to the end."""
+        if self._stored:
+            length = self._data_len - start if end is None else min(end, self._data_len) - start
+            with open(self.container, "rb") as f:
+                f.seek(self._data_start + start)
+                return f.read(max(length, 0))
+        try:
+            return self._inflate(start, end)
+        except zlib.error as e:
+            raise OSError(f"Corrupt archive {self.path}: {e}") from e
+
+    def _inflate(self, start: int, end: int | None) -> bytes:
+        pos = bisect_right([cp[0] for cp in self._checkpoints], start) - 1
+        u_off, c_off, saved = self._checkpoints[pos]
+        dobj = saved.copy() if saved is not None else zlib.decompressobj(self._wbits)
+        out = []
+        with open(self.container, "rb") as f:
+            f.seek(self._data_start + c_off)
+            while c_off < self._data_len and (end is None or u_off < end):
+                chunk = f.read(min(_INFLATE_CHUNK, self._data_len - c_off))
+                if not chunk:
+                    break
+                c_off += len(chunk)
+                data = dobj.decompress(chunk)
+                # A .gz file may hold several gzip members back to back
+                while dobj.eof and dobj.unused_data:
+                    rest = dobj.unused_data
+                    dobj = zlib.decompressobj(self._wbits)
+                    data += dobj.decompress(rest)
+                if data:
+                    lo = max(start - u_off, 0)
+                    hi = len(data) if end is None else min(end - u_off, len(data))
+                    if lo < hi:
+                        out.append(data[lo:hi])
+                    u_off += len(data)
+                # The whole chunk has been consumed, so (u_off, c_off) is a resumable state
+                last_u, last_c, _ = self._checkpoints[-1]
+                if c_off > last_c and u_off - last_u >= _CHECKPOINT_SPACING:
+                    self._checkpoints.append((u_off, c_off, dobj.copy()))
+        return b"".join(out)
+
+
+_archive_readers: "OrderedDict[tuple, ArchivedLogReader]" = OrderedDict()
+
+
+def archived_log_reader(path: str) -> ArchivedLogReader:
+    """Return the cached reader (and its checkpoints) for the current archive content."""
+    key = _log_cache_key(path)
+    reader = _archive_readers.get(key)
+    if reader is None:
+        reader = _archive_readers[key] = ArchivedLogReader(path)
+        while len(_archive_readers) > _ARCHIVE_READERS_MAX:
+            _archive_readers.popitem(last=False)
+    _archive_readers.move_to_end(key)
+    return reader
+
+
+def read_log_bytes(path: str) -> bytes:
+    """Return the full (decompressed) content of a plain or archived log."""
+    if is_archived_log(path):
+        return archived_log_reader(path).read_all()
+    with open(path, "rb") as f:
+        return f.read()
+
+
+# ── Shared log buffer cache ───────────────────────────────────────────────────
+class LogBuffer:
+    """Decoded text and index of one log file, shared by every viewer of it."""
+
+    def __init__(self, key: tuple, text: str, index: LogIndex, nbytes: int):
+        self.key = key
+        self.path = key[0]
+        self.text = text
+        self.index = index
+        self.refs = 0
+        self.nbytes = nbytes  # size of the decompressed log, not its character count
+
+
+class LogBufferCache:
+    """
+    Process-wide, reference-counted cache of log buffers keyed by
+    (path, size, mtime). Viewers acquire a buffer when they open and release
+    it when they close; once the last viewer releases it the buffer becomes
+    idle and is evicted least-recently-used first whenever the total size
+    exceeds *budget_bytes*. Buffers still held by a viewer are never evicted.
+    """
+
+    def __init__(self, budget_bytes: int = 256 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self._buffers: "OrderedDict[tuple, LogBuffer]" = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, path: str) -> LogBuffer:
+        """Return the shared buffer for the current content of *path* (may raise OSError)."""
+        key = _log_cache_key(path)
+        with self._lock:
+            buffer = self._buffers.get(key)
+            if buffer is not None:
+                buffer.refs += 1
+                self._buffers.move_to_end(key)
+                return buffer
+
+        data = read_log_bytes(path)
+        index = get_log_index(path, data)
+        text = data.decode("utf-8", errors="ignore").replace("\r\n", "\n")
+        nbytes = len(data)
+        del data
+
+        with self._lock:
+            # Another caller may have loaded the same key meanwhile
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                # Older idle versions of the same file can never be hit again
+                for old_key in [k for k, b in self._buffers.items()
+                                if k[0] == key[0] and b.refs == 0]:
+                    self._drop(old_key)
+                buffer = LogBuffer(key, text, index, nbytes)
+                self._buffers[key] = buffer
+                self._total += buffer.nbytes
+            buffer.refs += 1
+            self._buffers.move_to_end(key)
+            self._evict()
+            return buffer
+
+    def release(self, buffer: LogBuffer):
+        """Drop one reference to *buffer*; idle buffers stay cached within budget."""
+        with self._lock:
+            buffer.refs = max(buffer.refs - 1, 0)
+            if buffer.refs == 0 and self._is_stale(buffer):
+                self._drop(buffer.key)
+            self._evict()
+
+    def _is_stale(self, buffer: LogBuffer) -> bool:
+        try:
+            return _log_cache_key(buffer.path) != buffer.key
+        except OSError:
+            return True
+
+    def _drop(self, key: tuple):
+        buffer = self._buffers.pop(key, None)
+        if buffer is not None:
+            self._total -= buffer.nbytes
+
+    def _evict(self):
+        if self._total <= self.budget_bytes:
+            return
+        for key in [k for k, b in self._buffers.items() if b.refs == 0]:
+            self._drop(key)
+            if self._total <= self.budget_bytes:
+                break
+
+
+LOG_BUFFERS = LogBufferCache()
+
+
+# ── Multi-day log stream ──────────────────────────────────────────────────────
+def read_log_range(path: str, start: int, end: int) -> bytes:
+    """Return bytes [start, end) of a log file without reading the rest of it."""
+    if is_archived_log(path):
+        return archived_log_reader(path).read_range(start, end)
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(max(end - start, 0))
+
+
+def consecutive_log_days(files, date_str: str) -> list[tuple[str, str]]:
+    """
+    From *files* [(filename, YYYYMMDD, full_path)], return [(YYYYMMDD, full_path)]
+    for the run of consecutive calendar days that contains *date_str*.
+    """
+    by_date = {ds: fp for _, ds, fp in files}
+    if date_str not in by_date:
+        return []
+
+    def shift(ds, days):
+        d = datetime.strptime(ds, "%Y%m%d") + timedelta(days=days)
+        return d.strftime("%Y%m%d")
+
+    first = date_str
+    while shift(first, -1) in by_date:
+        first = shift(first, -1)
+    run = []
+    day = first
+    while day in by_date:
+        run.append((day, by_date[day]))
+        day = shift(day, 1)
+    return run
+
+
+class LogStream:
+    """
+    Consecutive daily log files of one kind and channel read as one virtual
+    document. Days are indexed only when first reached and text is read a
+    page (PAGE_LINES lines) at a time, so the files are never concatenated.
+    """
+
+    PAGE_LINES = 5000
+
+    def __init__(self, key: str, segments: list[tuple[str, str]]):
+        self.key = key
+        self.segments = segments  # [(YYYYMMDD, path)] in date order
+
+    def index(self, seg: int) -> LogIndex:
+        return get_log_index(self.segments[seg][1])
+
+    def page_count(self, seg: int) -> int:
+        return max(1, -(-self.index(seg).line_count // self.PAGE_LINES))
+
+    @classmethod
+    def page_of(cls, line: int) -> int:
+        """Page holding 1-based day line *line*."""
+        return max(line - 1, 0) // cls.PAGE_LINES
+
+    def read_page(self, seg: int, page: int) -> tuple[str, int]:
+        """Return (text without trailing newline, first day line) of one page."""
+        index = self.index(seg)
+        first = page * self.PAGE_LINES
+        last = min(first + self.PAGE_LINES, index.line_count)
+        if first >= last:
+            return "", first + 1
+        offsets = index.line_offsets
+        end = offsets[last] if last < len(offsets) else index.length
+        data = read_log_range(self.segments[seg][1], offsets[first], end)
+        text = data.decode("utf-8", errors="ignore").replace("\r\n", "\n")
+        return text[:-1] if text.endswith("\n") else text, first + 1
+
+    def separator(self, seg: int) -> str:
+        date_str, path = self.segments[seg]
+        day = datetime.strptime(date_str, "%Y%m%d")
+        return f"──────── {day.strftime('%a %d/%m/%Y')} · {os.path.basename(path)} ────────"
+
+
+# ── Log minimap (error/warning density strip) ─────────────────────────────────
+class LogMinimap(tk.Canvas):
+    """Thin strip showing where error/warning lines fall; click to jump there."""
+
+    ERROR_COLOR = "#EF5350"
+    WARNING_COLOR = "#FFB74D"
+
+    def __init__(self, master, on_jump=None, **kw):
+        super().__init__(master, width=10, bg="#1A1A1A", highlightthickness=0,
+                         bd=0, cursor="hand2", **kw)
+        self._on_jump = on_jump or (lambda line: None)
+        self._index = None
+        self._drawn_height = 0
+        self.bind("<Configure>", lambda e: self._redraw())
+        self.bind("<Button-1>", self._on_click)
+
+    def set_index(self, index: LogIndex | None):
+        self._index = index
+        self._drawn_height = 0
+        self._redraw()
+
+    def _redraw(self):
+        height = self.winfo_height()
+        if height <= 1 or height == self._drawn_height:
+            return
+        self._drawn_height = height
+        self.delete("all")
+        if self._index is None:
+            return
+        width = self.winfo_width()
+        for y, (errors, warnings) in enumerate(self._index.density(height)):
+            if errors:
+                self.create_line(0, y, width, y, fill=self.ERROR_COLOR)
+            elif warnings:
+                self.create_line(0, y, width, y, fill=self.WARNING_COLOR)
+
+    def _on_click(self, event):
+        index = self._index
+        height = self.winfo_height()
+        if index is None or not index.line_count or height <= 1:
+            return
+        # Snap to the first flagged line inside the clicked pixel row, if any
+        first = max(event.y, 0) * index.line_count // height + 1
+        last = (max(event.y, 0) + 1) * index.line_count // height
+        target = first
+        for lines in (index.error_lines, index.warning_lines):
+            pos = bisect_left(lines, first)
+            if pos < len(lines) and lines[pos] <= last:
+                target = lines[pos]
+                break
+        self._on_jump(min(target, index.line_count))
+
+
+# ── Log workspace (one window, one tab per log) ───────────────────────────────
+# KL4 format: "dd/mm/yyyy hh:mm:ss.mmm" (e.g., "18/02/2026 23:50:27.769")
+_KL4_TIME_RE = re.compile(r"(\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}\.\d{3})")
+# DVJ format: '"dd/mm/yyyy hh:mm:ss"' (e.g., '"18/02/2026 06:21:07"')
+_DVJ_TIME_RE = re.compile(r'"(\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2})"')
+
+
+class LogTab:
+    """What the workspace remembers about one log; inactive tabs hold no text."""
+
+    def __init__(self, path: str, file_name: str, title: str, log_type: str,
+                 stream: "LogStream | None" = None, stream_start: int = 0):
+        self.path = path
+        self.file_name = file_name
+        self.title = title
+        self.log_type = log_type
+        self.stream = stream
+        self.key = stream.key if stream is not None else path
+        # Kept while inactive
+        self.yview = 0.0
+        self.stream_pos = (stream_start, 1)  # (segment, day line) at top of view
+        self.entry_text = ""
+        self.query = ""
+        self.match_index = -1
+        # Only set while the tab is shown
+        self.buffer = None
+        self.button = None
+
+
+class LogWorkspace(ctk.CTkToplevel):
+    """
+    Single log viewer window with one tab per opened log. Only the active tab
+    has its text in the Text widget; switching tabs stashes the scroll
+    position and search state, releases the buffer back to LOG_BUFFERS and
+    rehydrates the newly selected tab from the cache.
+
+    Stream tabs (LogStream) keep at most STREAM_MAX_PAGES pages in the Text
+    widget, paging in neighbours as the view nears either edge and dropping
+    pages from the far end; search only covers the pages currently loaded.
+    """
+
+    STREAM_MAX_PAGES = 3
+
+    _instance = None
+
+    @classmethod
+    def open_log(cls, master, file_path: str, file_name: str, log_type: str, title: str,
+                 stream: "LogStream | None" = None, stream_start: int = 0):
+        """Show *file_path* (or *stream*) in the workspace, creating the window if needed."""
+        workspace = cls._instance
+        if workspace is None or not workspace.winfo_exists():
+            workspace = cls._instance = cls(master)
+            SCHEDULER.once("log-workspace-focus", 200, workspace._bring_to_front)
+        else:
+            workspace.deiconify()
+            workspace.lift()
+            workspace.focus_force()
+        workspace.add_tab(file_path, file_name, log_type, title, stream, stream_start)
+        return workspace
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("Log Workspace")
+        self.geometry("1000x750")
+        self.resizable(True, True)
+        self.configure(fg_color="#1A0F0A")
+
+        # Center the window
+        self.update_idletasks()
+        x = (self.winfo_screenwidth() - 1000) // 2
+        y = (self.winfo_screenheight() - 750) // 2
+        self.geometry(f"1000x750+{x}+{y}")
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(3, weight=1)
+
+        self._tabs: list[LogTab] = []
+        self._active: LogTab | None = None
+        self._matches = []
+        self._total_lines = 1
+        self._pages = []  # loaded stream pages: [segment, page, text lines, has separator]
+        self._minimap_seg = None
+        self._extend_pending = False
+        self._is_scrolling = False
+
+        self._build()
+        self.bind("<Destroy>", self._on_destroy, add=True)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        RENDER_MODE.apply(self)
+
+    # ── Layout ─────────────────────────────────────────────────────────────
+    def _build(self):
+        # Tab strip
+        self._tab_bar = ctk.CTkScrollableFrame(
+            self, orientation="horizontal", height=34, fg_color="transparent",
+            scrollbar_button_color=DIVIDER, scrollbar_button_hover_color=ACCENT,
+        )
+        self._tab_bar.grid(row=0, column=0, sticky="ew", padx=12, pady=(12, 4))
+
+        # Header with file info
+        header_frame = ctk.CTkFrame(self, fg_color=CARD_BG, corner_radius=CORNER)
+        header_frame.grid(row=1, column=0, sticky="ew", padx=12, pady=(0, 8))
+        header_frame.columnconfigure(0, weight=1)
+
+        self._file_lbl = ctk.CTkLabel(
+            header_frame, text="",
+            font=get_font(14, "bold"),
+            text_color=ACCENT, anchor="w"
+        )
+        self._file_lbl.grid(row=0, column=0, sticky="w", padx=12, pady=8)
+
+        # Search frame
+        search_frame = ctk.CTkFrame(self, fg_color="transparent")
+        search_frame.grid(row=2, column=0, sticky="ew", padx=12, pady=(0, 8))
+        search_frame.columnconfigure(0, weight=0)  # A- button
+        search_frame.columnconfigure(1, weight=0)  # A+ button
+        search_frame.columnconfigure(2, weight=1)  # Search field
+        search_frame.columnconfigure(3, weight=0)  # Search button
+
+        ctk.CTkButton(
+            search_frame, text="A-",
+            font=get_font(12, "bold"),
+            fg_color=DIVIDER, hover_color=ACCENT, text_color=TEXT_BRIGHT,
+            width=35, height=32,
+            command=lambda: self._change_text_size(-1)
+        ).grid(row=0, column=0, padx=(0, 4))
+
+        ctk.CTkButton(
+            search_frame, text="A+",
+            font=get_font(12, "bold"),
+            fg_color=DIVIDER, hover_color=ACCENT, text_color=TEXT_BRIGHT,
+            width=35, height=32,
+            command=lambda: self._change_text_size(1)
+        ).grid(row=0, column=1, padx=(0, 8))
+
+        self._search_entry = ctk.CTkEntry(
+            search_frame,
+            placeholder_text="Search in log...",
+            font=get_font(12),
+            fg_color="#150D0D",
+            text_color=TEXT_BRIGHT,
+            border_color=DIVIDER,
+            border_width=1,
+            height=32
+        )
+        self._search_entry.grid(row=0, column=2, sticky="ew", padx=(0, 8))
+        self._search_entry.bind("<Return>", lambda e: self._search_text())
+
+        ctk.CTkButton(
+            search_frame, text="🔍 Search",
+            font=get_font(11),
+            fg_color=DIVIDER, hover_color=ACCENT, text_color=TEXT_BRIGHT,
+            width=80, height=32,
+            command=self._search_text
+        ).grid(row=0, column=3, sticky="e")
+
+        # Content textbox with line numbers and minimap
+        content_frame = ctk.CTkFrame(self, fg_color=CARD_BG, corner_radius=CORNER)
+        content_frame.grid(row=3, column=0, sticky="nsew", padx=12, pady=(0, 12))
+        content_frame.columnconfigure(0, weight=0)  # Line numbers
+        content_frame.columnconfigure(1, weight=1)  # Content
+        content_frame.columnconfigure(2, weight=0)  # Error/warning minimap
+        content_frame.rowconfigure(0, weight=1)
+
+        # One font object shared by content and line numbers; A-/A+ resize it
+        self._text_font = ctk.CTkFont(family="Consolas", size=10)
+
+        # Line numbers textbox (scrollbar hidden)
+        self._line_numbers = ctk.CTkTextbox(
+            content_frame,
+            font=self._text_font,
+            fg_color="#1A1A1A",
+            text_color=TEXT_DIM,
+            border_color=DIVIDER,
+            border_width=1,
+            corner_radius=0,
+            wrap="none",
+            width=50,
+            state="disabled",
+            scrollbar_button_color="#1A1A1A",
+            scrollbar_button_hover_color="#1A1A1A"
+        )
+        self._line_numbers.grid(row=0, column=0, sticky="ns", padx=(8, 0), pady=8)
+
+        self._textbox = ctk.CTkTextbox(
+            content_frame,
+            font=self._text_font,
+            fg_color="#1A1A1A",
+            text_color=TEXT_BRIGHT,
+            border_color=DIVIDER,
+            border_width=1,
+            corner_radius=0,
+            wrap="none",
+            state="disabled"
+        )
+        self._textbox.grid(row=0, column=1, sticky="nsew", padx=(0, 2), pady=8)
+        self._textbox.tag_config("highlight", background="#5A4A3A", foreground=TEXT_BRIGHT)
+        self._textbox.tag_config("current_highlight", background="#C1784A", foreground="#1A0F0A")
+        self._textbox.tag_config("minimap_target", background="#3A2A2A")
+        self._textbox.tag_config("day_separator", background="#2A1E1A", foreground=ACCENT)
+
+        self._minimap = LogMinimap(content_frame, on_jump=self._jump_to_line)
+        self._minimap.grid(row=0, column=2, sticky="ns", padx=(0, 8), pady=8)
+
+        self._wire_scrolling()
+
+        # Button frame with visible time at center-bottom
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.grid(row=4, column=0, sticky="ew", padx=12, pady=(0, 12))
+        btn_frame.columnconfigure(0, weight=1)  # Left side (clear btn)
+        btn_frame.columnconfigure(1, weight=0)  # Center (time)
+        btn_frame.columnconfigure(2, weight=1)  # Right side (close btn)
+
+        ctk.CTkButton(
+            btn_frame, text="Clear Search",
+            font=get_font(11),
+            fg_color=DIVIDER, hover_color=ACCENT, text_color=TEXT_BRIGHT,
+            width=100, height=32,
+            command=self._clear_search
+        ).grid(row=0, column=0, sticky="w")
+
+        # Visible date/time display at center (updates on scroll)
+        self._visible_time_lbl = ctk.CTkLabel(
+            btn_frame, text="",
+            font=get_font(20, "bold"),
+            text_color="#E8A87C",  # Distinct warm color
+            anchor="center"
+        )
+        self._visible_time_lbl.grid(row=0, column=1, sticky="ew", padx=12)
+
+        ctk.CTkButton(
+            btn_frame, text="Close Tab",
+            font=get_font(11),
+            fg_color=DIVIDER, hover_color=ACCENT, text_color=TEXT_BRIGHT,
+            width=100, height=32,
+            command=lambda: self._active and self._close_tab(self._active)
+        ).grid(row=0, column=2, sticky="e")
+
+    def _wire_scrolling(self):
+        """Keep line numbers, visible time and scrollbar in step with the content."""
+        textbox = self._textbox
+        _tb = textbox._textbox
+        _ln = self._line_numbers._textbox
+
+        # Sync line numbers on every scroll (mouse wheel AND scrollbar drag)
+        def _on_scroll(first, last):
+            _ln.yview_moveto(first)
+            if textbox._y_scrollbar:
+                textbox._y_scrollbar.set(first, last)
+            # Streams page in neighbours once the view nears either edge
+            tab = self._active
+            if (tab is not None and tab.stream is not None and not self._extend_pending
+                    and (float(first) <= 0.05 or float(last) >= 0.95)):
+                self._extend_pending = True
+                self.after_idle(self._extend_stream)
+
+        _tb.configure(yscrollcommand=_on_scroll)
+
+        # Block ALL interaction on the inner line_numbers Text widget
+        def _block(event):
+            return "break"
+
+        def _block_scroll(event):
+            units = int(-event.delta / 120)
+            _tb.yview_scroll(units, "units")
+            return "break"
+
+        _ln.bind("<MouseWheel>", _block_scroll)
+        _ln.bind("<Button-4>", lambda e: (_tb.yview_scroll(-3, "units"), "break")[-1])
+        _ln.bind("<Button-5>", lambda e: (_tb.yview_scroll(3, "units"), "break")[-1])
+        _ln.bind("<Button-1>", _block)
+        _ln.bind("<B1-Motion>", _block)
+        _ln.bind("<ButtonRelease-1>", _block)
+        _ln.bind("<Key>", _block)
+        _ln.bind("<KeyPress>", _block)
+        _ln.configure(takefocus=0)
+
+        def _scrolled(units):
+            self._on_scroll_start()
+            _tb.yview_scroll(units, "units")
+            self._update_visible_time()
+            self._on_scroll_stop()
+            return "break"
+
+        # Bind to scroll events with dynamic font size effect
+        _tb.bind("<MouseWheel>", lambda e: _scrolled(int(-e.delta / 120)), add=True)
+        _tb.bind("<Button-4>", lambda e: _scrolled(-3), add=True)
+        _tb.bind("<Button-5>", lambda e: _scrolled(3), add=True)
+
+        # Scrollbar drag: scroll, sync line numbers and update visible time
+        if textbox._y_scrollbar:
+            def _scrollbar_with_time(*args):
+                self._on_scroll_start()
+                _tb.yview(*args)
+                _ln.yview_moveto(_tb.yview()[0])
+                self._update_visible_time()
+                self._on_scroll_stop()
+
+            textbox._y_scrollbar.configure(command=_scrollbar_with_time)
+            textbox._y_scrollbar.bind("<ButtonPress-1>", lambda e: self._on_scroll_start())
+            textbox._y_scrollbar.bind("<ButtonRelease-1>", lambda e: self._on_scroll_stop())
+            textbox._y_scrollbar.bind("<B1-Motion>", lambda e: self._on_scroll_start())
+
+    # ── Tabs ───────────────────────────────────────────────────────────────
+    def add_tab(self, file_path: str, file_name: str, log_type: str, title: str,
+                stream: "LogStream | None" = None, stream_start: int = 0):
+        """Add a tab for *file_path* or *stream* (or select its existing tab) and show it."""
+        key = stream.key if stream is not None else file_path
+        for tab in self._tabs:
+            if tab.key == key:
+                self._select_tab(tab)
+                return tab
+
+        tab = LogTab(file_path, file_name, title, log_type, stream, stream_start)
+        tab.button = ctk.CTkFrame(self._tab_bar, fg_color="#2A1E1A", corner_radius=6)
+        tab.button.pack(side="left", padx=(0, 6))
+        ctk.CTkButton(
+            tab.button, text=title,
+            font=get_font(11),
+            fg_color="transparent", hover_color="#3D2B22",
+            text_color=TEXT_BRIGHT, height=26,
+            command=lambda t=tab: self._select_tab(t)
+        ).pack(side="left", padx=(4, 0), pady=2)
+        ctk.CTkButton(
+            tab.button, text="✕",
+            font=get_font(11),
+            fg_color="transparent", hover_color="#3D2B22",
+            text_color=TEXT_DIM, width=24, height=26,
+            command=lambda t=tab: self._close_tab(t)
+        ).pack(side="left", padx=(0, 4), pady=2)
+        RENDER_MODE.apply(tab.button)
+
+        self._tabs.append(tab)
+        self._select_tab(tab)
+        return tab
+
+    def _select_tab(self, tab: LogTab):
+        if tab is self._active:
+            return
+        if self._active is not None:
+            self._stash_active()
+        self._show_tab(tab)
+
+    def _close_tab(self, tab: LogTab):
+        index = self._tabs.index(tab)
+        if tab is self._active:
+            self._stash_active()
+        self._tabs.remove(tab)
+        tab.button.destroy()
+        if not self._tabs:
+            self._on_close()
+            return
+        if self._active is None:
+            self._show_tab(self._tabs[min(index, len(self._tabs) - 1)])
+
+    def _stash_active(self):
+        """Remember scroll/search state of the active tab and drop its text."""
+        tab = self._active
+        if tab.stream is not None:
+            tab.stream_pos = self._stream_position(self._top_text_line())
+        else:
+            tab.yview = self._textbox._textbox.yview()[0]
+        tab.entry_text = self._search_entry.get()
+        tab.button.configure(fg_color="#2A1E1A")
+
+        self._set_text(self._textbox, "")
+        self._set_text(self._line_numbers, "")
+        self._minimap.set_index(None)
+        self._minimap_seg = None
+        self._matches = []
+        self._pages = []
+        if tab.buffer is not None:
+            LOG_BUFFERS.release(tab.buffer)
+            tab.buffer = None
+        self._active = None
+
+    def _show_tab(self, tab: LogTab):
+        """Rehydrate *tab* from the buffer cache (or its stream) and restore its state."""
+        self._active = tab
+        tab.button.configure(fg_color=ACCENT)
+        self._file_lbl.configure(text=f"📄 {tab.file_name}")
+        self.title(f"Log Workspace — {tab.title}")
+
+        if tab.stream is not None:
+            self._stream_goto(*tab.stream_pos)
+        else:
+            index = None
+            try:
+                tab.buffer = LOG_BUFFERS.acquire(tab.path)
+                index = tab.buffer.index
+                content = tab.buffer.text
+                self._total_lines = max(index.line_count, 1)
+            except Exception as e:
+                content = f"[Error reading file: {e}]"
+                self._total_lines = 1
+
+            self._set_text(self._line_numbers,
+                           "\n".join(str(i) for i in range(1, self._total_lines + 1)))
+            self._set_text(self._textbox, content)
+            self._minimap.set_index(index)
+
+        self._search_entry.delete(0, "end")
+        if tab.entry_text:
+            self._search_entry.insert(0, tab.entry_text)
+        self._restore_search(tab)
+
+        if tab.stream is None:
+            self._textbox._textbox.yview_moveto(tab.yview)
+            self._line_numbers._textbox.yview_moveto(tab.yview)
+        self.after_idle(self._update_visible_time)
+
+    def _set_text(self, box: ctk.CTkTextbox, content: str):
+        box.configure(state="normal")
+        box.delete("1.0", "end")
+        if content:
+            box.insert("1.0", content)
+        box.configure(state="disabled")
+
+    # ── Minimap / visible time ─────────────────────────────────────────────
+    def _jump_to_line(self, line: int):
+        _tb = self._textbox._textbox
+        if self._active is not None and self._active.stream is not None:
+            # Minimap shows the day at the top of the view; line is a day line
+            line = self._stream_goto(self._minimap_seg or 0, line)
+        else:
+            _tb.yview_moveto((line - 1) / self._total_lines)
+        self._line_numbers._textbox.yview_moveto(_tb.yview()[0])
+        self._textbox.tag_remove("minimap_target", "1.0", "end")
+        self._textbox.tag_add("minimap_target", f"{line}.0", f"{line}.end")
+        self._update_visible_time()
+
+    def _update_visible_time(self, *args):
+        """Update the visible time label based on first visible line with date/time."""
+        tab = self._active
+        if tab is None:
+            return
+        if tab.stream is not None:
+            self._update_stream_minimap()
+        try:
+            _tb = self._textbox._textbox
+            line_num = int(_tb.index("@0,0").split(".")[0])
+            # Search forward for a line with date/time
+            for offset in range(50):  # Check next 50 lines max
+                check_line = line_num + offset
+                line_content = _tb.get(f"{check_line}.0", f"{check_line}.end")
+
+                if tab.log_type == "kl4":
+                    match = _KL4_TIME_RE.search(line_content)
+                elif tab.log_type == "track":
+                    match = _DVJ_TIME_RE.search(line_content)
+                else:
+                    # Try both patterns for service logs
+                    match = _KL4_TIME_RE.search(line_content) or _DVJ_TIME_RE.search(line_content)
+
+                if match:
+                    self._visible_time_lbl.configure(text=match.group(1))
+                    return
+
+            # No date found in visible area
+            self._visible_time_lbl.configure(text="")
+        except Exception:
+            pass
+
+    # ── Multi-day streams ──────────────────────────────────────────────────
+    def _top_text_line(self) -> int:
+        return int(self._textbox._textbox.index("@0,0").split(".")[0])
+
+    def _scroll_to_text_line(self, line: int):
+        _tb = self._textbox._textbox
+        _tb.yview_moveto(0)
+        _tb.yview_scroll(max(line - 1, 0), "units")
+
+    def _stream_position(self, text_line: int) -> tuple[int, int]:
+        """Map a Text line of the loaded window to (segment, day line)."""
+        start = 1
+        for seg, page, count, has_sep in self._pages:
+            if text_line < start + count:
+                offset = text_line - start - (1 if has_sep else 0)
+                return seg, page * LogStream.PAGE_LINES + max(offset, 0) + 1
+            start += count
+        return self._active.stream_pos
+
+    def _stream_text_line(self, seg: int, line: int) -> int | None:
+        """Map (segment, day line) to a Text line if it is currently loaded."""
+        page = LogStream.page_of(line)
+        start = 1
+        for s, p, count, has_sep in self._pages:
+            if s == seg and p == page:
+                offset = (1 if has_sep else 0) + line - 1 - page * LogStream.PAGE_LINES
+                return start + min(offset, count - 1)
+            start += count
+        return None
+
+    def _stream_goto(self, seg: int, line: int) -> int:
+        """Show day line *line* of segment *seg* at the top; returns its Text line."""
+        text_line = self._stream_text_line(seg, line)
+        if text_line is None:
+            self._pages = []
+            self._set_text(self._textbox, "")
+            self._set_text(self._line_numbers, "")
+            try:
+                self._insert_page(seg, self._active.stream.page_of(line), at_end=True)
+            except OSError as e:
+                self._set_text(self._textbox, f"[Error reading file: {e}]")
+                return 1
+            text_line = self._stream_text_line(seg, line) or 1
+        self._scroll_to_text_line(text_line)
+        self._update_stream_minimap()
+        return text_line
+
+    def _insert_page(self, seg: int, page: int, at_end: bool) -> bool:
+        """Add one page of the active stream at the end or start of the Text."""
+        stream = self._active.stream
+        body, first_line = stream.read_page(seg, page)
+        has_sep = page == 0
+        text_parts, num_parts = [], []
+        if has_sep:
+            text_parts.append(stream.separator(seg))
+            num_parts.append("")
+        if body:
+            count = body.count("\n") + 1
+            text_parts.append(body)
+            num_parts.append("\n".join(str(i) for i in range(first_line, first_line + count)))
+        else:
+            count = 0
+        lines = count + (1 if has_sep else 0)
+        if not lines:
+            return False
+
+        empty = not self._pages
+        before = sum(p[2] for p in self._pages)
+        for box, chunk in ((self._textbox, "\n".join(text_parts)),
+                           (self._line_numbers, "\n".join(num_parts))):
+            box.configure(state="normal")
+            if empty:
+                box.insert("1.0", chunk)
+            elif at_end:
+                box.insert("end-1c", "\n" + chunk)
+            else:
+                box.insert("1.0", chunk + "\n")
+            box.configure(state="disabled")
+
+        if has_sep:
+            sep_line = before + 1 if at_end and not empty else 1
+            self._textbox.tag_add("day_separator", f"{sep_line}.0", f"{sep_line}.end")
+        record = [seg, page, lines, has_sep]
+        if at_end:
+            self._pages.append(record)
+        else:
+            self._pages.insert(0, record)
+        return True
+
+    def _drop_page(self, from_end: bool):
+        """Remove the first or last loaded page from the Text."""
+        if from_end:
+            self._pages.pop()
+            keep = sum(p[2] for p in self._pages)
+            first, last = f"{keep}.end", "end-1c"
+        else:
+            count = self._pages.pop(0)[2]
+            first, last = "1.0", f"{count + 1}.0"
+        for box in (self._textbox, self._line_numbers):
+            box.configure(state="normal")
+            box.delete(first, last)
+            box.configure(state="disabled")
+
+    def _neighbour_page(self, seg: int, page: int, step: int):
+        """Return (segment, page) before/after the given one, crossing day boundaries."""
+        stream = self._active.stream
+        if step > 0:
+            if page + 1 < stream.page_count(seg):
+                return seg, page + 1
+            if seg + 1 < len(stream.segments):
+                return seg + 1, 0
+        else:
+            if page > 0:
+                return seg, page - 1
+            if seg > 0:
+                return seg - 1, stream.page_count(seg - 1) - 1
+        return None
+
+    def _extend_stream(self):
+        """Page in the neighbour at whichever edge the view is near."""
+        self._extend_pending = False
+        tab = self._active
+        if tab is None or tab.stream is None or not self._pages:
+            return
+        _tb = self._textbox._textbox
+        try:
+            # Pages are only dropped once they are completely out of view, so a
+            # run of tiny days that all fit on screen cannot make this oscillate
+            if _tb.yview()[1] >= 0.95:
+                nxt = self._neighbour_page(*self._pages[-1][:2], 1)
+                if nxt and self._insert_page(*nxt, at_end=True):
+                    top = self._top_text_line()
+                    removed = self._pages[0][2]
+                    if len(self._pages) > self.STREAM_MAX_PAGES and removed < top:
+                        self._drop_page(from_end=False)
+                        self._scroll_to_text_line(top - removed)
+            if _tb.yview()[0] <= 0.05:
+                prev = self._neighbour_page(*self._pages[0][:2], -1)
+                if prev:
+                    top = self._top_text_line()
+                    if self._insert_page(*prev, at_end=False):
+                        self._scroll_to_text_line(top + self._pages[0][2])
+                        bottom = int(_tb.index(f"@0,{_tb.winfo_height()}").split(".")[0])
+                        last_start = sum(p[2] for p in self._pages) - self._pages[-1][2] + 1
+                        if len(self._pages) > self.STREAM_MAX_PAGES and last_start > bottom:
+                            self._drop_page(from_end=True)
+        except OSError as e:
+            print(f"Error paging log stream: {e}")
+        self._update_stream_minimap()
+
+    def _update_stream_minimap(self):
+        """Point the minimap at the day currently at the top of the view."""
+        if not self._pages:
+            return
+        seg = self._stream_position(self._top_text_line())[0]
+        if seg != self._minimap_seg:
+            self._minimap_seg = seg
+            try:
+                self._minimap.set_index(self._active.stream.index(seg))
+            except OSError:
+                self._minimap.set_index(None)
+
+    # ── Scrolling state for dynamic font size ──────────────────────────────
+    def _set_scrolling_state(self, is_scrolling: bool):
+        """Update font size and color based on scrolling state."""
+        if RENDER_MODE.low_redraw:
+            # The size/colour flash is purely cosmetic
+            is_scrolling = False
+            if not self._is_scrolling:
+                return
+        self._is_scrolling = is_scrolling
+        if is_scrolling:
+            self._visible_time_lbl.configure(
+                font=get_font(24, "bold"),
+                text_color="#FF6B35"  # Bright orange when changing
+            )
+        else:
+            self._visible_time_lbl.configure(
+                font=get_font(20, "bold"),
+                text_color="#E8A87C"  # Warm color normal
+            )
+
+    def _on_scroll_start(self):
+        """Called when user starts scrolling."""
+        if not self._is_scrolling:
+            self._set_scrolling_state(True)
+        # Cancel any pending scroll stop
+        SCHEDULER.cancel("log-scroll-stop")
+
+    def _on_scroll_stop(self):
+        """Called when scrolling stops (delayed)."""
+        SCHEDULER.once("log-scroll-stop", 300, lambda: self._set_scrolling_state(False))
+
+    # ── Text size ──────────────────────────────────────────────────────────
+    def _change_text_size(self, step: int):
+        """Grow or shrink the shared content/line-number font (6-20)."""
+        new_size = max(6, min(self._text_font.cget("size") + step, 20))
+        self._text_font.configure(size=new_size)
+
+    # ── Search ─────────────────────────────────────────────────────────────
+    def _find_matches(self, query: str):
+        textbox = self._textbox
+        self._matches = []
+        start_pos = "1.0"
+        while True:
+            pos = textbox.search(query, start_pos, stopindex="end", nocase=True)
+            if not pos:
+                break
+            end_pos = f"{pos}+{len(query)}c"
+            self._matches.append((pos, end_pos))
+            textbox.tag_add("highlight", pos, end_pos)
+            start_pos = end_pos
+
+    def _restore_search(self, tab: LogTab):
+        """Re-apply the stashed search highlights of *tab* without moving the view."""
+        if not tab.query:
+            return
+        self._find_matches(tab.query)
+        if 0 <= tab.match_index < len(self._matches):
+            pos, end_pos = self._matches[tab.match_index]
+            self._textbox.tag_add("current_highlight", pos, end_pos)
+
+    def _search_text(self):
+        """Highlight all matches and cycle to the next one on each call."""
+        tab = self._active
+        query = self._search_entry.get().strip()
+        if tab is None or not query:
+            return
+
+        textbox = self._textbox
+        textbox.tag_remove("highlight", "1.0", "end")
+        textbox.tag_remove("current_highlight", "1.0", "end")
+
+        # New query: find all matches
+        if query != tab.query:
+            tab.query = query
+            tab.match_index = -1
+            self._find_matches(query)
+        else:
+            for pos, end_pos in self._matches:
+                textbox.tag_add("highlight", pos, end_pos)
+
+        # Cycle to next match
+        if self._matches:
+            tab.match_index = (tab.match_index + 1) % len(self._matches)
+            pos, end_pos = self._matches[tab.match_index]
+            textbox.tag_add("current_highlight", pos, end_pos)
+
+            # Scroll to show the match
+            textbox.see(pos)
+            SCHEDULER.once("log-visible-time", 1, self._update_visible_time)
+
+    def _clear_search(self):
+        self._textbox.tag_remove("highlight", "1.0", "end")
+        self._textbox.tag_remove("current_highlight", "1.0", "end")
+        self._search_entry.delete(0, "end")
+        self._matches = []
+        if self._active is not None:
+            self._active.query = ""
+            self._active.match_index = -1
+
+    # ── Window ─────────────────────────────────────────────────────────────
+    def _bring_to_front(self):
+        """Focus the workspace using Windows API on the inner Tk window handle."""
+        try:
+            import ctypes
+            hwnd = ctypes.windll.user32.FindWindowW(None, self.title())
+            if hwnd:
+                ctypes.windll.user32.ShowWindow(hwnd, 9)  # SW_RESTORE
+                ctypes.windll.user32.SetForegroundWindow(hwnd)
+        except Exception:
+            pass
+        self.lift()
+        self.focus_force()
+
+    def _on_close(self):
+        if self._active is not None:
+            self._stash_active()
+        self.destroy()
+
+    def _on_destroy(self, event):
+        if event.widget is not self:
+            return
+        # Window torn down without _on_close (e.g. app exit): still hand the buffer back
+        if self._active is not None and self._active.buffer is not None:
+            LOG_BUFFERS.release(self._active.buffer)
+            self._active.buffer = None
+        if LogWorkspace._instance is self:
+            LogWorkspace._instance = None
+        for name in ("log-workspace-focus", "log-scroll-stop", "log-visible-time"):
+            SCHEDULER.cancel(name)
+
+
+# ── Background tasks ──────────────────────────────────────────────────────────
+class TaskCancelled(Exception):
+    """Raised inside a worker once its task has been superseded."""
+
+
+class CancelToken:
+    """Cooperative cancellation flag handed to background work."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self):
+        """Bail out of the worker early if the task is no longer wanted."""
+        if self._event.is_set():
+            raise TaskCancelled()
+
+
+class LatestTaskRunner:
+    """
+    Runs slow loads for one widget on worker threads where only the most
+    recent request matters. Starting a task cancels the previous one, and
+    results are handed back on the Tk thread only if their generation is
+    still current, so stale work never touches the widgets.
+    """
+
+    POLL_MS = 30
+
+    def __init__(self, widget):
+        self._widget = widget
+        self._results = queue.SimpleQueue()
+        self._generation = 0
+        self._token: CancelToken | None = None
+        self._polling = False
+
+    def start(self, work, on_done, on_error=None) -> CancelToken:
+        """Run work(token) on a worker thread, then on_done(result) on the Tk thread."""
+        self.cancel()
+        self._generation += 1
+        generation = self._generation
+        token = self._token = CancelToken()
+
+        def run():
+            try:
+                outcome = (generation, token, on_done, work(token))
+            except TaskCancelled:
+                return
+            except Exception as e:
+                if on_error is None:
+                    print(f"Error in background task: {e}")
+                # Still handed back, so the poll sees the task finish and stops
+                outcome = (generation, token, on_error or self._ignore_error, e)
+            self._results.put(outcome)
+
+        threading.Thread(target=run, daemon=True).start()
+        self._schedule_poll()
+        return token
+
+    def cancel(self):
+        """Cancel the in-flight task, if any; its result will be discarded."""
+        if self._token is not None:
+            self._token.cancel()
+            self._token = None
+
+    @staticmethod
+    def _ignore_error(error):
+        pass
+
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self._widget.after(self.POLL_MS, self._poll)
+
+    def _poll(self):
+        self._polling = False
+        while True:
+            try:
+                generation, token, callback, value = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._generation or token.cancelled:
+                continue
+            self._token = None
+            callback(value)
+        if self._token is not None:
+            self._schedule_poll()
+
+
+# ── Scheduler ─────────────────────────────────────────────────────────────────
+class _ScheduledJob:
+    __slots__ = ("name", "callback", "interval", "priority", "background_ms",
+                 "run_when_hidden", "periodic", "due", "last_run")
+
+    def __init__(self, name, callback, interval, priority, background_ms, run_when_hidden, periodic):
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.priority = priority
+        self.background_ms = background_ms
+        self.run_when_hidden = run_when_hidden
+        self.periodic = periodic
+        self.due = 0.0
+        self.last_run = None
+
+
+class Scheduler:
+    """
+    Named periodic and deferred jobs driven by a single Tk timer. Scheduling a
+    name again replaces the pending job, so repeated requests debounce, and
+    jobs falling due within MERGE_MS of each other run in one wakeup, highest
+    priority first. While the app is unfocused periodic jobs stretch to their
+    background interval; while it is minimised they pause until it is shown.
+    """
+
+    MERGE_MS = 50
+
+    def __init__(self):
+        self._root = None
+        self._jobs: dict[str, _ScheduledJob] = {}
+        self._timer = None
+        self._timer_due = None
+        self._focused = True
+        self._hidden = False
+        self._focus_check_pending = False
+
+    def attach(self, root):
+        """Drive the jobs from *root*'s event loop and follow its focus/visibility."""
+        self._root = root
+        root.bind_all("<FocusIn>", self._on_focus_event, add="+")
+        root.bind_all("<FocusOut>", self._on_focus_event, add="+")
+        root.bind("<Map>", self._on_visibility_event, add="+")
+        root.bind("<Unmap>", self._on_visibility_event, add="+")
+        self._arm()
+
+    def shutdown(self):
+        """Drop every job and the pending timer (used when the app closes)."""
+        self._jobs.clear()
+        self._disarm()
+
+    @property
+    def focused(self) -> bool:
+        return self._focused
+
+    @property
+    def hidden(self) -> bool:
+        return self._hidden
+
+    def every(self, name: str, interval_ms: int, callback, priority: int = 0,
+              background_ms: int | None = None, run_when_hidden: bool = False,
+              first_ms: int | None = None):
+        """
+        Run callback() every interval_ms. A positive number returned by the
+        callback is used as the delay until the next run instead.
+        """
+        job = _ScheduledJob(name, callback, interval_ms, priority, background_ms, run_when_hidden, True)
+        job.due = self._now() + (interval_ms if first_ms is None else first_ms)
+        self._jobs[name] = job
+        self._arm()
+
+    def once(self, name: str, delay_ms: int, callback, priority: int = 0):
+        """Run callback() once after delay_ms, replacing any pending job of the same name."""
+        job = _ScheduledJob(name, callback, delay_ms, priority, None, True, False)
+        job.due = self._now() + delay_ms
+        self._jobs[name] = job
+        self._arm()
+
+    def cancel(self, name: str):
+        if self._jobs.pop(name, None) is not None:
+            self._arm()
+
+    def wake(self, name: str):
+        """Run a pending job on the next wakeup instead of waiting for its due time."""
+        job = self._jobs.get(name)
+        if job is not None:
+            job.due = self._now()
+            self._arm()
+
+    def scheduled(self, name: str) -> bool:
+        return name in self._jobs
+
+    # ── Timer ──────────────────────────────────────────────────────────────
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic() * 1000
+
+    def _arm(self):
+        if self._root is None:
+            return
+        due = min((job.due for job in self._jobs.values()), default=None)
+        if due == self._timer_due:
+            return
+        self._disarm()
+        if due is None or due == float("inf"):
+            return
+        self._timer_due = due
+        self._timer = self._root.after(max(0, int(due - self._now())), self._run_due)
+
+    def _disarm(self):
+        if self._timer is not None:
+            try:
+                self._root.after_cancel(self._timer)
+            except Exception:
+                pass
+        self._timer = None
+        self._timer_due = None
+
+    def _run_due(self):
+        self._timer = None
+        self._timer_due = None
+        now = self._now()
+        batch = [job for job in self._jobs.values() if job.due <= now + self.MERGE_MS]
+        batch.sort(key=lambda job: -job.priority)
+        for job in batch:
+            if self._jobs.get(job.name) is not job:
+                continue  # cancelled or replaced by an earlier job in this batch
+            if not job.periodic:
+                del self._jobs[job.name]
+            elif self._hidden and not job.run_when_hidden:
+                job.due = float("inf")  # resumed when the window is shown again
+                continue
+            try:
+                result = job.callback()
+            except Exception as e:
+                print(f"Error in scheduled job {job.name}: {e}")
+                result = None
+            if job.periodic and self._jobs.get(job.name) is job:
+                delay = result if isinstance(result, (int, float)) and result > 0 else job.interval
+                if not self._focused and job.background_ms:
+                    delay = max(delay, job.background_ms)
+                job.last_run = self._now()
+                job.due = job.last_run + delay
+        self._arm()
+
+    # ── Focus / visibility ─────────────────────────────────────────────────
+    def _on_focus_event(self, event):
+        # Focus moving between our own windows produces Out/In pairs; settle once idle
+        if not self._focus_check_pending and self._root is not None:
+            self._focus_check_pending = True
+            self._root.after_idle(self._check_focus)
+
+    def _check_focus(self):
+        self._focus_check_pending = False
+        try:
+            focused = self._root.focus_displayof() is not None
+        except Exception:
+            focused = False  # e.g. the focus widget was destroyed mid-check
+        if focused == self._focused:
+            return
+        self._focused = focused
+        if focused:
+            self._resume(stretched_only=True)
+
+    def _on_visibility_event(self, event):
+        if event.widget is not self._root:
+            return
+        hidden = self._root.state() in ("iconic", "withdrawn")
+        if hidden == self._hidden:
+            return
+        self._hidden = hidden
+        if not hidden:
+            self._resume(stretched_only=False)
+
+    def _resume(self, stretched_only: bool):
+        """Pull paused or background-stretched periodic jobs back to their normal rate."""
+        now = self._now()
+        for job in self._jobs.values():
+            if not job.periodic:
+                continue
+            if job.due == float("inf"):
+                job.due = now
+            elif stretched_only and job.last_run is not None:
+                job.due = min(job.due, max(now, job.last_run + job.interval))
+        self._arm()
+
+
+SCHEDULER = Scheduler()
+
+
+# ── Filesystem watcher ────────────────────────────────────────────────────────
+class FileChange:
+    """One change seen by the watcher; kind is "created", "modified" or "deleted"."""
+
+    CREATED = "created"
+    MODIFIED = "modified"
+    DELETED = "deleted"
+
+    __slots__ = ("watch", "kind", "path", "is_dir")
+
+    def __init__(self, watch: str, kind: str, path: str, is_dir: bool):
+        self.watch = watch
+        self.kind = kind
+        self.path = path
+        self.is_dir = is_dir
+
+    def __repr__(self):
+        return f"FileChange({self.watch!r}, {self.kind!r}, {self.path!r})"
+
+
+def snapshot_path(path: str, depth: int | None = 0, pattern=None, modifications: bool = True) -> dict:
+    """
+    Stat snapshot {path: (is_dir, size, mtime_ns)} of a single file, or of a
+    folder's entries down to *depth* levels below it (None = no limit). Only
+    entries whose name matches *pattern* are recorded, though every folder is
+    still descended; without *modifications* just presence is recorded.
+    Folders never record size/mtime, so files changing inside them do not
+    show up as the folder being modified.
+    """
+    if not os.path.isdir(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return {}
+        return {path: (False, st.st_size, st.st_mtime_ns) if modifications else (False,)}
+
+    snapshot = {}
+    stack = [(path, 0)]
+    while stack:
+        folder, level = stack.pop()
+        try:
+            entries = list(os.scandir(folder))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+                if is_dir and (depth is None or level < depth):
+                    stack.append((entry.path, level + 1))
+                if pattern is not None and not pattern.search(entry.name):
+                    continue
+                if is_dir or not modifications:
+                    snapshot[entry.path] = (is_dir,)
+                else:
+                    st = entry.stat()
+                    snapshot[entry.path] = (False, st.st_size, st.st_mtime_ns)
+            except OSError:
+                continue  # removed between listing and stat
+    return snapshot
+
+
+def diff_snapshots(watch: str, old: dict, new: dict) -> list[FileChange]:
+    """FileChanges turning snapshot *old* into *new*, ordered by path."""
+    changes = []
+    for path, info in new.items():
+        before = old.get(path)
+        if before is None:
+            changes.append(FileChange(watch, FileChange.CREATED, path, info[0]))
+        elif before != info:
+            changes.append(FileChange(watch, FileChange.MODIFIED, path, info[0]))
+    for path in old.keys() - new.keys():
+        changes.append(FileChange(watch, FileChange.DELETED, path, old[path][0]))
+    changes.sort(key=lambda change: change.path)
+    return changes
+
+
+class _WatchSpec:
+    __slots__ = ("name", "path", "callback", "depth", "pattern", "modifications",
+                 "snapshot", "dirty", "native")
+
+    def __init__(self, name, path, callback, depth, pattern, modifications):
+        self.name = name
+        self.path = path
+        self.callback = callback
+        self.depth = depth
+        self.pattern = pattern
+        self.modifications = modifications
+        self.snapshot = None  # taken by the first scan, off the Tk thread
+        self.dirty = False    # set by the native notifier thread
+        self.native = False   # covered by a native change notification
+
+    @property
+    def target(self) -> tuple:
+        return (self.path, self.depth, self.pattern, self.modifications)
+
+    def scan(self) -> dict:
+        return snapshot_path(self.path, self.depth, self.pattern, self.modifications)
+
+
+class _NativeChangeNotifier:
+    """
+    Windows change notifications (FindFirstChangeNotificationW), one waiting
+    thread per watched folder. They only flag a watch as dirty; the watcher's
+    own scan still works out what changed.
+    """
+
+    WAIT_MS = 500
+    # FILE_NOTIFY_CHANGE_FILE_NAME | DIR_NAME | SIZE | LAST_WRITE
+    _FILTER = 0x01 | 0x02 | 0x08 | 0x10
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+        kernel32 = ctypes.windll.kernel32
+        kernel32.FindFirstChangeNotificationW.argtypes = [wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD]
+        kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+        kernel32.FindNextChangeNotification.argtypes = [ctypes.c_void_p]
+        kernel32.FindCloseChangeNotification.argtypes = [ctypes.c_void_p]
+        kernel32.WaitForSingleObject.argtypes = [ctypes.c_void_p, wintypes.DWORD]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        self._kernel32 = kernel32
+        self._invalid = ctypes.c_void_p(-1).value
+        self._stops = {}
+
+    def add(self, spec: _WatchSpec):
+        folder = spec.path if os.path.isdir(spec.path) else os.path.dirname(spec.path)
+        handle = self._kernel32.FindFirstChangeNotificationW(folder, spec.depth != 0, self._FILTER)
+        if not handle or handle == self._invalid:
+            return  # e.g. the folder does not exist yet; polling covers it
+        stop = threading.Event()
+        self._stops[spec.name] = stop
+        spec.native = True
+        threading.Thread(target=self._wait, args=(spec, handle, stop), daemon=True).start()
+
+    def remove(self, name: str):
+        stop = self._stops.pop(name, None)
+        if stop is not None:
+            stop.set()
+
+    def _wait(self, spec, handle, stop):
+        kernel32 = self._kernel32
+        try:
+            while not stop.is_set():
+                if kernel32.WaitForSingleObject(handle, self.WAIT_MS) == 0:  # WAIT_OBJECT_0
+                    spec.dirty = True
+                    if not kernel32.FindNextChangeNotification(handle):
+                        break
+        finally:
+            kernel32.FindCloseChangeNotification(handle)
+            spec.native = False
+
+
+class FileWatcher:
+    """
+    Tells the pages when the files they show change on disk. Each named watch
+    keeps a stat snapshot; a poll diffs a fresh snapshot against it and passes
+    the created/modified/deleted entries to the watch's callback on the Tk
+    thread. Polls run on a worker off the scheduler, and a new watch's first
+    scan only records its snapshot, so watch() itself never touches the disk.
+    Where native change notification is available only the watches that
+    reported something are rescanned between the slower full sweeps.
+    """
+
+    POLL_MS = 2000
+    BACKGROUND_POLL_MS = 10000
+    FULL_SCAN_MS = 30000
+
+    def __init__(self, native: bool = True):
+        self._watches: dict[str, _WatchSpec] = {}
+        self._runner = None
+        self._scheduler = None
+        self._scanning = False
+        self._last_full_scan = 0.0
+        self._native = None
+        if native and sys.platform == "win32":
+            try:
+                self._native = _NativeChangeNotifier()
+            except Exception as e:
+                print(f"Error enabling change notifications, polling only: {e}")
+
+    def watch(self, name: str, path: str, callback, depth: int | None = 0,
+              pattern=None, modifications: bool = True):
+        """
+        Call callback(changes) whenever *path* (a file, or a folder down to
+        *depth*) changes after the watch's first scan. Watching the same
+        target again under the same name keeps the existing snapshot, so no
+        changes are lost or repeated.
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern, re.IGNORECASE)
+        spec = _WatchSpec(name, path, callback, depth, pattern, modifications)
+        current = self._watches.get(name)
+        if current is not None and current.target == spec.target:
+            current.callback = callback
+            return
+        self.unwatch(name)
+        self._watches[name] = spec
+        if self._native is not None:
+            self._native.add(spec)
+        if self._scheduler is not None:
+            self._scheduler.wake("file-watcher")  # take the first snapshot soon
+
+    def unwatch(self, name: str):
+        if self._watches.pop(name, None) is not None and self._native is not None:
+            self._native.remove(name)
+
+    def watching(self, name: str) -> bool:
+        return name in self._watches
+
+    def poll(self) -> list[FileChange]:
+        """Rescan every watch on the calling thread and deliver what changed."""
+        return self._deliver([(spec, spec.scan()) for spec in list(self._watches.values())])
+
+    def start(self, root, scheduler: "Scheduler | None" = None):
+        """Poll in the background from *root*'s event loop."""
+        self._runner = LatestTaskRunner(root)
+        self._scheduler = scheduler or SCHEDULER
+        self._scheduler.every("file-watcher", self.POLL_MS, self._tick,
+                                       background_ms=self.BACKGROUND_POLL_MS)
+
+    def _tick(self):
+        if self._scanning or not self._watches:
+            return
+        now = time.monotonic() * 1000
+        full = self._native is None or now - self._last_full_scan >= self.FULL_SCAN_MS
+        if full:
+            self._last_full_scan = now
+        specs = [spec for spec in self._watches.values()
+                 if full or spec.dirty or not spec.native or spec.snapshot is None]
+        if not specs:
+            return
+        for spec in specs:
+            spec.dirty = False
+
+        def work(token: CancelToken):
+            results = []
+            for spec in specs:
+                token.check()
+                results.append((spec, spec.scan()))
+            return results
+
+        def done(results):
+            self._scanning = False
+            self._deliver(results)
+
+        def failed(e):
+            self._scanning = False
+            print(f"Error scanning watched files: {e}")
+
+        self._scanning = True
+        self._runner.start(work, done, failed)
+
+    def _deliver(self, results) -> list[FileChange]:
+        delivered = []
+        for spec, snapshot in results:
+            if self._watches.get(spec.name) is not spec:
+                continue  # unwatched or re-targeted while the scan ran
+            if spec.snapshot is None:
+                spec.snapshot = snapshot  # first scan: nothing to compare with yet
+                continue
+            changes = diff_snapshots(spec.name, spec.snapshot, snapshot)
+            spec.snapshot = snapshot
+            if not changes:
+                continue
+            delivered.extend(changes)
+            try:
+                spec.callback(changes)
+            except Exception as e:
+                print(f"Error handling changes for {spec.name}: {e}")
+        return delivered
+
+
+FILE_WATCHER = FileWatcher()
+
+
+# ── Resize coordination ───────────────────────────────────────────────────────
+class ResizeCoordinator:
+    """
+    Tk delivers the root's <Configure> binding for every child widget that is
+    configured as well, so a single layout pass can produce hundreds of events.
+    This keeps only real changes to the root window's size and passes the
+    latest size to subscribers at most once per frame.
+    """
+
+    FRAME_MS = 16
 
-    for child in root:
-        walk(child)
+    def __init__(self, root):
+        self._root = root
+        self._size = (0, 0)
+        self._delivered = (0, 0)
+        self._pending = None
+        self._subscribers = []
+        # add="+" keeps customtkinter's own dimension tracking on the root
+        root.bind("<Configure>", self._on_configure, add="+")
 
-    return "\n".join(lines), raw
+    @property
+    def size(self) -> tuple[int, int]:
+        return self._size
+
+    def subscribe(self, callback):
+        """Call callback(width, height) after the root window settles on a new size."""
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _on_configure(self, event):
+        if event.widget is not self._root:
+            return
+        size = (event.width, event.height)
+        if size == self._size or size[0] <= 1 or size[1] <= 1:
+            return
+        self._size = size
+        if self._pending is None:
+            self._pending = self._root.after(self.FRAME_MS, self._flush)
+
+    def _flush(self):
+        self._pending = None
+        if self._size == self._delivered:
+            return
+        self._delivered = self._size
+        width, height = self._size
+        for callback in list(self._subscribers):
+            callback(width, height)
 
 
 # ── Simple background (no gradient) ───────────────────────────────────────────
 def set_background(canvas: Canvas, width: int, height: int):
     """Set solid background color."""
-    canvas.delete("all")
-    canvas.create_rectangle(0, 0, width, height, fill=BG_COLOR, outline="")
+    # Resize the one background item rather than recreating it
+    items = canvas.find_withtag("background")
+    if items:
+        canvas.coords(items[0], 0, 0, width, height)
+    else:
+        canvas.create_rectangle(0, 0, width, height, fill=BG_COLOR, outline="", tags="background")
 
 
 # ── Stat Card ──────────────────────────────────────────────────────────────────
@@ -136,18 +3029,18 @@ class StatCard(ctk.CTkFrame):
 
         ctk.CTkLabel(
             self, text=title.upper(),
-            font=ctk.CTkFont(size=10), text_color=TEXT_DIM, anchor="w"
+            font=get_font(10), text_color=TEXT_DIM, anchor="w"
         ).grid(row=0, column=0, sticky="ew", padx=14, pady=(14, 2))
 
         ctk.CTkLabel(
             self, text=value,
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=get_font(28, "bold"),
             text_color=TEXT_BRIGHT, anchor="w"
         ).grid(row=1, column=0, sticky="ew", padx=14, pady=2)
 
         ctk.CTkLabel(
             self, text=change,
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             text_color=TEXT_GREEN if positive else TEXT_RED, anchor="w"
         ).grid(row=2, column=0, sticky="ew", padx=14, pady=(2, 14))
 
@@ -158,7 +3051,7 @@ class ShortcutButton(ctk.CTkButton):
         super().__init__(
             master,
             text=f"{icon}\n{label}",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             fg_color="#2A1E1A",
             hover_color="#3D2B22",
             text_color=TEXT_BRIGHT,
@@ -193,28 +3086,28 @@ class Sidebar(ctk.CTkFrame):
     def _build(self):
         ctk.CTkLabel(
             self, text="🎵  MC Support",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=ACCENT, anchor="w"
         ).pack(fill="x", padx=18, pady=(28, 2))
 
         # Live time display under title
         self._date_lbl = ctk.CTkLabel(
             self, text="",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             text_color=TEXT_BRIGHT, anchor="w"
         )
         self._date_lbl.pack(fill="x", padx=18, pady=(0, 0))
 
         self._time_lbl = ctk.CTkLabel(
             self, text="",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=get_font(20, "bold"),
             text_color=ACCENT, anchor="w"
         )
         self._time_lbl.pack(fill="x", padx=18, pady=(0, 0))
 
         self._tz_lbl = ctk.CTkLabel(
             self, text="",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color=TEXT_DIM, anchor="w"
         )
         self._tz_lbl.pack(fill="x", padx=18, pady=(0, 8))
@@ -226,7 +3119,7 @@ class Sidebar(ctk.CTkFrame):
             btn = ctk.CTkButton(
                 self,
                 text=f"{icon} {label}",
-                font=ctk.CTkFont(size=13),
+                font=get_font(13),
                 fg_color="#2E1F1A" if is_active else "transparent",
                 hover_color="#2E1F1A",
                 text_color=ACCENT if is_active else TEXT_BRIGHT,
@@ -241,22 +3134,41 @@ class Sidebar(ctk.CTkFrame):
         ctk.CTkFrame(self, fg_color="transparent").pack(fill="both", expand=True)
         ctk.CTkFrame(self, height=1, fg_color=DIVIDER).pack(fill="x", padx=12, pady=(0, 10))
 
+        # Fewer repaints for Remote Desktop links (auto-detected at start-up)
+        self._remote_switch = ctk.CTkSwitch(
+            self, text="Remote session mode",
+            font=get_font(11), text_color=TEXT_DIM,
+            progress_color=ACCENT,
+            command=lambda: RENDER_MODE.set_low_redraw(bool(self._remote_switch.get())),
+        )
+        if RENDER_MODE.low_redraw:
+            self._remote_switch.select()
+        self._remote_switch.pack(fill="x", padx=18, pady=(0, 10))
+
         ctk.CTkLabel(
             self, text="👤  Agent: You",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=TEXT_DIM, anchor="w"
         ).pack(fill="x", padx=18, pady=(0, 22))
 
-    def update_time(self):
+    def update_time(self, show_seconds: bool = True):
         from datetime import datetime, timezone
         import time
         now = datetime.now()
         # Get timezone offset in hours (e.g., +7 for Bangkok)
         tz_offset_hours = -time.timezone // 3600 if time.daylight == 0 else -time.altzone // 3600
         tz_offset_str = f"{tz_offset_hours:+d}"
-        self._date_lbl.configure(text=now.strftime("(%A) %d/%m/%Y"))
-        self._time_lbl.configure(text=now.strftime("%I:%M:%S %p").lstrip("0"))
-        self._tz_lbl.configure(text=f"{time.tzname[0] if time.daylight == 0 else time.tzname[1]} ({tz_offset_str})")
+        # Seconds are dropped whenever the clock only ticks once a minute
+        time_format = "%I:%M:%S %p" if show_seconds else "%I:%M %p"
+        texts = (
+            (self._date_lbl, now.strftime("(%A) %d/%m/%Y")),
+            (self._time_lbl, now.strftime(time_format).lstrip("0")),
+            (self._tz_lbl, f"{time.tzname[0] if time.daylight == 0 else time.tzname[1]} ({tz_offset_str})"),
+        )
+        # Only touch labels whose text actually changed (date and zone rarely do)
+        for label, text in texts:
+            if label.cget("text") != text:
+                label.configure(text=text)
 
     def _navigate(self, label: str):
         # Handle special launch cases
@@ -319,13 +3231,13 @@ class Sidebar(ctk.CTkFrame):
         ctk.CTkLabel(
             dialog,
             text="Are you sure you want to quit?",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(pady=(20, 10))
         
         ctk.CTkLabel(
             dialog,
             text="This will close the MC Support Dashboard.",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color="#888888"
         ).pack(pady=(0, 20))
         
@@ -370,15 +3282,15 @@ class WeatherWidget(ctk.CTkFrame):
         super().__init__(master, fg_color="transparent", **kw)
         ctk.CTkLabel(
             self, text="McLean, VA",
-            font=ctk.CTkFont(size=12), text_color=TEXT_DIM
+            font=get_font(12), text_color=TEXT_DIM
         ).pack(anchor="e")
         ctk.CTkLabel(
             self, text="68°",
-            font=ctk.CTkFont(size=34), text_color=TEXT_BRIGHT
+            font=get_font(34), text_color=TEXT_BRIGHT
         ).pack(anchor="e")
         ctk.CTkLabel(
             self, text="☀  Partly Cloudy",
-            font=ctk.CTkFont(size=11), text_color=TEXT_DIM
+            font=get_font(11), text_color=TEXT_DIM
         ).pack(anchor="e")
 
 
@@ -396,7 +3308,7 @@ class ActivityRow(ctk.CTkFrame):
             (status, TEXT_GREEN if status_ok else TEXT_RED),
         ]):
             ctk.CTkLabel(
-                self, text=text, font=ctk.CTkFont(size=12),
+                self, text=text, font=get_font(12),
                 text_color=color, anchor="w"
             ).grid(row=0, column=col, sticky="ew", padx=6, pady=4)
 
@@ -422,13 +3334,13 @@ class ConfigXMLPage(ctk.CTkFrame):
 
         ctk.CTkLabel(
             left_frame, text="Config.XML Viewer",
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=get_font(22, "bold"),
             text_color=TEXT_BRIGHT, anchor="w"
         ).grid(row=0, column=0, sticky="w")
 
         self._source_lbl = ctk.CTkLabel(
             left_frame, text="Scanning…",
-            font=ctk.CTkFont(size=11), text_color=TEXT_DIM, anchor="w"
+            font=get_font(11), text_color=TEXT_DIM, anchor="w"
         )
         self._source_lbl.grid(row=1, column=0, sticky="w")
 
@@ -439,7 +3351,7 @@ class ConfigXMLPage(ctk.CTkFrame):
         ctk.CTkButton(
             btn_frame, text="📋 Copy Cores.XML Texts",
             fg_color="#2A1E1A", hover_color="#3D2B22",
-            text_color=TEXT_BRIGHT, font=ctk.CTkFont(size=12),
+            text_color=TEXT_BRIGHT, font=get_font(12),
             corner_radius=8, height=34, width=130,
             command=self._copy_content,
         ).pack(side="left", padx=(0, 8))
@@ -447,9 +3359,9 @@ class ConfigXMLPage(ctk.CTkFrame):
         ctk.CTkButton(
             btn_frame, text="⟳ Refresh",
             fg_color=ACCENT, hover_color="#A06840",
-            text_color="#1A0F0A", font=ctk.CTkFont(size=12, weight="bold"),
+            text_color="#1A0F0A", font=get_font(12, "bold"),
             corner_radius=8, height=34, width=100,
-            command=self._load,
+            command=lambda: SCHEDULER.once("config-xml-refresh", 0, self._load),
         ).pack(side="left")
 
         # ── Tab view ───────────────────────────────────────────────────────────
@@ -464,7 +3376,7 @@ class ConfigXMLPage(ctk.CTkFrame):
 
         self._tab_readable_btn = ctk.CTkButton(
             tab_sel, text="Readable View",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(12, "bold"),
             fg_color=ACCENT, hover_color="#A06840",
             text_color="#1A0F0A", corner_radius=6, height=30, width=140,
             command=lambda: self._switch_tab("readable"),
@@ -473,7 +3385,7 @@ class ConfigXMLPage(ctk.CTkFrame):
 
         self._tab_raw_btn = ctk.CTkButton(
             tab_sel, text="Raw XML",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color="#2A1E1A", hover_color="#3D2B22",
             text_color=TEXT_BRIGHT, corner_radius=6, height=30, width=140,
             command=lambda: self._switch_tab("raw"),
@@ -494,7 +3406,7 @@ class ConfigXMLPage(ctk.CTkFrame):
             corner_radius=8,
             fg_color="#150D0D",
             text_color=TEXT_BRIGHT,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=get_font(12, family="Consolas"),
             border_color=DIVIDER,
             border_width=1,
             wrap="none",
@@ -525,15 +3437,15 @@ class ConfigXMLPage(ctk.CTkFrame):
         if tab == "readable":
             self._readable_box.lift()
             self._tab_readable_btn.configure(fg_color=ACCENT, text_color="#1A0F0A",
-                                             font=ctk.CTkFont(size=12, weight="bold"))
+                                             font=get_font(12, "bold"))
             self._tab_raw_btn.configure(fg_color="#2A1E1A", text_color=TEXT_BRIGHT,
-                                        font=ctk.CTkFont(size=12))
+                                        font=get_font(12))
         else:
             self._raw_box.lift()
             self._tab_raw_btn.configure(fg_color=ACCENT, text_color="#1A0F0A",
-                                        font=ctk.CTkFont(size=12, weight="bold"))
+                                        font=get_font(12, "bold"))
             self._tab_readable_btn.configure(fg_color="#2A1E1A", text_color=TEXT_BRIGHT,
-                                             font=ctk.CTkFont(size=12))
+                                             font=get_font(12))
 
     def _set_textbox(self, box: ctk.CTkTextbox, content: str):
         box.configure(state="normal")
@@ -578,7 +3490,7 @@ class ConfigXMLPage(ctk.CTkFrame):
         if not hasattr(self, '_date_badge'):
             self._date_badge = ctk.CTkLabel(
                 left_frame, text="",
-                font=ctk.CTkFont(size=11, weight="bold"),
+                font=get_font(11, "bold"),
                 text_color=ACCENT,
                 fg_color="#2A1E1A",
                 corner_radius=6,
@@ -595,33 +3507,75 @@ class ConfigXMLPage(ctk.CTkFrame):
 
 # ── Cores.XML Page ─────────────────────────────────────────────────────────────
 class CoresXMLPage(ctk.CTkFrame):
+    # Built detail views kept alive (hidden) per (entity_id, menu), least recently used dropped first
+    DETAIL_VIEWS_MAX = 8
+    # Channel boxes are built this many at a time, as the list is scrolled towards its end
+    CHANNEL_BATCH = 12
+    # Channel list / details panel minimum widths and the sash between them
+    CHANNELS_MIN_WIDTH = 250
+    DETAILS_MIN_WIDTH = 700
+    SASH_WIDTH = 4
+    # Raw XML is inserted this many characters per event-loop turn
+    RAW_CHUNK_CHARS = 64 * 1024
+
     def __init__(self, master, **kw):
         super().__init__(master, fg_color="transparent", **kw)
         self.columnconfigure(0, weight=1)
         self.rowconfigure(1, weight=1)
+        self._detail_views = OrderedDict()
+        # Only the most recently clicked channel/menu load is allowed to reach the panel
+        self._detail_tasks = LatestTaskRunner(self)
+        # Channel dicts currently shown in the channel list (None = no channel list on screen)
+        self._channel_models = None
+        self._channel_boxes_built = 0
+        self._channel_batch_pending = False
+        self._active_menu_button = None
+        # Hash of the cores.xml the view was last built from; unchanged content makes Refresh a no-op
+        self._cores_digest = None
+        # Raw XML text; the Raw tab is only filled (in chunks) once it is shown
+        self._raw_text = ""
+        self._raw_box_current = True
+        self._raw_fill_generation = 0
+        # The XML Tree tab is likewise only (re)loaded when shown
+        self._xml_root = None
+        self._xml_tree_current = True
+        # (entity_id, menu) of the detail view on screen; its source files are watched
+        self._details_key = None
+        self._details_changed = None
+        # Build Changes tab: diffs run off the Tk thread; redone when shown after a new build
+        self._diff_tasks = LatestTaskRunner(self)
+        self._build_diff_current = True
+        self._diff_shown = None
+        self._diff_pinned = False
         self._build()
 
     def _load(self):
         """Load cores.xml data and build the view."""
+        # A new snapshot folder, or cores.xml edited in place, reloads the page by itself
+        FILE_WATCHER.watch("kv-base", KV_BASE, self._on_cores_changed, pattern=_FOLDER_RE)
         folder_name, xml_path = find_latest_cores_xml()
 
         if folder_name is None:
+            FILE_WATCHER.unwatch("cores-xml")
             self._source_lbl.configure(
                 text=f"Base path not found: {KV_BASE}", text_color=TEXT_RED
             )
             self._show_error_in_readable(
                 f"[Directory not found]\n\nExpected base path:\n  {KV_BASE}\n\n"
                 "Please ensure Kaleidovision is installed and the config folder exists.")
-            self._set_textbox(self._raw_box, "")
+            self._set_raw_text("")
+            self._cores_digest = None
             return
 
+        FILE_WATCHER.watch("cores-xml", xml_path, self._on_cores_changed)
         if not os.path.isfile(xml_path):
             self._source_lbl.configure(
                 text=f"cores.xml not found in: {folder_name}", text_color=TEXT_RED
             )
             self._show_error_in_readable(
                 f"[File not found]\n\nLooked for:\n  {xml_path}")
-            self._set_textbox(self._raw_box, "")
+            self._set_raw_text("")
+            self._cores_digest = None
             return
 
         dt = _folder_datetime(folder_name)
@@ -639,7 +3593,7 @@ class CoresXMLPage(ctk.CTkFrame):
         if not hasattr(self, '_date_badge'):
             self._date_badge = ctk.CTkLabel(
                 self._left_frame, text="",
-                font=ctk.CTkFont(size=11, weight="bold"),
+                font=get_font(11, "bold"),
                 text_color=ACCENT,
                 fg_color="#2A1E1A",
                 corner_radius=6,
@@ -648,11 +3602,25 @@ class CoresXMLPage(ctk.CTkFrame):
             self._date_badge.grid(row=2, column=0, sticky="w", pady=(6, 0))
         self._date_badge.configure(text=f"📅 Latest Cores Build Date: {ts}" if dt else f"Latest Cores Build Date: {ts}")
 
+        # Nothing to do if the file's content is exactly what is already displayed
+        try:
+            with open(xml_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            digest = None
+        if digest is not None and digest == self._cores_digest:
+            return
+        self._cores_digest = digest
+
         readable, raw = pretty_xml(xml_path)
         self._build_readable_view(xml_path, readable)
-        self._set_textbox(self._raw_box, raw)
+        self._set_raw_text(raw)
         self._switch_tab(self._active_tab)
 
+    def _on_cores_changed(self, changes: list[FileChange]):
+        # Same job name as the Refresh button, so a burst of changes loads once
+        SCHEDULER.once("cores-xml-refresh", 0, self._load)
+
     def _build(self):
         # ── Page title bar with buttons ─────────────────────────────────────────
         title_bar = ctk.CTkFrame(self, fg_color="transparent")
@@ -668,13 +3636,13 @@ class CoresXMLPage(ctk.CTkFrame):
 
         ctk.CTkLabel(
             left_frame, text="Overview",
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=get_font(22, "bold"),
             text_color=TEXT_BRIGHT, anchor="w"
         ).grid(row=0, column=0, sticky="w")
 
         self._source_lbl = ctk.CTkLabel(
             left_frame, text="Scanning…",
-            font=ctk.CTkFont(size=11), text_color=TEXT_DIM, anchor="w"
+            font=get_font(11), text_color=TEXT_DIM, anchor="w"
         )
         self._source_lbl.grid(row=1, column=0, sticky="w")
 
@@ -685,7 +3653,7 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkButton(
             btn_frame, text="📋 Copy Cores Texts",
             fg_color="#2A1E1A", hover_color="#3D2B22",
-            text_color=TEXT_BRIGHT, font=ctk.CTkFont(size=12),
+            text_color=TEXT_BRIGHT, font=get_font(12),
             corner_radius=8, height=34, width=130,
             command=self._copy_content,
         ).pack(side="left", padx=(0, 8))
@@ -693,7 +3661,7 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkButton(
             btn_frame, text="✏️ Edit Cores",
             fg_color="#2A1E1A", hover_color="#3D2B22",
-            text_color=TEXT_BRIGHT, font=ctk.CTkFont(size=12),
+            text_color=TEXT_BRIGHT, font=get_font(12),
             corner_radius=8, height=34, width=100,
             command=self._edit_cores,
         ).pack(side="left", padx=(0, 8))
@@ -701,9 +3669,9 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkButton(
             btn_frame, text="⟳ Refresh",
             fg_color=ACCENT, hover_color="#A06840",
-            text_color="#1A0F0A", font=ctk.CTkFont(size=12, weight="bold"),
+            text_color="#1A0F0A", font=get_font(12, "bold"),
             corner_radius=8, height=34, width=100,
-            command=self._load,
+            command=lambda: SCHEDULER.once("cores-xml-refresh", 0, self._load),
         ).pack(side="left")
 
         # ── Tab view ───────────────────────────────────────────────────────────
@@ -718,7 +3686,7 @@ class CoresXMLPage(ctk.CTkFrame):
 
         self._tab_readable_btn = ctk.CTkButton(
             tab_sel, text="Readable View",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(12, "bold"),
             fg_color=ACCENT, hover_color="#A06840",
             text_color="#1A0F0A", corner_radius=6, height=30, width=140,
             command=lambda: self._switch_tab("readable"),
@@ -727,12 +3695,30 @@ class CoresXMLPage(ctk.CTkFrame):
 
         self._tab_raw_btn = ctk.CTkButton(
             tab_sel, text="Raw XML",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color="#2A1E1A", hover_color="#3D2B22",
             text_color=TEXT_BRIGHT, corner_radius=6, height=30, width=140,
             command=lambda: self._switch_tab("raw"),
         )
-        self._tab_raw_btn.pack(side="left")
+        self._tab_raw_btn.pack(side="left", padx=(0, 6))
+
+        self._tab_tree_btn = ctk.CTkButton(
+            tab_sel, text="XML Tree",
+            font=get_font(12),
+            fg_color="#2A1E1A", hover_color="#3D2B22",
+            text_color=TEXT_BRIGHT, corner_radius=6, height=30, width=140,
+            command=lambda: self._switch_tab("tree"),
+        )
+        self._tab_tree_btn.pack(side="left", padx=(0, 6))
+
+        self._tab_diff_btn = ctk.CTkButton(
+            tab_sel, text="Build Changes",
+            font=get_font(12),
+            fg_color="#2A1E1A", hover_color="#3D2B22",
+            text_color=TEXT_BRIGHT, corner_radius=6, height=30, width=140,
+            command=lambda: self._switch_tab("changes"),
+        )
+        self._tab_diff_btn.pack(side="left")
 
         ctk.CTkFrame(tab_container, height=1, fg_color=DIVIDER).grid(
             row=0, column=0, sticky="ew", padx=0, pady=(46, 0)
@@ -758,7 +3744,7 @@ class CoresXMLPage(ctk.CTkFrame):
             corner_radius=8,
             fg_color="#150D0D",
             text_color=TEXT_BRIGHT,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=get_font(12, family="Consolas"),
             border_color=DIVIDER,
             border_width=1,
             wrap="none",
@@ -768,35 +3754,160 @@ class CoresXMLPage(ctk.CTkFrame):
         self._raw_box = ctk.CTkTextbox(self._raw_content_frame, **common)
         self._raw_box.grid(row=0, column=0, sticky="nsew")
 
+        # Tree tab: collapsible element tree, children built on expand
+        self._xml_tree = XMLTreeView(tab_container)
+        self._xml_tree.grid(row=1, column=0, sticky="nsew", padx=12, pady=12)
+
+        # Build Changes tab: what changed in cores.xml between two snapshot builds
+        self._diff_frame = ctk.CTkFrame(tab_container, fg_color="transparent")
+        self._diff_frame.grid(row=1, column=0, sticky="nsew", padx=12, pady=12)
+        self._diff_frame.columnconfigure(0, weight=1)
+        self._diff_frame.rowconfigure(1, weight=1)
+
+        diff_bar = ctk.CTkFrame(self._diff_frame, fg_color="transparent")
+        diff_bar.grid(row=0, column=0, sticky="ew", pady=(0, 8))
+        diff_bar.columnconfigure(4, weight=1)
+        menu_style = dict(
+            values=[""], width=170, height=28,
+            fg_color="#2A1E1A", button_color=DIVIDER, button_hover_color=ACCENT,
+            text_color=TEXT_BRIGHT, font=get_font(11),
+            command=lambda _: self._on_build_choice(),
+        )
+        ctk.CTkLabel(diff_bar, text="From", font=get_font(11), text_color=TEXT_DIM).grid(
+            row=0, column=0, padx=(0, 6))
+        self._diff_from_menu = ctk.CTkOptionMenu(diff_bar, **menu_style)
+        self._diff_from_menu.grid(row=0, column=1, padx=(0, 12))
+        ctk.CTkLabel(diff_bar, text="To", font=get_font(11), text_color=TEXT_DIM).grid(
+            row=0, column=2, padx=(0, 6))
+        self._diff_to_menu = ctk.CTkOptionMenu(diff_bar, **menu_style)
+        self._diff_to_menu.grid(row=0, column=3, padx=(0, 12))
+        self._diff_summary_lbl = ctk.CTkLabel(
+            diff_bar, text="", font=get_font(11), text_color=TEXT_DIM, anchor="w")
+        self._diff_summary_lbl.grid(row=0, column=4, sticky="w")
+
+        self._diff_box = ctk.CTkTextbox(self._diff_frame, **common)
+        self._diff_box.grid(row=1, column=0, sticky="nsew")
+        self._diff_box.tag_config("added", foreground=TEXT_GREEN)
+        self._diff_box.tag_config("removed", foreground=TEXT_RED)
+        self._diff_box.tag_config("changed", foreground=ACCENT)
+        self._diff_box.tag_config("detail", foreground=TEXT_DIM)
+
         self._active_tab = "readable"
         self._switch_tab("readable")
         self._load()
 
     # ── Copy content to clipboard ──────────────────────────────────────────────
     def _copy_content(self):
-        content = ""
-        if self._active_tab == "readable":
-            content = self._raw_box.get("0.0", "end")
-        else:
-            content = self._raw_box.get("0.0", "end")
+        # The Raw tab may not have been filled yet, so copy from the loaded text
+        content = self._raw_text
         self.clipboard_clear()
         self.clipboard_append(content)
 
     # ── Tab switching ──────────────────────────────────────────────────────────
     def _switch_tab(self, tab: str):
         self._active_tab = tab
-        if tab == "readable":
-            self._readable_frame.lift()
-            self._tab_readable_btn.configure(fg_color=ACCENT, text_color="#1A0F0A",
-                                             font=ctk.CTkFont(size=12, weight="bold"))
-            self._tab_raw_btn.configure(fg_color="#2A1E1A", text_color=TEXT_BRIGHT,
-                                        font=ctk.CTkFont(size=12))
+        tabs = {
+            "readable": (self._readable_frame, self._tab_readable_btn),
+            "raw": (self._raw_content_frame, self._tab_raw_btn),
+            "tree": (self._xml_tree, self._tab_tree_btn),
+            "changes": (self._diff_frame, self._tab_diff_btn),
+        }
+        for name, (frame, btn) in tabs.items():
+            if name == tab:
+                frame.lift()
+                btn.configure(fg_color=ACCENT, text_color="#1A0F0A", font=get_font(12, "bold"))
+            else:
+                btn.configure(fg_color="#2A1E1A", text_color=TEXT_BRIGHT, font=get_font(12))
+
+        if tab == "raw" and not self._raw_box_current:
+            self._fill_raw_box()
+        elif tab == "tree" and not self._xml_tree_current:
+            self._xml_tree_current = True
+            self._xml_tree.load(self._xml_root)
+        elif tab == "changes" and not self._build_diff_current:
+            self._build_diff_current = True
+            self._refresh_build_choices()
+
+    # ── Build Changes ──────────────────────────────────────────────────────────
+    def _refresh_build_choices(self):
+        """List the snapshot builds in the From/To menus and diff the selected pair."""
+        names = [name for _, name in reversed(SNAPSHOT_INDEX.folders(KV_BASE))]  # newest first
+        if len(names) < 2:
+            self._diff_from_menu.configure(values=names or [""])
+            self._diff_to_menu.configure(values=names or [""])
+            self._diff_summary_lbl.configure(text="Need at least two builds to compare.", text_color=TEXT_DIM)
+            self._diff_shown = None
+            self._set_textbox(self._diff_box, "")
+            return
+        self._diff_from_menu.configure(values=names)
+        self._diff_to_menu.configure(values=names)
+        # Follow the newest pair unless the user picked builds that still exist
+        if not (self._diff_pinned and self._diff_from_menu.get() in names and self._diff_to_menu.get() in names):
+            self._diff_pinned = False
+            self._diff_to_menu.set(names[0])
+            self._diff_from_menu.set(names[1])
+        self._diff_shown = None  # the builds' files may have changed in place
+        self._run_build_diff()
+
+    def _on_build_choice(self):
+        self._diff_pinned = True
+        self._run_build_diff()
+
+    def _run_build_diff(self):
+        """Diff cores.xml of the two selected builds on a worker (hashed trees are cached per file)."""
+        pair = (self._diff_from_menu.get(), self._diff_to_menu.get())
+        if pair == self._diff_shown:
+            return
+        self._diff_shown = pair
+        old_path, new_path = (os.path.join(KV_BASE, name, "cores.xml") for name in pair)
+        self._diff_summary_lbl.configure(text="Comparing…", text_color=TEXT_DIM)
+
+        def work(token: CancelToken):
+            old = load_hashed_xml(old_path)
+            token.check()
+            new = load_hashed_xml(new_path)
+            token.check()
+            return diff_xml_trees(old, new)
+
+        def failed(e):
+            self._diff_shown = None
+            self._diff_summary_lbl.configure(text=f"Cannot compare: {e}", text_color=TEXT_RED)
+            self._set_textbox(self._diff_box, "")
+
+        self._diff_tasks.start(work, lambda changes: self._show_build_diff(pair, changes), failed)
+
+    def _show_build_diff(self, pair: tuple, changes: list[dict]):
+        counts = {kind: sum(1 for c in changes if c['kind'] == kind) for kind in ("added", "removed", "changed")}
+        if not changes:
+            summary = f"No differences between {pair[0]} and {pair[1]}"
         else:
-            self._raw_content_frame.lift()
-            self._tab_raw_btn.configure(fg_color=ACCENT, text_color="#1A0F0A",
-                                        font=ctk.CTkFont(size=12, weight="bold"))
-            self._tab_readable_btn.configure(fg_color="#2A1E1A", text_color=TEXT_BRIGHT,
-                                             font=ctk.CTkFont(size=12))
+            summary = (f"{counts['added']} added, {counts['removed']} removed, "
+                       f"{counts['changed']} changed  ({pair[0]} → {pair[1]})")
+        self._diff_summary_lbl.configure(text=summary, text_color=TEXT_DIM)
+
+        box = self._diff_box
+        box.configure(state="normal")
+        box.delete("0.0", "end")
+        marks = {"added": "+", "removed": "-", "changed": "~"}
+        for change in changes:
+            node = change['node']
+            line = f"{marks[change['kind']]} {' › '.join(change['path']) or node.tag}"
+            if change['kind'] != "changed":
+                # Enough of the element to recognise it
+                hint = "  ".join(f"{k}={v}" for k, v in list(node.attrib.items())[:4])
+                if hint:
+                    line += f"    {hint}"
+            box.insert("end", line + "\n", change['kind'])
+            for name, before, after in change['attrs']:
+                if before is None:
+                    box.insert("end", f"      + {name} = {after}\n", "added")
+                elif after is None:
+                    box.insert("end", f"      - {name} = {before}\n", "removed")
+                else:
+                    box.insert("end", f"      {name}: {before} → {after}\n", "detail")
+            if change['text'] is not None:
+                box.insert("end", f"      text: {change['text'][0]!r} → {change['text'][1]!r}\n", "detail")
+        box.configure(state="disabled")
 
     # ── Load / Refresh ─────────────────────────────────────────────────────────
     def _set_textbox(self, box: ctk.CTkTextbox, content: str):
@@ -805,17 +3916,62 @@ class CoresXMLPage(ctk.CTkFrame):
         box.insert("0.0", content)
         box.configure(state="disabled")
 
+    def _set_raw_text(self, content: str):
+        """Remember the raw XML; the Raw and XML Tree tabs are filled when (next) visible."""
+        self._raw_text = content
+        self._raw_box_current = False
+        self._raw_fill_generation += 1  # Stops any fill of older text still in progress
+        self._xml_tree_current = False
+        self._build_diff_current = False
+        if self._active_tab != "readable":
+            self._switch_tab(self._active_tab)
+
+    def _fill_raw_box(self):
+        """Insert the raw XML a chunk at a time so a large file never blocks the event loop."""
+        self._raw_box_current = True
+        generation = self._raw_fill_generation
+        text = self._raw_text
+        box = self._raw_box
+        box.configure(state="normal")
+        box.delete("0.0", "end")
+        box.configure(state="disabled")
+
+        def insert_chunk(start: int):
+            if generation != self._raw_fill_generation:
+                return
+            end = start + self.RAW_CHUNK_CHARS
+            if end < len(text):
+                # Finish the current line unless it is itself huge (minified XML)
+                newline = text.find("\n", end, end + self.RAW_CHUNK_CHARS)
+                if newline != -1:
+                    end = newline + 1
+            box.configure(state="normal")
+            box.insert("end", text[start:end])
+            box.configure(state="disabled")
+            if end < len(text):
+                self.after(1, insert_chunk, end)
+
+        insert_chunk(0)
+
     def _clear_readable_frame(self):
         """Remove all widgets from the readable frame."""
         for widget in self._readable_frame.winfo_children():
             widget.destroy()
+        # Cached detail views and the channel list lived inside the readable frame
+        self._detail_tasks.cancel()
+        self._unwatch_detail_sources()
+        self._detail_views = OrderedDict()
+        self._channel_models = None
+        self._channel_boxes_built = 0
+        self._active_menu_button = None
 
     def _show_error_in_readable(self, message: str):
         """Display an error message in the readable frame."""
         self._clear_readable_frame()
+        self._xml_root = None  # Nothing valid for the XML Tree tab either
         ctk.CTkLabel(
             self._readable_frame, text=message,
-            font=ctk.CTkFont(size=12), text_color=TEXT_RED
+            font=get_font(12), text_color=TEXT_RED
         ).grid(row=0, column=0, sticky="w")
 
     def _extract_mcservice_url(self, root) -> str | None:
@@ -865,21 +4021,21 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkLabel(
             frame,
             text="🔐 Password Required",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=ACCENT, anchor="center"
         ).grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 10))
         
         ctk.CTkLabel(
             frame,
             text="Enter password to edit cores.xml:",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=TEXT_BRIGHT, anchor="center", justify="center"
         ).grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 15))
         
         # Password entry
         password_entry = ctk.CTkEntry(
             frame,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color="#2A1E1A",
             border_color=DIVIDER,
             border_width=1,
@@ -911,7 +4067,7 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkButton(
             btn_frame,
             text="Submit",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color=ACCENT,
             hover_color="#E8A87C",
             text_color="#1A0F0A",
@@ -923,7 +4079,7 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkButton(
             btn_frame,
             text="Cancel",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color=DIVIDER,
             hover_color=ACCENT,
             text_color=TEXT_BRIGHT,
@@ -1001,8 +4157,6 @@ class CoresXMLPage(ctk.CTkFrame):
     # ── Build readable view with split layout ────────────────────────────────
     def _build_readable_view(self, xml_path: str, raw_content: str):
         """Build the readable view with channels on left and details panel on right."""
-        self._clear_readable_frame()
-
         try:
             tree = ET.parse(xml_path)
             self._xml_root = tree.getroot()
@@ -1010,41 +4164,54 @@ class CoresXMLPage(ctk.CTkFrame):
             self._show_error_in_readable(f"[Error parsing XML: {e}]")
             return
 
-        # ── MC Service App URL ────────────────────────────────────────────────
         mc_url = self._extract_mcservice_url(self._xml_root)
+        channels = self._extract_kl4_channels(self._xml_root)
+
+        # Refresh of a view that is already on screen: update it in place so
+        # unchanged channel boxes, the selection and scroll positions survive
+        if self._channel_models is not None and channels:
+            self._mc_url_lbl.configure(text=mc_url if mc_url else "Not configured")
+            self._channel_count_lbl.configure(text=f"No. of channels: {len(channels)}")
+            self._sync_channel_boxes(channels)
+            return
+
+        self._clear_readable_frame()
+
+        # ── MC Service App URL ────────────────────────────────────────────────
         url_frame = ctk.CTkFrame(self._readable_frame, fg_color=CARD_BG, corner_radius=CORNER)
         url_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 12))
         url_frame.columnconfigure(0, weight=1)
 
         ctk.CTkLabel(
             url_frame, text="MC Service App URL",
-            font=ctk.CTkFont(size=10), text_color=TEXT_DIM, anchor="w"
+            font=get_font(10), text_color=TEXT_DIM, anchor="w"
         ).grid(row=0, column=0, sticky="w", padx=14, pady=(10, 2))
 
         url_text = mc_url if mc_url else "Not configured"
-        ctk.CTkLabel(
+        self._mc_url_lbl = ctk.CTkLabel(
             url_frame, text=url_text,
-            font=ctk.CTkFont(size=14, weight="bold"), text_color=ACCENT, anchor="w"
-        ).grid(row=1, column=0, sticky="w", padx=14, pady=(2, 10))
+            font=get_font(14, "bold"), text_color=ACCENT, anchor="w"
+        )
+        self._mc_url_lbl.grid(row=1, column=0, sticky="w", padx=14, pady=(2, 10))
 
         # ── Channels Section ────────────────────────────────────────────────────
-        channels = self._extract_kl4_channels(self._xml_root)
         channel_count = len(channels)
 
         count_frame = ctk.CTkFrame(self._readable_frame, fg_color="transparent")
         count_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(0, 12))
         count_frame.columnconfigure(0, weight=1)
 
-        ctk.CTkLabel(
+        self._channel_count_lbl = ctk.CTkLabel(
             count_frame,
             text=f"No. of channels: {channel_count}",
-            font=ctk.CTkFont(size=14, weight="bold"), text_color=TEXT_BRIGHT, anchor="w"
-        ).grid(row=0, column=0, sticky="w")
+            font=get_font(14, "bold"), text_color=TEXT_BRIGHT, anchor="w"
+        )
+        self._channel_count_lbl.grid(row=0, column=0, sticky="w")
 
         if channel_count == 0:
             ctk.CTkLabel(
                 self._readable_frame, text="No channels found in KL4 configuration.",
-                font=ctk.CTkFont(size=12), text_color=TEXT_DIM
+                font=get_font(12), text_color=TEXT_DIM
             ).grid(row=2, column=0, sticky="w", pady=(10, 0))
             return
 
@@ -1052,10 +4219,16 @@ class CoresXMLPage(ctk.CTkFrame):
         # Use grid with weight to force both panels to fill full height
         content_frame = ctk.CTkFrame(self._readable_frame, fg_color="transparent")
         content_frame.grid(row=2, column=0, columnspan=2, sticky="nsew", pady=(0, 20))
-        content_frame.columnconfigure(0, weight=20, minsize=250)  # Left panel: 20%
-        content_frame.columnconfigure(1, weight=0, minsize=4)   # Sash column
-        content_frame.columnconfigure(2, weight=80, minsize=700)  # Right panel: 80%
+        content_frame.columnconfigure(0, weight=20, minsize=self.CHANNELS_MIN_WIDTH)  # Left panel: 20%
+        content_frame.columnconfigure(1, weight=0, minsize=self.SASH_WIDTH)  # Sash column
+        content_frame.columnconfigure(2, weight=80, minsize=self.DETAILS_MIN_WIDTH)  # Right panel: 80%
         content_frame.rowconfigure(0, weight=1)     # Both fill full height
+        # A saved split is applied once the frame has its real width
+        self._pending_split = None
+        content_frame.bind("<Configure>", lambda e: self._on_content_configure(content_frame), add="+")
+        saved_split = load_ui_settings().get("channel_split")
+        if isinstance(saved_split, (int, float)) and 0 < saved_split < 1:
+            self._apply_sash_split(content_frame, saved_split)
         self._readable_frame.rowconfigure(2, weight=1)
         self._readable_frame.columnconfigure(0, weight=1)
 
@@ -1072,7 +4245,7 @@ class CoresXMLPage(ctk.CTkFrame):
 
         ctk.CTkLabel(
             left_header, text="Channel List",
-            font=ctk.CTkFont(size=14, weight="bold"), text_color=ACCENT, anchor="w"
+            font=get_font(14, "bold"), text_color=ACCENT, anchor="w"
         ).grid(row=0, column=0, sticky="w", padx=12, pady=8)
 
         left_frame = ctk.CTkScrollableFrame(
@@ -1085,6 +4258,8 @@ class CoresXMLPage(ctk.CTkFrame):
         left_frame.columnconfigure(0, weight=1)
         # Configure scrollable frame to expand
         left_frame._parent_canvas.configure(height=0)
+        # Watch the scroll position to build further channel boxes on demand
+        left_frame._parent_canvas.configure(yscrollcommand=self._on_channel_list_scroll)
         left_frame.grid_rowconfigure(0, weight=1)
 
         # Store reference for dynamic resizing
@@ -1094,19 +4269,20 @@ class CoresXMLPage(ctk.CTkFrame):
         self._channel_buttons = {}
         self._current_channel = None
         self._current_menu = None
-
-        for idx, channel in enumerate(channels, start=1):
-            channel_box = self._create_channel_box(left_frame, idx, channel)
-            channel_box.grid(row=idx - 1, column=0, sticky="ew", pady=8)
+        self._active_menu_button = None
+        self._channel_models = []
+        self._channel_boxes_built = 0
+        self._sync_channel_boxes(channels)
 
         # Draggable sash between panels
         sash = ctk.CTkFrame(content_frame, fg_color=DIVIDER, width=4, cursor="sb_h_double_arrow")
         sash.grid(row=0, column=1, sticky="ns")
         sash.bind("<Button-1>", lambda e: self._start_sash_drag(e, content_frame))
-        sash.bind("<B1-Motion>", lambda e: self._on_sash_drag(e, content_frame, left_container, right_container))
-        sash.bind("<ButtonRelease-1>", lambda e: self._end_sash_drag())
+        sash.bind("<B1-Motion>", lambda e: self._on_sash_drag(e, content_frame))
+        sash.bind("<ButtonRelease-1>", lambda e: self._end_sash_drag(content_frame))
         self._sash = sash
         self._sash_dragging = False
+        self._sash_ghost = None
 
         # Right side: Details panel with Viewer header
         right_container = ctk.CTkFrame(content_frame, fg_color="transparent")
@@ -1121,7 +4297,7 @@ class CoresXMLPage(ctk.CTkFrame):
 
         self._viewer_title = ctk.CTkLabel(
             right_header, text="Viewer",
-            font=ctk.CTkFont(size=14, weight="bold"), text_color=ACCENT, anchor="w"
+            font=get_font(14, "bold"), text_color=ACCENT, anchor="w"
         )
         self._viewer_title.grid(row=0, column=0, sticky="w", padx=12, pady=8)
 
@@ -1143,15 +4319,96 @@ class CoresXMLPage(ctk.CTkFrame):
         # Details panel header
         self._details_header = ctk.CTkLabel(
             self._details_scroll_frame, text="Select a channel and menu",
-            font=ctk.CTkFont(size=14, weight="bold"), text_color=TEXT_BRIGHT, anchor="w"
+            font=get_font(14, "bold"), text_color=TEXT_BRIGHT, anchor="w"
         )
         self._details_header.grid(row=0, column=0, sticky="w", padx=14, pady=14)
 
-        # Details content area
-        self._details_content = ctk.CTkFrame(self._details_scroll_frame, fg_color="transparent")
-        self._details_content.grid(row=1, column=0, sticky="nsew", padx=14, pady=(0, 14))
-        self._details_content.columnconfigure(0, weight=1)
-        self._details_content.rowconfigure(0, weight=1)
+        # Details content area - each (channel, menu) view is its own frame in here
+        self._details_host = ctk.CTkFrame(self._details_scroll_frame, fg_color="transparent")
+        self._details_host.grid(row=1, column=0, sticky="nsew", padx=14, pady=(0, 14))
+        self._details_host.columnconfigure(0, weight=1)
+        self._details_host.rowconfigure(0, weight=1)
+        self._details_content = None
+
+    def _sync_channel_boxes(self, channels: list[dict]):
+        """Make the channel list match *channels*, rebuilding only boxes whose channel changed."""
+        old = self._channel_models
+        built = self._channel_boxes_built
+        for idx, channel in enumerate(channels, start=1):
+            channel_id = f"channel_{idx}"
+            # Channel number is the position, and file paths depend on it
+            channel['channel_number'] = idx
+            if idx > built:
+                continue  # Not built yet - it will be built from the new model when scrolled to
+            previous = old[idx - 1]
+            if previous == channel:
+                continue
+
+            entry = self._channel_buttons.pop(channel_id, None)
+            if entry is not None:
+                entry["box"].destroy()
+            channel_box = self._create_channel_box(self._left_scrollable, idx, channel)
+            channel_box.grid(row=idx - 1, column=0, sticky="ew", pady=8)
+
+            if self._current_channel == channel_id:
+                if previous['entity_id'] == channel['entity_id']:
+                    # Same channel with new details: keep it selected and refresh the headers
+                    menu_name = self._current_menu
+                    self._active_menu_button = self._channel_buttons[channel_id]["buttons"][menu_name]
+                    self._active_menu_button.configure(fg_color=ACCENT, text_color="#1A0F0A")
+                    self._update_details_panel(channel, menu_name)
+                else:
+                    self._clear_channel_selection()
+
+        for idx in range(len(channels) + 1, built + 1):
+            channel_id = f"channel_{idx}"
+            entry = self._channel_buttons.pop(channel_id, None)
+            if entry is not None:
+                entry["box"].destroy()
+            if self._current_channel == channel_id:
+                self._clear_channel_selection()
+
+        self._channel_models = channels
+        self._channel_boxes_built = min(built, len(channels))
+        if self._channel_boxes_built == 0:
+            self._build_more_channel_boxes()
+        else:
+            self._on_channel_list_scroll(*self._left_scrollable._parent_canvas.yview())
+
+    def _build_more_channel_boxes(self):
+        """Build the next CHANNEL_BATCH channel boxes below the ones already shown."""
+        self._channel_batch_pending = False
+        if self._channel_models is None:
+            return
+        start = self._channel_boxes_built
+        end = min(start + self.CHANNEL_BATCH, len(self._channel_models))
+        for idx in range(start + 1, end + 1):
+            channel_box = self._create_channel_box(self._left_scrollable, idx, self._channel_models[idx - 1])
+            channel_box.grid(row=idx - 1, column=0, sticky="ew", pady=8)
+        self._channel_boxes_built = end
+        RENDER_MODE.apply(self._left_scrollable)
+
+    def _on_channel_list_scroll(self, first, last):
+        """Channel list yscrollcommand: update the scrollbar, and build more boxes near the end."""
+        self._left_scrollable._scrollbar.set(first, last)
+        if (float(last) >= 0.9 and not self._channel_batch_pending
+                and self._channel_models is not None
+                and self._channel_boxes_built < len(self._channel_models)):
+            self._channel_batch_pending = True
+            self.after_idle(self._build_more_channel_boxes)
+
+    def _clear_channel_selection(self):
+        """Forget the selected channel/menu and empty the details panel."""
+        if self._active_menu_button is not None and self._active_menu_button.winfo_exists():
+            self._active_menu_button.configure(fg_color="#2A1E1A", text_color=TEXT_BRIGHT)
+        self._active_menu_button = None
+        self._current_channel = None
+        self._current_menu = None
+        self._detail_tasks.cancel()
+        self._unwatch_detail_sources()
+        self._hide_details_content()
+        self._details_header.configure(text="Select a channel and menu")
+        self._viewer_title.configure(text="Viewer")
 
     def _create_channel_box(self, parent, idx: int, channel: dict) -> ctk.CTkFrame:
         """Create a channel box with menu buttons."""
@@ -1165,7 +4422,7 @@ class CoresXMLPage(ctk.CTkFrame):
 
         ctk.CTkLabel(
             seq_frame, text=str(idx),
-            font=ctk.CTkFont(size=16, weight="bold"), text_color="#1A0F0A", anchor="center"
+            font=get_font(16, "bold"), text_color="#1A0F0A", anchor="center"
         ).place(relx=0.5, rely=0.5, anchor="center")
 
         # Channel name with Entity ID: "Main [30211]"
@@ -1173,7 +4430,7 @@ class CoresXMLPage(ctk.CTkFrame):
 
         ctk.CTkLabel(
             channel_box, text=name_text,
-            font=ctk.CTkFont(size=15, weight="bold"), text_color=TEXT_BRIGHT, anchor="w"
+            font=get_font(15, "bold"), text_color=TEXT_BRIGHT, anchor="w"
         ).grid(row=0, column=1, sticky="w", padx=(0, 14), pady=(14, 4))
 
         # Info row: Tracking Period and MC App status
@@ -1183,7 +4440,7 @@ class CoresXMLPage(ctk.CTkFrame):
         tracking_text = f"Tracking Period: {channel['tracking_period'] if channel['tracking_period'] else 'N/A'}"
         ctk.CTkLabel(
             info_frame, text=tracking_text,
-            font=ctk.CTkFont(size=11), text_color=TEXT_DIM, anchor="w"
+            font=get_font(11), text_color=TEXT_DIM, anchor="w"
         ).pack(side="left", padx=(0, 12))
 
         mc_status = "Enabled" if channel['mc_app_enabled'] else "Disabled"
@@ -1191,7 +4448,7 @@ class CoresXMLPage(ctk.CTkFrame):
         mc_text = f"MC App: {mc_status}"
         ctk.CTkLabel(
             info_frame, text=mc_text,
-            font=ctk.CTkFont(size=11), text_color=mc_color, anchor="w"
+            font=get_font(11), text_color=mc_color, anchor="w"
         ).pack(side="left")
 
         # Menu buttons row
@@ -1203,13 +4460,13 @@ class CoresXMLPage(ctk.CTkFrame):
         # Store channel number for file path lookups
         channel['channel_number'] = idx
 
-        for menu_name in ["Music Schedules", "Overriding Schedules", "Logs"]:
+        for menu_name in ["Music Schedules", "Timeline", "Overriding Schedules", "Logs"]:
             # Capture channel_number directly in lambda to avoid closure issues
             ch_num = idx
             btn = ctk.CTkButton(
                 btn_frame, text=menu_name,
                 fg_color="#2A1E1A", hover_color="#3D2B22",
-                text_color=TEXT_BRIGHT, font=ctk.CTkFont(size=11),
+                text_color=TEXT_BRIGHT, font=get_font(11),
                 corner_radius=6, height=28, width=110,
                 command=lambda cid=channel_id, ch=channel, m=menu_name, num=ch_num: self._on_menu_click(cid, ch, m, num)
             )
@@ -1234,14 +4491,13 @@ class CoresXMLPage(ctk.CTkFrame):
         if self._current_channel == channel_id and self._current_menu == menu_name:
             return
 
-        # Reset ALL buttons to default state (defensive - ensure clean slate)
-        for ch_id, ch_data in self._channel_buttons.items():
-            for btn in ch_data["buttons"].values():
-                btn.configure(fg_color="#2A1E1A", text_color=TEXT_BRIGHT)
+        # Only the previously active button and the clicked one change
+        if self._active_menu_button is not None and self._active_menu_button.winfo_exists():
+            self._active_menu_button.configure(fg_color="#2A1E1A", text_color=TEXT_BRIGHT)
 
         # Set new active button styling
-        new_buttons = self._channel_buttons[channel_id]["buttons"]
-        new_buttons[menu_name].configure(fg_color=ACCENT, text_color="#1A0F0A")
+        self._active_menu_button = self._channel_buttons[channel_id]["buttons"][menu_name]
+        self._active_menu_button.configure(fg_color=ACCENT, text_color="#1A0F0A")
 
         # Update state
         self._current_channel = channel_id
@@ -1250,11 +4506,13 @@ class CoresXMLPage(ctk.CTkFrame):
         # Update details panel
         self._update_details_panel(channel, menu_name)
 
-    def _update_details_panel(self, channel: dict, menu_name: str):
+    def _update_details_panel(self, channel: dict, menu_name: str, rebuild: bool = False):
         """Update the details panel with content based on channel and menu."""
-        # Clear existing content
-        for widget in self._details_content.winfo_children():
-            widget.destroy()
+        canvas = self._details_scroll_frame._parent_canvas
+        self._hide_details_content()
+
+        key = (channel['entity_id'], menu_name)
+        view = None if rebuild else self._detail_views.get(key)
 
         # Update header
         self._details_header.configure(
@@ -1266,60 +4524,221 @@ class CoresXMLPage(ctk.CTkFrame):
             text=f"{channel['name']} — {menu_name}"
         )
 
+        if view is not None:
+            # Show the retained view where it was left; the worker below checks it is still current
+            self._detail_views.move_to_end(key)
+            self._details_content = view["frame"]
+            self._details_content.grid()
+            canvas.yview_moveto(view["scroll"])
+            canvas.after_idle(lambda: canvas.yview_moveto(view["scroll"]))
+        else:
+            self._details_content = ctk.CTkFrame(self._details_host, fg_color="transparent")
+            self._details_content.grid(row=0, column=0, sticky="nsew")
+            ctk.CTkLabel(
+                self._details_content, text="Loading…",
+                font=get_font(12), text_color=TEXT_DIM, anchor="w"
+            ).grid(row=0, column=0, sticky="w", pady=(0, 10))
+            canvas.yview_moveto(0)
+
+        loader = {
+            "Music Schedules": self._load_music_schedules,
+            "Timeline": self._load_timeline,
+            "Overriding Schedules": self._load_overriding_schedules,
+            "Logs": self._load_logs,
+        }.get(menu_name)
+        if loader is None:
+            return
+        self._watch_detail_sources(key, channel, menu_name)
+        cached_stamp = view["stamp"] if view is not None else None
+
+        def work(token: CancelToken):
+            profiles_folder = None
+            if menu_name in ("Music Schedules", "Timeline"):
+                profiles_folder = self._latest_profiles_folder(channel)
+            stamp = self._detail_view_stamp(channel, menu_name)
+            if stamp == cached_stamp:
+                return stamp, None, profiles_folder
+            token.check()
+            return stamp, loader(channel, token), profiles_folder
+
+        def done(result):
+            stamp, data, profiles_folder = result
+            if menu_name in ("Music Schedules", "Timeline"):
+                self._watch_profiles_folder(key, profiles_folder)
+            if data is not None:
+                self._build_detail_view(key, channel, menu_name, stamp, data)
+
+        # Supersedes whatever an earlier click was still loading
+        self._detail_tasks.start(work, done, lambda e: self._show_detail_error(key, e))
+
+    def _watch_detail_sources(self, key: tuple, channel: dict, menu_name: str):
+        """Watch the files behind the detail view on screen so it refreshes when they change."""
+        self._details_key = key
+        channel_num = channel.get('channel_number', 0)
+
+        def refresh():
+            # Another view may have been opened since
+            if self._details_key == key:
+                self._refresh_detail_view(channel, menu_name)
+
+        def changed(changes: list[FileChange]):
+            SCHEDULER.once("details-refresh", 0, refresh)
+
+        self._details_changed = changed
+        if menu_name in ("Music Schedules", "Timeline"):
+            base_folder = f"C:\\Kaleidovision\\music\\Channel{channel_num}"
+            FILE_WATCHER.watch("details", base_folder, changed, pattern=_FOLDER_RE)
+            return  # the Profiles folder is watched once the loading worker has found it
+        FILE_WATCHER.unwatch("details-profiles")
+        if menu_name == "Overriding Schedules":
+            FILE_WATCHER.watch(
+                "details", f"C:\\Kaleidovision\\local\\xmlFeeds\\xmlfeed.musicoverrideschedule.Channel{channel_num}.xml",
+                changed)
+        elif menu_name == "Logs":
+            # New/removed files only: today's logs are appended to all the time
+            FILE_WATCHER.watch(
+                "details", r"C:\Kaleidovision\logfiles", changed, modifications=False,
+                pattern=rf"(\.Channel{channel_num}\.\d{{8}}\.log(\.gz)?|\.zip|^McServiceAppLog\.log)$")
+
+    def _latest_profiles_folder(self, channel: dict) -> str | None:
+        """Profiles folder of the channel's newest music snapshot (runs on a worker thread)."""
+        base_folder = f"C:\\Kaleidovision\\music\\Channel{channel.get('channel_number', 0)}"
+        most_recent_folder = self._find_most_recent_folder(base_folder) if os.path.isdir(base_folder) else None
+        return os.path.join(most_recent_folder, "Profiles") if most_recent_folder else None
+
+    def _watch_profiles_folder(self, key: tuple, profiles_folder: str | None):
+        """Watch the Profiles tree behind a music view, if that view is still the one on screen."""
+        if self._details_key != key:
+            return
+        if profiles_folder:
+            FILE_WATCHER.watch("details-profiles", profiles_folder, self._details_changed, depth=None)
+        else:
+            FILE_WATCHER.unwatch("details-profiles")
+
+    def _refresh_detail_view(self, channel: dict, menu_name: str):
+        """Bring a view up to date: in place if it knows how, otherwise via the stamp-checked reload."""
+        view = self._detail_views.get((channel['entity_id'], menu_name))
+        if view is None or view.get("refresh") is None:
+            self._update_details_panel(channel, menu_name)
+            return
+        # Re-reads its sources on a worker and records the new stamp when it lands
+        view["refresh"](view)
+
+    def _unwatch_detail_sources(self):
+        self._details_key = None
+        FILE_WATCHER.unwatch("details")
+        FILE_WATCHER.unwatch("details-profiles")
+
+    def _hide_details_content(self):
+        """Take the shown view off screen: cached views are hidden, placeholders destroyed."""
+        current = self._details_content
+        self._details_content = None
+        if current is None:
+            return
+        for view in self._detail_views.values():
+            if view["frame"] is current:
+                view["scroll"] = self._details_scroll_frame._parent_canvas.yview()[0]
+                current.grid_remove()
+                return
+        current.destroy()
+
+    def _show_detail_error(self, key: tuple, error: Exception):
+        """Replace the view for *key* with why it could not be loaded, if it is still on screen."""
+        if self._details_key != key:
+            return
+        self._hide_details_content()
+        stale = self._detail_views.pop(key, None)
+        if stale is not None:
+            stale["frame"].destroy()
+
+        self._details_content = ctk.CTkFrame(self._details_host, fg_color="transparent")
+        self._details_content.grid(row=0, column=0, sticky="nsew")
+        ctk.CTkLabel(
+            self._details_content, text=f"Could not load {key[1]}: {error}",
+            font=get_font(12), text_color=TEXT_RED, anchor="w", justify="left"
+        ).grid(row=0, column=0, sticky="w", pady=(0, 10))
+
+    def _build_detail_view(self, key: tuple, channel: dict, menu_name: str, stamp: tuple, data: dict):
+        """Render freshly loaded data as the (new) cached view for *key*."""
+        self._hide_details_content()
+        stale = self._detail_views.pop(key, None)
+        if stale is not None:
+            stale["frame"].destroy()
+
+        self._details_content = ctk.CTkFrame(self._details_host, fg_color="transparent")
+        self._details_content.grid(row=0, column=0, sticky="nsew")
+        self._details_content.columnconfigure(0, weight=1)
+        self._details_content.rowconfigure(0, weight=1)
+        self._detail_views[key] = {"frame": self._details_content, "stamp": stamp, "scroll": 0.0}
+        while len(self._detail_views) > self.DETAIL_VIEWS_MAX:
+            _, oldest = self._detail_views.popitem(last=False)
+            oldest["frame"].destroy()
+
         # Reset scroll position to top
         self._details_scroll_frame._parent_canvas.yview_moveto(0)
 
-        # Create content based on menu type
+        # Create content based on menu type; a view that can update itself in place returns how
         if menu_name == "Music Schedules":
-            self._show_music_schedules(channel)
+            self._show_music_schedules(channel, data)
+        elif menu_name == "Timeline":
+            self._show_timeline(channel, data)
         elif menu_name == "Overriding Schedules":
-            self._show_overriding_schedules(channel)
+            self._detail_views[key]["refresh"] = self._show_overriding_schedules(channel, data)
         elif menu_name == "Logs":
-            self._show_logs(channel)
+            self._show_logs(channel, data)
+        RENDER_MODE.apply(self._details_content)
 
-    def _show_music_schedules(self, channel: dict):
-        """Display Music Schedules content with files from Channel[N]\\Profiles folder."""
+    def _detail_view_stamp(self, channel: dict, menu_name: str) -> tuple:
+        """Cheap stat() fingerprint of what a detail view was built from, used to spot stale cached views."""
+        channel_num = channel.get('channel_number', 0)
+        paths = []
+        if menu_name in ("Music Schedules", "Timeline"):
+            base_folder = f"C:\\Kaleidovision\\music\\Channel{channel_num}"
+            paths.append(base_folder)
+            most_recent_folder = self._find_most_recent_folder(base_folder) if os.path.isdir(base_folder) else None
+            if most_recent_folder:
+                # Profile files are edited in place, so include every file in the tree
+                for root, _, filenames in os.walk(os.path.join(most_recent_folder, "Profiles")):
+                    paths.append(root)
+                    paths.extend(os.path.join(root, fn) for fn in filenames)
+        elif menu_name == "Overriding Schedules":
+            paths.append(f"C:\\Kaleidovision\\local\\xmlFeeds\\xmlfeed.musicoverrideschedule.Channel{channel_num}.xml")
+        elif menu_name == "Logs":
+            paths.append(r"C:\Kaleidovision\logfiles")
+
+        stamp = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                stamp.append((path, st.st_size, st.st_mtime))
+            except OSError:
+                stamp.append((path, None, None))
+        return tuple(stamp)
+
+    def _load_music_schedules(self, channel: dict, token: CancelToken) -> dict:
+        """Scan the latest Profiles folder of a channel (runs on a worker thread)."""
         # Get channel number (sequential index) - NOT entity_id
         channel_num = channel.get('channel_number', 0)
         if not channel_num:
-            ctk.CTkLabel(
-                self._details_content, text="No channel number available.",
-                font=ctk.CTkFont(size=12), text_color=TEXT_DIM, anchor="w"
-            ).grid(row=0, column=0, sticky="w", pady=(0, 10))
-            return
+            return {'message': "No channel number available."}
 
         # Build base folder path: C:\Kaleidovision\music\Channel[N]
         base_folder = f"C:\\Kaleidovision\\music\\Channel{channel_num}"
 
         # Check if base folder exists
         if not os.path.exists(base_folder):
-            ctk.CTkLabel(
-                self._details_content,
-                text=f"Music folder not found:\n{base_folder}",
-                font=ctk.CTkFont(size=12), text_color=TEXT_DIM, anchor="w"
-            ).grid(row=0, column=0, sticky="w", pady=(0, 10))
-            return
+            return {'message': f"Music folder not found:\n{base_folder}"}
 
         # Find the most recent subfolder (format: YYYY-MM-DD-HHMM)
         most_recent_folder = self._find_most_recent_folder(base_folder)
         if not most_recent_folder:
-            ctk.CTkLabel(
-                self._details_content,
-                text=f"No valid date folders found in:\n{base_folder}",
-                font=ctk.CTkFont(size=12), text_color=TEXT_DIM, anchor="w"
-            ).grid(row=0, column=0, sticky="w", pady=(0, 10))
-            return
+            return {'message': f"No valid date folders found in:\n{base_folder}"}
 
         # Build full path to Profiles folder within the most recent date folder
         profiles_folder = os.path.join(most_recent_folder, "Profiles")
 
         if not os.path.exists(profiles_folder):
-            ctk.CTkLabel(
-                self._details_content,
-                text=f"Profiles folder not found:\n{profiles_folder}",
-                font=ctk.CTkFont(size=12), text_color=TEXT_DIM, anchor="w"
-            ).grid(row=0, column=0, sticky="w", pady=(0, 10))
-            return
+            return {'message': f"Profiles folder not found:\n{profiles_folder}"}
 
         # Scan for .olp and .djv files in Profiles folder and its subfolders
         music_files_by_folder = self._scan_music_files(profiles_folder)
@@ -1339,6 +4758,39 @@ class CoresXMLPage(ctk.CTkFrame):
         overlay_files.sort(key=lambda x: x['name'].lower())
         normal_files.sort(key=lambda x: x['name'].lower())
 
+        # Parse schedules here as well, so building the cards never touches the disk
+        for file_info in normal_files + overlay_files:
+            token.check()
+            file_info['schedule'] = self._parse_music_file_schedule(file_info['path'])
+
+        # Overlaps, gaps and overnight wraps, flagged on the file cards
+        token.check()
+        analysis = analyse_profile_schedules(normal_files)
+        for file_info in normal_files:
+            file_info['issues'] = analysis['by_file'].get(file_info['path'], [])
+
+        return {
+            'channel_num': channel_num,
+            'folder': most_recent_folder,
+            'overlay_files': overlay_files,
+            'normal_files': normal_files,
+            'analysis': analysis,
+        }
+
+    def _show_music_schedules(self, channel: dict, data: dict):
+        """Display Music Schedules content with files from Channel[N]\\Profiles folder."""
+        if 'message' in data:
+            ctk.CTkLabel(
+                self._details_content, text=data['message'],
+                font=get_font(12), text_color=TEXT_DIM, anchor="w"
+            ).grid(row=0, column=0, sticky="w", pady=(0, 10))
+            return
+
+        channel_num = data['channel_num']
+        most_recent_folder = data['folder']
+        overlay_files = data['overlay_files']
+        normal_files = data['normal_files']
+
         # Display folder info header
         folder_frame = ctk.CTkFrame(self._details_content, fg_color=CARD_BG, corner_radius=CORNER)
         folder_frame.grid(row=0, column=0, sticky="ew", pady=(0, 12))
@@ -1349,14 +4801,29 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkLabel(
             folder_frame,
             text=f"📁 Channel{channel_num} → {folder_name} → Profiles",
-            font=ctk.CTkFont(size=11), text_color=ACCENT, anchor="w"
+            font=get_font(11), text_color=ACCENT, anchor="w"
         ).grid(row=0, column=0, sticky="w", padx=12, pady=8)
 
+        base_folder = os.path.dirname(most_recent_folder)
+        if len(SNAPSHOT_INDEX.folders(base_folder)) > 1:
+            ctk.CTkButton(
+                folder_frame,
+                text="Compare snapshots",
+                width=130,
+                height=28,
+                corner_radius=4,
+                fg_color=DIVIDER,
+                hover_color=ACCENT,
+                text_color=TEXT_BRIGHT,
+                font=get_font(10),
+                command=lambda: self._compare_profiles_popup(channel_num, base_folder)
+            ).grid(row=0, column=1, sticky="e", padx=(8, 12), pady=8)
+
         if not overlay_files and not normal_files:
             ctk.CTkLabel(
                 folder_frame,
                 text="No .olp or .djv files found",
-                font=ctk.CTkFont(size=10), text_color=TEXT_DIM, anchor="w"
+                font=get_font(10), text_color=TEXT_DIM, anchor="w"
             ).grid(row=1, column=0, sticky="w", padx=12, pady=(0, 8))
             return
 
@@ -1365,8 +4832,9 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkLabel(
             folder_frame,
             text=f"{total_files} files found ({len(overlay_files)} overlays, {len(normal_files)} profiles)",
-            font=ctk.CTkFont(size=10), text_color=TEXT_DIM, anchor="w"
+            font=get_font(10), text_color=TEXT_DIM, anchor="w"
         ).grid(row=1, column=0, sticky="w", padx=12, pady=(0, 8))
+        self._show_schedule_analysis(folder_frame, data['analysis'], row=2)
 
         # Display all files in a single clean table
         files_frame = ctk.CTkFrame(self._details_content, fg_color="transparent")
@@ -1384,7 +4852,7 @@ class CoresXMLPage(ctk.CTkFrame):
             ctk.CTkLabel(
                 normal_header,
                 text="📁 Normal Profiles/Intersubs/On-Demands",
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=get_font(12, "bold"),
                 text_color=ACCENT, anchor="w"
             ).grid(row=0, column=0, sticky="w", padx=12, pady=8)
             
@@ -1402,7 +4870,7 @@ class CoresXMLPage(ctk.CTkFrame):
                 ctk.CTkLabel(
                     normal_table_header,
                     text=text.upper(),
-                    font=ctk.CTkFont(size=9, weight="bold"),
+                    font=get_font(9, "bold"),
                     text_color=TEXT_DIM, anchor=anchor
                 ).grid(row=0, column=col, sticky="w" if col == 0 else "ew", padx=(12 if col == 0 else 8, 8), pady=6)
             
@@ -1431,7 +4899,7 @@ class CoresXMLPage(ctk.CTkFrame):
             ctk.CTkLabel(
                 overlay_header,
                 text="🎭 Overlays",
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=get_font(12, "bold"),
                 text_color=ACCENT, anchor="w"
             ).grid(row=0, column=0, sticky="w", padx=12, pady=8)
             
@@ -1449,7 +4917,7 @@ class CoresXMLPage(ctk.CTkFrame):
                 ctk.CTkLabel(
                     overlay_table_header,
                     text=text.upper(),
-                    font=ctk.CTkFont(size=9, weight="bold"),
+                    font=get_font(9, "bold"),
                     text_color=TEXT_DIM, anchor=anchor
                 ).grid(row=0, column=col, sticky="w" if col == 0 else "ew", padx=(12 if col == 0 else 8, 8), pady=6)
             
@@ -1460,6 +4928,323 @@ class CoresXMLPage(ctk.CTkFrame):
                 file_card.grid(row=overlay_row, column=0, sticky="ew", pady=1)
                 overlay_row += 1
 
+    def _load_timeline(self, channel: dict, token: CancelToken) -> dict:
+        """Resolve the channel's profiles into this week's schedule index (runs on a worker thread)."""
+        data = self._load_music_schedules(channel, token)
+        if 'message' in data:
+            return data
+        token.check()
+        data['index'] = ScheduleIndex(data['normal_files'] + data['overlay_files'], week_start())
+        return data
+
+    def _show_timeline(self, channel: dict, data: dict):
+        """Draw the channel's week as a timeline with a "what plays at" lookup."""
+        if 'message' in data:
+            ctk.CTkLabel(
+                self._details_content, text=data['message'],
+                font=get_font(12), text_color=TEXT_DIM, anchor="w"
+            ).grid(row=0, column=0, sticky="w", pady=(0, 10))
+            return
+
+        index = data['index']
+        header = ctk.CTkFrame(self._details_content, fg_color=CARD_BG, corner_radius=CORNER)
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 12))
+        header.columnconfigure(4, weight=1)
+
+        ctk.CTkLabel(
+            header,
+            text=(f"📅 Week of {index.start.strftime('%d %b %Y')}  —  "
+                  f"Channel{data['channel_num']} → {os.path.basename(data['folder'])}"),
+            font=get_font(11), text_color=ACCENT, anchor="w"
+        ).grid(row=0, column=0, columnspan=5, sticky="w", padx=12, pady=(8, 4))
+
+        # "What plays at …" lookup
+        day_menu = ctk.CTkOptionMenu(
+            header, values=list(_WEEKDAY_NAMES), width=120, height=28,
+            fg_color="#2A1E1A", button_color=DIVIDER, button_hover_color=ACCENT,
+            text_color=TEXT_BRIGHT, font=get_font(11),
+        )
+        now = datetime.now()
+        day_menu.set(_WEEKDAY_NAMES[now.weekday()])
+        day_menu.grid(row=1, column=0, sticky="w", padx=(12, 6), pady=(0, 8))
+        time_entry = ctk.CTkEntry(header, width=70, height=28, font=get_font(11))
+        time_entry.insert(0, now.strftime("%H:%M"))
+        time_entry.grid(row=1, column=1, sticky="w", padx=(0, 6), pady=(0, 8))
+        result_lbl = ctk.CTkLabel(header, text="", font=get_font(11), text_color=TEXT_BRIGHT,
+                                  anchor="w", justify="left")
+        result_lbl.grid(row=2, column=0, columnspan=5, sticky="w", padx=12, pady=(0, 8))
+
+        def lookup(event=None):
+            minutes = _hhmm_minutes(time_entry.get().strip())
+            if minutes is None or minutes >= 24 * 60:
+                result_lbl.configure(text="Enter a time as HH:MM", text_color=TEXT_RED)
+                return
+            active = index.active_at_weekday(_WEEKDAY_NAMES.index(day_menu.get()), minutes)
+            lines = []
+            for entry in active:
+                if entry['kind'] == "overlay":
+                    every = f" (1 in every {entry['frequency'] + 1} tracks)" if entry['frequency'] is not None else ""
+                    lines.append(f"🎵 Overlay: {entry['name']}{every}")
+                else:
+                    lines.append(f"🎶 {entry['name']}")
+            if not any(entry['kind'] == "profile" for entry in active):
+                lines.insert(0, "⚠ No profile scheduled")
+            result_lbl.configure(text="\n".join(lines), text_color=TEXT_BRIGHT)
+
+        ctk.CTkButton(
+            header, text="What plays?", width=100, height=28, corner_radius=4,
+            fg_color=DIVIDER, hover_color=ACCENT, text_color=TEXT_BRIGHT, font=get_font(10),
+            command=lookup,
+        ).grid(row=1, column=2, sticky="w", padx=(0, 6), pady=(0, 8))
+        time_entry.bind("<Return>", lookup)
+        lookup()
+
+        # Week timeline: one row per day, normal profiles above a thin overlay strip
+        canvas = tk.Canvas(self._details_content, height=7 * 34 + 30, bg=CARD_BG, highlightthickness=0, bd=0)
+        canvas.grid(row=1, column=0, sticky="ew")
+        drawn_width = [0]
+
+        def draw(event=None):
+            width = canvas.winfo_width()
+            if width <= 1 or width == drawn_width[0]:
+                return
+            drawn_width[0] = width
+            canvas.delete("all")
+            left, top, row_h = 44, 22, 34
+            scale = (width - left - 10) / (24 * 60)
+            for hour in range(0, 25, 3):
+                x = left + hour * 60 * scale
+                canvas.create_line(x, top - 4, x, top + 7 * row_h, fill=DIVIDER)
+                canvas.create_text(x, top - 12, text=f"{hour:02d}", fill=TEXT_DIM, font=get_font(8))
+            for day in range(7):
+                day_start = index.start + timedelta(days=day)
+                y = top + day * row_h
+                canvas.create_text(6, y + row_h / 2, text=_WEEKDAY_NAMES[day][:3], anchor="w",
+                                   fill=TEXT_BRIGHT, font=get_font(9, "bold"))
+                for seg_start, seg_end, active in index.segments(day_start, day_start + timedelta(days=1)):
+                    x0 = left + (seg_start - day_start).total_seconds() / 60 * scale
+                    x1 = left + (seg_end - day_start).total_seconds() / 60 * scale
+                    profiles = [e for e in active if e['kind'] == "profile"]
+                    # Gaps and overlaps stand out; a single profile shows its name if it fits
+                    fill = "#3A1F1F" if not profiles else ("#1E4E7A" if len(profiles) == 1 else "#B26A00")
+                    canvas.create_rectangle(x0, y + 2, x1, y + row_h - 10, fill=fill, outline="")
+                    if len(profiles) == 1 and x1 - x0 > 60:
+                        canvas.create_text(x0 + 4, y + (row_h - 8) / 2, text=profiles[0]['name'], anchor="w",
+                                           fill=TEXT_BRIGHT, font=get_font(8), width=x1 - x0 - 8)
+                    if len(profiles) < len(active):
+                        canvas.create_rectangle(x0, y + row_h - 7, x1, y + row_h - 3, fill="#4CAF50", outline="")
+
+        canvas.bind("<Configure>", draw)
+
+        legend = ctk.CTkFrame(self._details_content, fg_color="transparent")
+        legend.grid(row=2, column=0, sticky="w", pady=(6, 0))
+        for color, text in (("#1E4E7A", "Profile"), ("#B26A00", "Overlapping profiles"),
+                            ("#3A1F1F", "No profile"), ("#4CAF50", "Overlay active")):
+            ctk.CTkLabel(legend, text="  ", fg_color=color, width=14, height=14, corner_radius=3).pack(side="left")
+            ctk.CTkLabel(legend, text=text, font=get_font(10), text_color=TEXT_DIM).pack(side="left", padx=(4, 12))
+
+        if data['overlay_files']:
+            self._show_overlay_forecast(data, row=3)
+
+    _FORECAST_RANGES = {"This week": 7, "Next 4 weeks": 28, "Next 13 weeks": 91, "Next 12 months": 365}
+
+    def _show_overlay_forecast(self, data: dict, row: int):
+        """Chart expected overlay insertions per day and per hour of day over a chosen range."""
+        frame = ctk.CTkFrame(self._details_content, fg_color=CARD_BG, corner_radius=CORNER)
+        frame.grid(row=row, column=0, sticky="ew", pady=(12, 0))
+        frame.columnconfigure(2, weight=1)
+
+        ctk.CTkLabel(
+            frame, text="🎵 Expected overlay insertions",
+            font=get_font(12, "bold"), text_color=ACCENT, anchor="w"
+        ).grid(row=0, column=0, sticky="w", padx=12, pady=8)
+        range_menu = ctk.CTkOptionMenu(
+            frame, values=list(self._FORECAST_RANGES), width=140, height=28,
+            fg_color="#2A1E1A", button_color=DIVIDER, button_hover_color=ACCENT,
+            text_color=TEXT_BRIGHT, font=get_font(11),
+        )
+        range_menu.set("This week")
+        range_menu.grid(row=0, column=1, sticky="w", padx=(0, 8), pady=8)
+        summary_lbl = ctk.CTkLabel(frame, text="", font=get_font(10), text_color=TEXT_DIM,
+                                   anchor="w", justify="left")
+        summary_lbl.grid(row=1, column=0, columnspan=3, sticky="w", padx=12, pady=(0, 6))
+        canvas = tk.Canvas(frame, height=230, bg=CARD_BG, highlightthickness=0, bd=0)
+        canvas.grid(row=2, column=0, columnspan=3, sticky="ew", padx=8, pady=(0, 8))
+
+        files = data['normal_files'] + data['overlay_files']
+        shown = {'forecast': None}
+        tasks = LatestTaskRunner(frame)
+        frame.bind("<Destroy>", lambda e: tasks.cancel(), add=True)
+
+        def draw(event=None):
+            forecast = shown['forecast']
+            width = canvas.winfo_width()
+            if forecast is None or width <= 1:
+                return
+            canvas.delete("all")
+            left, chart_w = 40, width - 50
+
+            def bars(values, top, height, title, labels):
+                canvas.create_text(4, top - 10, text=title, anchor="w", fill=TEXT_DIM, font=get_font(9))
+                peak = max(values, default=0) or 1
+                step = chart_w / max(len(values), 1)
+                canvas.create_text(left - 4, top, text=f"{peak:.0f}", anchor="e", fill=TEXT_DIM, font=get_font(8))
+                for i, value in enumerate(values):
+                    bar_h = value / peak * height
+                    x0 = left + i * step
+                    canvas.create_rectangle(x0 + 1, top + height - bar_h, x0 + max(step - 1, 2), top + height,
+                                            fill="#E91E63", outline="")
+                for i, text in labels:
+                    canvas.create_text(left + (i + 0.5) * step, top + height + 8, text=text,
+                                       fill=TEXT_DIM, font=get_font(8))
+
+            per_day = forecast.per_day()
+            every = max(1, len(per_day) // 12)
+            day_labels = [(d, (forecast.start + timedelta(days=d)).strftime("%a %d" if len(per_day) <= 14 else "%d %b"))
+                          for d in range(0, len(per_day), every)]
+            bars(per_day, 22, 70, "Per day", day_labels)
+            bars(forecast.hour_of_day(), 136, 70, "Average per hour of day",
+                 [(h, f"{h:02d}") for h in range(0, 24, 3)])
+
+        def show(forecast):
+            shown['forecast'] = forecast
+            summary_lbl.configure(text_color=TEXT_DIM)
+            if not forecast.total:
+                summary_lbl.configure(text="No overlay insertions expected in this range")
+            else:
+                per_day = forecast.per_day()
+                busiest = max(range(len(per_day)), key=per_day.__getitem__)
+                overlays = sorted(forecast.by_overlay.items(), key=lambda item: -item[1])
+                summary_lbl.configure(text=(
+                    f"≈ {forecast.total:.0f} insertions over {forecast.days} days at {TRACKS_PER_HOUR} tracks an hour · "
+                    f"busiest day {(forecast.start + timedelta(days=busiest)):%a %d %b} (≈ {per_day[busiest]:.0f})\n"
+                    + " · ".join(f"{name}: ≈ {count:.0f}" for name, count in overlays[:4])
+                ))
+            draw()
+
+        def show_error(e):
+            summary_lbl.configure(text=f"Could not work out the forecast: {e}", text_color=TEXT_RED)
+
+        def pick(choice):
+            days = self._FORECAST_RANGES[choice]
+            if days == 7:
+                show(OverlayForecast(data['index']))  # the timeline's week is already indexed
+                return
+            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            summary_lbl.configure(text="Working…", text_color=TEXT_DIM)
+            tasks.start(lambda token: OverlayForecast(ScheduleIndex(files, today, days)), show, show_error)
+
+        range_menu.configure(command=pick)
+        canvas.bind("<Configure>", draw)
+        pick("This week")
+
+    def _compare_profiles_popup(self, channel_num: int, base_folder: str):
+        """Open a popup listing profiles added, removed or changed between two snapshot folders."""
+        names = [name for _, name in reversed(SNAPSHOT_INDEX.folders(base_folder))]  # newest first
+        if len(names) < 2:
+            return
+
+        popup = ctk.CTkToplevel(self)
+        popup.title(f"Profile changes: Channel{channel_num}")
+        popup.geometry("800x600")
+        popup.resizable(True, True)
+
+        # Center the popup
+        popup.update_idletasks()
+        x = (popup.winfo_screenwidth() - 800) // 2
+        y = (popup.winfo_screenheight() - 600) // 2
+        popup.geometry(f"800x600+{x}+{y}")
+
+        popup.columnconfigure(0, weight=1)
+        popup.rowconfigure(1, weight=1)
+
+        # Header with the two snapshot folders
+        header = ctk.CTkFrame(popup, fg_color=CARD_BG, corner_radius=CORNER)
+        header.grid(row=0, column=0, sticky="ew", padx=12, pady=12)
+        header.columnconfigure(4, weight=1)
+
+        menu_style = dict(
+            values=names, width=170, height=28,
+            fg_color="#2A1E1A", button_color=DIVIDER, button_hover_color=ACCENT,
+            text_color=TEXT_BRIGHT, font=get_font(11),
+            command=lambda _: run(),
+        )
+        ctk.CTkLabel(header, text="From", font=get_font(11), text_color=TEXT_DIM).grid(
+            row=0, column=0, padx=(12, 6), pady=8)
+        from_menu = ctk.CTkOptionMenu(header, **menu_style)
+        from_menu.grid(row=0, column=1, padx=(0, 12), pady=8)
+        ctk.CTkLabel(header, text="To", font=get_font(11), text_color=TEXT_DIM).grid(
+            row=0, column=2, padx=(0, 6), pady=8)
+        to_menu = ctk.CTkOptionMenu(header, **menu_style)
+        to_menu.grid(row=0, column=3, padx=(0, 12), pady=8)
+        to_menu.set(names[0])
+        from_menu.set(names[1])
+        summary_lbl = ctk.CTkLabel(header, text="", font=get_font(11), text_color=TEXT_DIM, anchor="w")
+        summary_lbl.grid(row=0, column=4, sticky="w", padx=(0, 12), pady=8)
+
+        textbox = ctk.CTkTextbox(
+            popup,
+            font=get_font(11, family="Consolas"),
+            fg_color="#1A1A1A",
+            text_color=TEXT_BRIGHT,
+            border_color=DIVIDER,
+            border_width=1,
+            corner_radius=CORNER,
+            wrap="none",
+            state="disabled"
+        )
+        textbox.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 12))
+        textbox.tag_config("added", foreground=TEXT_GREEN)
+        textbox.tag_config("removed", foreground=TEXT_RED)
+        textbox.tag_config("changed", foreground=ACCENT)
+        textbox.tag_config("detail", foreground=TEXT_DIM)
+
+        ctk.CTkButton(
+            popup,
+            text="Close",
+            width=100,
+            fg_color=DIVIDER,
+            hover_color=ACCENT,
+            text_color=TEXT_BRIGHT,
+            command=popup.destroy
+        ).grid(row=2, column=0, pady=(0, 12))
+
+        # Only the latest pair picked is shown; hashes are cached, so going back is instant
+        tasks = LatestTaskRunner(popup)
+        popup.bind("<Destroy>", lambda e: tasks.cancel() if e.widget is popup else None, add=True)
+
+        def show(pair, changes):
+            counts = {kind: sum(1 for c in changes if c['kind'] == kind) for kind in ("added", "removed", "changed")}
+            summary_lbl.configure(
+                text=(f"{counts['added']} added, {counts['removed']} removed, {counts['changed']} changed"
+                      if changes else "No profile changes"),
+                text_color=TEXT_DIM)
+            textbox.configure(state="normal")
+            textbox.delete("0.0", "end")
+            marks = {"added": "+", "removed": "-", "changed": "~"}
+            for change in changes:
+                textbox.insert("end", f"{marks[change['kind']]} {change['path']}\n", change['kind'])
+                if change['kind'] == "changed" and not change['fields']:
+                    textbox.insert("end", "      content changed\n", "detail")
+                for name, before, after in change['fields']:
+                    textbox.insert("end", f"      {name}: {before} → {after}\n", "detail")
+            textbox.configure(state="disabled")
+
+        def failed(e):
+            summary_lbl.configure(text=f"Cannot compare: {e}", text_color=TEXT_RED)
+
+        def run():
+            pair = (from_menu.get(), to_menu.get())
+            old_folder, new_folder = (os.path.join(base_folder, name, "Profiles") for name in pair)
+            summary_lbl.configure(text="Comparing…", text_color=TEXT_DIM)
+            tasks.start(lambda token: compare_profile_sets(old_folder, new_folder, token),
+                        lambda changes: show(pair, changes), failed)
+
+        run()
+        RENDER_MODE.apply(popup)
+        popup.transient(self)
+        popup.focus_set()
+
     def _extract_music_schedule(self, entity_id: str) -> dict | None:
         """Extract music schedule data for a specific channel from the stored XML root."""
         if not hasattr(self, '_xml_root') or self._xml_root is None:
@@ -1508,39 +5293,9 @@ class CoresXMLPage(ctk.CTkFrame):
         return None
 
     def _find_most_recent_folder(self, base_folder: str) -> str | None:
-        """Find the most recent folder by parsing date from folder names (format: YYYY-MM-DD-HHMM)."""
-        try:
-            folders = []
-            for entry in os.scandir(base_folder):
-                if entry.is_dir():
-                    folder_name = entry.name
-                    # Parse format: YYYY-MM-DD-HHMM (e.g., 2026-02-09-1002)
-                    try:
-                        parts = folder_name.split('-')
-                        if len(parts) == 4:
-                            year = int(parts[0])
-                            month = int(parts[1])
-                            day = int(parts[2])
-                            time_str = parts[3]
-                            hour = int(time_str[:2]) if len(time_str) >= 2 else 0
-                            minute = int(time_str[2:4]) if len(time_str) >= 4 else 0
-                            
-                            # Create datetime for comparison
-                            dt = datetime(year, month, day, hour, minute)
-                            folders.append((dt, entry.path))
-                    except (ValueError, IndexError):
-                        # Skip folders that don't match the expected format
-                        continue
-            
-            if not folders:
-                return None
-            
-            # Sort by datetime (most recent first) and return the path
-            folders.sort(reverse=True)
-            return folders[0][1]
-        except Exception as e:
-            print(f"Error finding most recent folder in {base_folder}: {e}")
-            return None
+        """Full path of the most recent YYYY-MM-DD-HHMM folder in *base_folder*."""
+        latest_name = SNAPSHOT_INDEX.latest(base_folder)
+        return os.path.join(base_folder, latest_name) if latest_name else None
 
     def _scan_music_files(self, folder_path: str) -> dict[str, list[dict]]:
         """Scan folder and its subfolders for .olp and .djv music profile files.
@@ -1606,6 +5361,7 @@ class CoresXMLPage(ctk.CTkFrame):
             'name': '',
             'raw_start': '',
             'raw_end': '',
+            'raw_day': '',
             'indate': '',
             'outdate': '',
             'hidden': 'NO',  # Default to not hidden
@@ -1635,6 +5391,7 @@ class CoresXMLPage(ctk.CTkFrame):
                 schedule['start_time'] = self._format_time(start_time)
                 schedule['end_time'] = self._format_time(end_time)
                 schedule['day_of_week'] = self._map_day_of_week(day_of_week)
+                schedule['raw_day'] = day_of_week
                 schedule['name'] = name
                 schedule['indate'] = indate
                 schedule['outdate'] = outdate
@@ -1721,6 +5478,36 @@ class CoresXMLPage(ctk.CTkFrame):
         }
         return mapping.get(dow, dow)
 
+    def _show_schedule_analysis(self, parent, analysis: dict, row: int):
+        """Summarise a channel's profile overlaps, gaps and overnight wraps under the folder header."""
+        if not analysis['overlaps'] and not analysis['gaps'] and not analysis['wraps']:
+            ctk.CTkLabel(
+                parent, text="✓ No overlapping profiles or gaps in the weekly schedule",
+                font=get_font(10), text_color=TEXT_GREEN, anchor="w"
+            ).grid(row=row, column=0, columnspan=2, sticky="w", padx=12, pady=(0, 8))
+            return
+
+        counts = []
+        if analysis['overlaps']:
+            counts.append(f"{len(analysis['overlaps'])} overlapping profile pair(s)")
+        if analysis['gaps']:
+            counts.append(f"{len(analysis['gaps'])} gap(s) with no profile")
+        if analysis['wraps']:
+            counts.append(f"{len(analysis['wraps'])} profile(s) running past midnight")
+        lines = ["⚠ " + " · ".join(counts)]
+
+        today = datetime.now().date()
+        for start, end, first in analysis['gaps'][:6]:
+            since = f" (from {first:%d %b %Y})" if first.date() > today else ""
+            lines.append(f"    No profile {_format_week_span(start, end)}{since}")
+        if len(analysis['gaps']) > 6:
+            lines.append(f"    … {len(analysis['gaps']) - 6} more gaps")
+
+        ctk.CTkLabel(
+            parent, text="\n".join(lines), justify="left",
+            font=get_font(10), text_color="#FF9800", anchor="w"
+        ).grid(row=row, column=0, columnspan=2, sticky="w", padx=12, pady=(0, 8))
+
     def _create_music_file_card(self, parent, file_info: dict, row: int) -> ctk.CTkFrame:
         """Create a file entry row with View and Edit buttons."""
         card = ctk.CTkFrame(parent, fg_color=CARD_BG if row % 2 == 0 else "#2A2A2A", corner_radius=0)
@@ -1729,8 +5516,8 @@ class CoresXMLPage(ctk.CTkFrame):
         card.columnconfigure(2, weight=0, minsize=120)  # Modified
         card.columnconfigure(3, weight=0, minsize=120)  # Actions
 
-        # Parse schedule info from file
-        schedule = self._parse_music_file_schedule(file_info['path'])
+        # Parse schedule info from file (normally already done by the loader)
+        schedule = file_info.get('schedule') or self._parse_music_file_schedule(file_info['path'])
         
         # Create name column frame to hold filename and schedule
         name_frame = ctk.CTkFrame(card, fg_color="transparent")
@@ -1744,7 +5531,7 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkLabel(
             name_frame,
             text=f"{icon} {file_info['name']}",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=get_font(11, "bold"),
             text_color=TEXT_BRIGHT, anchor="w"
         ).grid(row=0, column=0, sticky="w")
         
@@ -1777,7 +5564,7 @@ class CoresXMLPage(ctk.CTkFrame):
             schedule_label = ctk.CTkLabel(
                 name_frame,
                 text=schedule_text,
-                font=ctk.CTkFont(size=11, weight="bold"),
+                font=get_font(11, "bold"),
                 text_color=text_color,
                 fg_color=bg_color,
                 corner_radius=4,
@@ -1793,7 +5580,7 @@ class CoresXMLPage(ctk.CTkFrame):
             ctk.CTkLabel(
                 name_frame,
                 text=f"🎶 {name_display}",
-                font=ctk.CTkFont(size=11),
+                font=get_font(11),
                 text_color=text_color,
                 anchor="w"
             ).grid(row=current_row, column=0, sticky="w", pady=(0, 4))
@@ -1814,7 +5601,7 @@ class CoresXMLPage(ctk.CTkFrame):
             ctk.CTkLabel(
                 in_out_frame,
                 text="In-Out Dates: ",
-                font=ctk.CTkFont(size=9),
+                font=get_font(9),
                 text_color=TEXT_DIM,
                 anchor="w"
             ).pack(side="left")
@@ -1823,7 +5610,7 @@ class CoresXMLPage(ctk.CTkFrame):
             ctk.CTkLabel(
                 in_out_frame,
                 text=in_formatted,
-                font=ctk.CTkFont(size=9, weight="bold"),
+                font=get_font(9, "bold"),
                 text_color=in_color,
                 anchor="w"
             ).pack(side="left", padx=(0, 8))
@@ -1832,7 +5619,7 @@ class CoresXMLPage(ctk.CTkFrame):
             ctk.CTkLabel(
                 in_out_frame,
                 text=" - ",
-                font=ctk.CTkFont(size=9),
+                font=get_font(9),
                 text_color=TEXT_DIM,
                 anchor="w"
             ).pack(side="left")
@@ -1841,11 +5628,25 @@ class CoresXMLPage(ctk.CTkFrame):
             ctk.CTkLabel(
                 in_out_frame,
                 text=out_formatted,
-                font=ctk.CTkFont(size=9, weight="bold"),
+                font=get_font(9, "bold"),
                 text_color=out_color,
                 anchor="w"
             ).pack(side="left")
         
+        # Overlaps and overnight wraps found by the schedule analysis
+        issues = file_info.get('issues') or []
+        if issues:
+            shown = issues[:3] + ([f"… {len(issues) - 3} more"] if len(issues) > 3 else [])
+            ctk.CTkLabel(
+                name_frame,
+                text="\n".join(f"⚠ {issue}" for issue in shown),
+                font=get_font(9),
+                text_color="#FF9800",
+                justify="left",
+                anchor="w"
+            ).grid(row=current_row, column=0, sticky="w", pady=(2, 4))
+            current_row += 1
+
         # For overlay files, display frequency ranges from INTER-PROFILE
         if file_info['type'] == "OLP Profile" and schedule['frequency_ranges']:
             freq_container = ctk.CTkFrame(name_frame, fg_color="transparent")
@@ -1876,7 +5677,7 @@ class CoresXMLPage(ctk.CTkFrame):
                 ctk.CTkLabel(
                     range_card,
                     text=tracks_text,
-                    font=ctk.CTkFont(size=9, weight="bold"),
+                    font=get_font(9, "bold"),
                     text_color="white",
                     fg_color="#E91E63",
                     corner_radius=10,
@@ -1888,7 +5689,7 @@ class CoresXMLPage(ctk.CTkFrame):
                 ctk.CTkLabel(
                     range_card,
                     text=f"In:    {in_date}",
-                    font=ctk.CTkFont(size=9),
+                    font=get_font(9),
                     text_color="#FF6B6B",
                     anchor="w"
                 ).grid(row=0, column=1, sticky="w", padx=(0, 12), pady=(6, 0))
@@ -1896,7 +5697,7 @@ class CoresXMLPage(ctk.CTkFrame):
                 ctk.CTkLabel(
                     range_card,
                     text=f"Out:  {out_date}",
-                    font=ctk.CTkFont(size=9),
+                    font=get_font(9),
                     text_color="#FF9E9E",
                     anchor="w"
                 ).grid(row=1, column=1, sticky="w", padx=(0, 12), pady=0)
@@ -1904,7 +5705,7 @@ class CoresXMLPage(ctk.CTkFrame):
                 ctk.CTkLabel(
                     range_card,
                     text=f"Time: {start_time} - {end_time}",
-                    font=ctk.CTkFont(size=9),
+                    font=get_font(9),
                     text_color=TEXT_DIM,
                     anchor="w"
                 ).grid(row=2, column=1, sticky="w", padx=(0, 12), pady=(0, 6))
@@ -1921,14 +5722,14 @@ class CoresXMLPage(ctk.CTkFrame):
             ctk.CTkLabel(
                 hidden_frame,
                 text="🚫",
-                font=ctk.CTkFont(size=12),
+                font=get_font(12),
                 anchor="w"
             ).pack(side="left", padx=(0, 4))
             
             ctk.CTkLabel(
                 hidden_frame,
                 text="HIDDEN",
-                font=ctk.CTkFont(size=9, weight="bold"),
+                font=get_font(9, "bold"),
                 text_color="white",
                 fg_color="#FF5722",  # Deep orange for warning
                 corner_radius=6,
@@ -1939,7 +5740,7 @@ class CoresXMLPage(ctk.CTkFrame):
             ctk.CTkLabel(
                 hidden_frame,
                 text="(Not visible in player)",
-                font=ctk.CTkFont(size=9),
+                font=get_font(9),
                 text_color="#FF9E80",
                 anchor="w"
             ).pack(side="left", padx=(6, 0))
@@ -1952,14 +5753,14 @@ class CoresXMLPage(ctk.CTkFrame):
             ctk.CTkLabel(
                 hidden_frame,
                 text="👁️",
-                font=ctk.CTkFont(size=11),
+                font=get_font(11),
                 anchor="w"
             ).pack(side="left", padx=(0, 4))
             
             ctk.CTkLabel(
                 hidden_frame,
                 text="VISIBLE",
-                font=ctk.CTkFont(size=9, weight="bold"),
+                font=get_font(9, "bold"),
                 text_color="#4CAF50",  # Green for visible
                 anchor="w"
             ).pack(side="left")
@@ -1968,7 +5769,7 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkLabel(
             card,
             text=file_info['size'],
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color=TEXT_DIM, anchor="center"
         ).grid(row=0, column=1, sticky="ew", padx=8, pady=8)
 
@@ -1976,7 +5777,7 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkLabel(
             card,
             text=file_info['modified'],
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color=TEXT_DIM, anchor="center"
         ).grid(row=0, column=2, sticky="ew", padx=8, pady=8)
 
@@ -1994,27 +5795,163 @@ class CoresXMLPage(ctk.CTkFrame):
             fg_color=DIVIDER,
             hover_color=ACCENT,
             text_color=TEXT_BRIGHT,
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             command=lambda path=file_info['path']: self._view_file_popup(path)
         )
         view_btn.pack(side="left", padx=(0, 4))
 
-        # Edit button
-        edit_btn = ctk.CTkButton(
-            actions_frame,
-            text="Edit",
-            width=50,
-            height=28,
-            corner_radius=4,
-            fg_color=DIVIDER,
-            hover_color=ACCENT,
+        # Edit button
+        edit_btn = ctk.CTkButton(
+            actions_frame,
+            text="Edit",
+            width=50,
+            height=28,
+            corner_radius=4,
+            fg_color=DIVIDER,
+            hover_color=ACCENT,
+            text_color=TEXT_BRIGHT,
+            font=get_font(10),
+            command=lambda path=file_info['path']: self._edit_file_with_notepad(path)
+        )
+        edit_btn.pack(side="left")
+
+        if file_info['name'].lower().endswith('.djv'):
+            ctk.CTkButton(
+                actions_frame,
+                text="Simulate",
+                width=70,
+                height=28,
+                corner_radius=4,
+                fg_color=DIVIDER,
+                hover_color=ACCENT,
+                text_color=TEXT_BRIGHT,
+                font=get_font(10),
+                command=lambda info=file_info: self._playout_popup(info)
+            ).pack(side="left", padx=(4, 0))
+
+        return card
+
+    def _playout_popup(self, file_info: dict):
+        """Open a popup simulating a day's play sequence for a .djv profile."""
+        schedule = file_info.get('schedule') or self._parse_music_file_schedule(file_info['path'])
+        start = _hhmm_minutes(schedule.get('raw_start', '')) or 0
+        end = _hhmm_minutes(schedule.get('raw_end', ''))
+        if end is None:
+            hours = 24
+        else:
+            start, end = _window_minutes(start, end)
+            hours = (end - start) / 60
+        track_minutes = 60 / TRACKS_PER_HOUR
+
+        popup = ctk.CTkToplevel(self)
+        popup.title(f"Playout: {file_info['name']}")
+        popup.geometry("800x600")
+        popup.resizable(True, True)
+
+        # Center the popup
+        popup.update_idletasks()
+        x = (popup.winfo_screenwidth() - 800) // 2
+        y = (popup.winfo_screenheight() - 600) // 2
+        popup.geometry(f"800x600+{x}+{y}")
+
+        popup.columnconfigure(0, weight=1)
+        popup.rowconfigure(1, weight=1)
+
+        header = ctk.CTkFrame(popup, fg_color=CARD_BG, corner_radius=CORNER)
+        header.grid(row=0, column=0, sticky="ew", padx=12, pady=12)
+        header.columnconfigure(5, weight=1)
+
+        ctk.CTkLabel(header, text="Tracks", font=get_font(11), text_color=TEXT_DIM).grid(
+            row=0, column=0, padx=(12, 6), pady=8)
+        tracks_entry = ctk.CTkEntry(header, width=80, height=28, font=get_font(11))
+        tracks_entry.insert(0, str(round(hours * TRACKS_PER_HOUR)))
+        tracks_entry.grid(row=0, column=1, padx=(0, 12), pady=8)
+        ctk.CTkLabel(header, text="Seed", font=get_font(11), text_color=TEXT_DIM).grid(
+            row=0, column=2, padx=(0, 6), pady=8)
+        seed_entry = ctk.CTkEntry(header, width=70, height=28, font=get_font(11))
+        seed_entry.insert(0, "1")
+        seed_entry.grid(row=0, column=3, padx=(0, 12), pady=8)
+        summary_lbl = ctk.CTkLabel(header, text="", font=get_font(11), text_color=TEXT_DIM,
+                                   anchor="w", justify="left")
+        summary_lbl.grid(row=1, column=0, columnspan=6, sticky="w", padx=12, pady=(0, 8))
+
+        textbox = ctk.CTkTextbox(
+            popup,
+            font=get_font(11, family="Consolas"),
+            fg_color="#1A1A1A",
             text_color=TEXT_BRIGHT,
-            font=ctk.CTkFont(size=10),
-            command=lambda path=file_info['path']: self._edit_file_with_notepad(path)
+            border_color=DIVIDER,
+            border_width=1,
+            corner_radius=CORNER,
+            wrap="none",
+            state="disabled"
         )
-        edit_btn.pack(side="left")
+        textbox.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 12))
+        textbox.tag_config("repeat", foreground="#FF9800")
+        textbox.tag_config("detail", foreground=TEXT_DIM)
 
-        return card
+        tasks = LatestTaskRunner(popup)
+        popup.bind("<Destroy>", lambda e: tasks.cancel() if e.widget is popup else None, add=True)
+        max_lines = 2000
+
+        def show(sim):
+            if not sim.plays:
+                summary_lbl.configure(text="No PLAY-MEDIA-CLIP entries in this profile", text_color=TEXT_RED)
+                return
+            order = "random order" if sim.random else "in order"
+            distance = f"artist clash distance {sim.clash_distance}"
+            if sim.effective_distance != sim.clash_distance:
+                distance += f" (at most {sim.effective_distance} with {len(sim.uids)} clips)"
+            gap = (f"a clip comes back after {sim.mean_gap:.0f} tracks on average "
+                   f"(≈ {sim.mean_gap * track_minutes / 60:.1f} h), {sim.min_gap} at the closest"
+                   if sim.gaps else "no clip plays twice")
+            summary_lbl.configure(text_color=TEXT_DIM, text=(
+                f"{sim.plays} tracks from {len(sim.uids)} clips, {order}, {distance}\n"
+                f"Repeat rate {sim.repeat_rate:.0%} · {sim.repeats_within(TRACKS_PER_HOUR):.1%} of plays repeat "
+                f"a clip heard in the last hour · {gap}"
+                + (f" · {sim.clashes} forced artist clashes" if sim.clashes else "")
+            ))
+
+            textbox.configure(state="normal")
+            textbox.delete("0.0", "end")
+            textbox.insert("end", "Most played:\n", "detail")
+            for uid, count in sim.most_played():
+                textbox.insert("end", f"  {count:>5}×  {uid}\n", "detail")
+            textbox.insert("end", "\n")
+            last = {}
+            for pos, clip in enumerate(sim.sequence[:max_lines]):
+                minute = int(start + pos * track_minutes) % (24 * 60)
+                repeat = clip in last and pos - last[clip] <= TRACKS_PER_HOUR
+                textbox.insert("end", f"{minute // 60:02d}:{minute % 60:02d}  {pos + 1:>6}  {sim.uids[clip]}\n",
+                               "repeat" if repeat else ())
+                last[clip] = pos
+            if sim.plays > max_lines:
+                textbox.insert("end", f"… {sim.plays - max_lines} more tracks\n", "detail")
+            textbox.configure(state="disabled")
+
+        def show_error(e):
+            summary_lbl.configure(text=f"Could not read profile: {e}", text_color=TEXT_RED)
+
+        def run(event=None):
+            tracks_text, seed_text = tracks_entry.get().strip(), seed_entry.get().strip()
+            if not tracks_text.isdigit() or not seed_text.lstrip("-").isdigit():
+                summary_lbl.configure(text="Tracks and seed must be whole numbers", text_color=TEXT_RED)
+                return
+            tracks, seed = min(int(tracks_text), 100000), int(seed_text)
+            summary_lbl.configure(text="Simulating…", text_color=TEXT_DIM)
+            tasks.start(
+                lambda token: PlayoutSimulation(load_profile_playlist(file_info['path']), tracks, seed),
+                show, show_error,
+            )
+
+        ctk.CTkButton(
+            header, text="Run", width=70, height=28, corner_radius=4,
+            fg_color=DIVIDER, hover_color=ACCENT, text_color=TEXT_BRIGHT, font=get_font(10),
+            command=run,
+        ).grid(row=0, column=4, sticky="w", pady=8)
+        tracks_entry.bind("<Return>", run)
+        seed_entry.bind("<Return>", run)
+        run()
 
     def _view_file_popup(self, file_path: str):
         """Open a popup window showing file contents in a read-only textarea."""
@@ -2042,7 +5979,7 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkLabel(
             header,
             text=f"📄 {os.path.basename(file_path)}",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color=ACCENT, anchor="w"
         ).grid(row=0, column=0, sticky="w", padx=12, pady=8)
         
@@ -2061,7 +5998,7 @@ class CoresXMLPage(ctk.CTkFrame):
         
         textbox = ctk.CTkTextbox(
             text_frame,
-            font=ctk.CTkFont(family="Consolas", size=11),
+            font=get_font(11, family="Consolas"),
             fg_color="#1A1A1A",
             text_color=TEXT_BRIGHT,
             border_color=DIVIDER,
@@ -2103,23 +6040,37 @@ class CoresXMLPage(ctk.CTkFrame):
             except Exception as e2:
                 print(f"Error opening file: {e2}")
 
-    def _show_overriding_schedules(self, channel: dict):
-        """Display Overriding Schedules content from xmlfeed.musicoverrideschedule.Channel[N].xml."""
+    def _load_overriding_schedules(self, channel: dict, token: CancelToken) -> dict:
+        """Parse a channel's override schedule feed (runs on a worker thread)."""
         # Get channel number (sequential index)
         channel_num = channel.get('channel_number', 0)
         if not channel_num:
+            return {'message': "No channel number available."}
+
+        # Build file path: C:\Kaleidovision\local\xmlFeeds\xmlfeed.musicoverrideschedule.Channel[N].xml
+        file_path = f"C:\\Kaleidovision\\local\\xmlFeeds\\xmlfeed.musicoverrideschedule.Channel{channel_num}.xml"
+
+        # Check if file exists
+        if not os.path.exists(file_path):
+            return {'file_path': file_path, 'entries': None}
+
+        try:
+            entries = parse_override_schedule(file_path)
+        except (OSError, ET.ParseError) as e:
+            return {'file_path': file_path, 'entries': [], 'error': f"[Error reading file: {e}]"}
+        return {'file_path': file_path, 'entries': entries}
+
+    def _show_overriding_schedules(self, channel: dict, data: dict):
+        """Display the override entries of xmlfeed.musicoverrideschedule.Channel[N].xml as a table."""
+        if 'message' in data:
             ctk.CTkLabel(
-                self._details_content, text="No channel number available.",
-                font=ctk.CTkFont(size=12), text_color=TEXT_DIM, anchor="w"
+                self._details_content, text=data['message'],
+                font=get_font(12), text_color=TEXT_DIM, anchor="w"
             ).grid(row=0, column=0, sticky="w", pady=(0, 10))
-            return
-
-        # Store channel and file path for refresh
-        self._current_overriding_channel = channel
-        self._current_overriding_file_path = f"C:\\Kaleidovision\\local\\xmlFeeds\\xmlfeed.musicoverrideschedule.Channel{channel_num}.xml"
+            return None
 
-        # Build file path: C:\Kaleidovision\local\xmlFeeds\xmlfeed.musicoverrideschedule.Channel[N].xml
-        file_path = self._current_overriding_file_path
+        file_path = data['file_path']
+        entries = data['entries']
 
         # Display file path header with refresh button
         header_frame = ctk.CTkFrame(self._details_content, fg_color=CARD_BG, corner_radius=CORNER)
@@ -2130,7 +6081,7 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkLabel(
             header_frame,
             text=f"📄 {file_path}",
-            font=ctk.CTkFont(size=11), text_color=ACCENT, anchor="w"
+            font=get_font(11), text_color=ACCENT, anchor="w"
         ).grid(row=0, column=0, sticky="w", padx=12, pady=8)
 
         # Refresh button
@@ -2143,85 +6094,227 @@ class CoresXMLPage(ctk.CTkFrame):
             fg_color=DIVIDER,
             hover_color=ACCENT,
             text_color=TEXT_BRIGHT,
-            font=ctk.CTkFont(size=10),
-            command=lambda: self._refresh_overriding_schedules()
+            font=get_font(10),
+            # Until there is a table to update, refreshing rebuilds the view
+            command=lambda: self._update_details_panel(channel, "Overriding Schedules", rebuild=True)
         )
         refresh_btn.grid(row=0, column=1, sticky="e", padx=(8, 12), pady=8)
 
         # Check if file exists
-        if not os.path.exists(file_path):
+        if entries is None:
             ctk.CTkLabel(
                 header_frame,
                 text="File not found",
-                font=ctk.CTkFont(size=10), text_color=TEXT_DIM, anchor="w"
+                font=get_font(10), text_color=TEXT_DIM, anchor="w"
             ).grid(row=1, column=0, columnspan=2, sticky="w", padx=12, pady=(0, 8))
-            return
-
-        # Read and display file content
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-        except Exception as e:
-            content = f"[Error reading file: {e}]"
+            return None
 
-        # Content textbox - fill available vertical space
-        text_frame = ctk.CTkFrame(self._details_content, fg_color=CARD_BG, corner_radius=CORNER)
-        text_frame.grid(row=1, column=0, sticky="nsew")
-        text_frame.columnconfigure(0, weight=1)
-        text_frame.rowconfigure(0, weight=1)
-        
-        # Make details_content expand to fill available space
-        self._details_content.rowconfigure(1, weight=1)
+        status_lbl = ctk.CTkLabel(
+            header_frame, text="",
+            font=get_font(10), text_color=TEXT_DIM, anchor="w"
+        )
+        status_lbl.grid(row=1, column=0, sticky="w", padx=12, pady=(0, 8))
 
-        content_box = ctk.CTkTextbox(
-            text_frame,
-            font=ctk.CTkFont(family="Consolas", size=11),
-            fg_color="#1A1A1A",
+        ctk.CTkButton(
+            header_frame,
+            text="View raw",
+            width=80,
+            height=28,
+            corner_radius=4,
+            fg_color=DIVIDER,
+            hover_color=ACCENT,
             text_color=TEXT_BRIGHT,
-            border_color=DIVIDER,
-            border_width=1,
-            corner_radius=CORNER,
-            wrap="word"
-        )
-        content_box.grid(row=0, column=0, sticky="nsew", padx=12, pady=12)
-        content_box.insert("0.0", content)
-        content_box.configure(state="disabled")
-        
-        # Store reference to content box for refresh
-        self._overriding_content_box = content_box
+            font=get_font(10),
+            command=lambda: self._view_file_popup(file_path)
+        ).grid(row=1, column=1, sticky="e", padx=(8, 12), pady=(0, 8))
+
+        # One row per override entry; rows are kept and updated in place on refresh
+        table_frame = ctk.CTkFrame(self._details_content, fg_color=CARD_BG, corner_radius=CORNER)
+        table_frame.grid(row=1, column=0, sticky="nsew")
+        for col, weight in enumerate((0, 3, 1, 3, 2)):
+            table_frame.columnconfigure(col, weight=weight)
+        for col, heading in enumerate(("", "Profile", "Days", "Dates", "Times")):
+            ctk.CTkLabel(
+                table_frame, text=heading,
+                font=get_font(11, "bold"), text_color=TEXT_DIM, anchor="w"
+            ).grid(row=0, column=col, sticky="w", padx=(12, 6), pady=(10, 4))
+
+        table = {
+            'frame': table_frame,
+            'file_path': file_path,
+            'entries': [],
+            'rows': {},
+            'status': status_lbl,
+            'empty': None,
+        }
+        self._apply_override_entries(table, entries, data.get('error'), mark=False)
+
+        # Refresh this view's own table (other channels' views may be cached alongside it)
+        refresh_btn.configure(command=lambda: self._refresh_detail_view(channel, "Overriding Schedules"))
+        return lambda view: self._refresh_overriding_schedules(channel, table, view)
+
+    def _refresh_overriding_schedules(self, channel: dict, table: dict, view: dict):
+        """Re-read the feed on a worker, then update only the rows that changed since the last refresh."""
+        key = (channel['entity_id'], "Overriding Schedules")
+        file_path = table['file_path']
 
-    def _refresh_overriding_schedules(self):
-        """Refresh the Overriding Schedules view with latest file content."""
-        if hasattr(self, '_current_overriding_file_path') and self._current_overriding_file_path:
+        def work(token: CancelToken):
+            stamp = self._detail_view_stamp(channel, "Overriding Schedules")
+            token.check()
             try:
-                with open(self._current_overriding_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                # Update the content box if it exists
-                if hasattr(self, '_overriding_content_box') and self._overriding_content_box:
-                    self._overriding_content_box.configure(state="normal")
-                    self._overriding_content_box.delete("0.0", "end")
-                    self._overriding_content_box.insert("0.0", content)
-                    self._overriding_content_box.configure(state="disabled")
-            except Exception as e:
-                print(f"Error refreshing file: {e}")
+                return stamp, parse_override_schedule(file_path), None
+            except (OSError, ET.ParseError) as e:
+                return stamp, None, f"[Error reading file: {e}]"
+
+        def done(result):
+            stamp, entries, error = result
+            self._apply_override_entries(table, table['entries'] if entries is None else entries, error, mark=True)
+            view["stamp"] = stamp
+
+        # Shares the panel's runner, so opening another view supersedes it
+        self._detail_tasks.start(work, done, lambda e: self._show_detail_error(key, e))
+
+    def _apply_override_entries(self, table: dict, entries: list[dict], error: str | None, mark: bool):
+        """Diff *entries* against the table's rows and touch only added, changed and removed ones."""
+        frame = table['frame']
+        rows = table['rows']
+        added, changed, removed = diff_override_entries(table['entries'], entries)
+
+        for key in removed:
+            for widget in rows.pop(key):
+                widget.destroy()
+
+        for position, entry in enumerate(entries, start=1):
+            key = entry['key']
+            if key in added:
+                rows[key] = [
+                    ctk.CTkLabel(frame, text="", font=get_font(11), text_color=TEXT_BRIGHT,
+                                 anchor="w", justify="left")
+                    for _ in range(5)
+                ]
+                marker = "● new" if mark else ""
+            elif key in changed:
+                marker = "● changed"
+            else:
+                marker = ""
+            labels = rows[key]
+            if key in added or key in changed:
+                for label, text in zip(labels[1:], self._override_cells(entry)):
+                    label.configure(text=text)
+            if labels[0].cget("text") != marker:
+                labels[0].configure(text=marker, text_color=ACCENT)
+            # Keep the file's order; re-gridding an existing label is cheap
+            for col, label in enumerate(labels):
+                label.grid(row=position, column=col, sticky="w", padx=(12, 6), pady=2)
+
+        if table['empty'] is not None:
+            table['empty'].destroy()
+            table['empty'] = None
+        if not entries:
+            table['empty'] = ctk.CTkLabel(
+                frame, text=error or "No override entries in this feed.",
+                font=get_font(11), text_color=TEXT_RED if error else TEXT_DIM, anchor="w"
+            )
+            table['empty'].grid(row=1, column=0, columnspan=5, sticky="w", padx=12, pady=(4, 10))
+
+        table['entries'] = entries
+        if error:
+            table['status'].configure(text=error, text_color=TEXT_RED)
+        else:
+            summary = f"{len(entries)} override entr{'y' if len(entries) == 1 else 'ies'}"
+            if mark:
+                summary += (f"  —  {len(added)} new, {len(changed)} changed, {len(removed)} removed"
+                            f" since last refresh ({datetime.now().strftime('%H:%M:%S')})")
+            table['status'].configure(text=summary, text_color=TEXT_DIM)
+
+    def _override_cells(self, entry: dict) -> tuple[str, str, str, str]:
+        """Profile, days, dates and times text for one override entry."""
+        days = entry.get('days', '')
+        dates = " → ".join(
+            self._format_in_out_date(entry[field])[0] for field in ("from_date", "to_date") if entry.get(field)
+        )
+        times = " – ".join(
+            self._format_time(entry[field]) for field in ("start", "end") if entry.get(field)
+        )
+        return (entry.get('profile', '—'), self._map_day_of_week(days) if days else "—",
+                dates or "—", times or "—")
+
+    def _load_logs(self, channel: dict, token: CancelToken) -> dict:
+        """List a channel's KL4/DJV logs, including archived ones (runs on a worker thread)."""
+        channel_num = channel.get('channel_number', 0)
+        log_folder = r"C:\Kaleidovision\logfiles"
+        if not os.path.exists(log_folder):
+            return {'log_folder': log_folder, 'exists': False}
+
+        # Scan for log files - now storing full_path as well. Rotated logs may be
+        # gzipped (.log.gz) or bundled into .zip archives; members of an archive are
+        # addressed as "<archive>.zip::<member>" and read without extracting.
+        kl4_pattern = re.compile(rf"^KL4MusicScheduler\.Channel{channel_num}\.(\d{{8}})\.log(\.gz)?$", re.IGNORECASE)
+        track_pattern = re.compile(rf"^DJVPlaybackDebug\.Channel{channel_num}\.(\d{{8}})\.log(\.gz)?$", re.IGNORECASE)
+
+        # date_str -> (rank, filename, full_path); a plain .log beats .gz beats a zip member
+        kl4_found = {}
+        track_found = {}
+
+        def add_log(name, full_path, rank):
+            for pattern, found in ((kl4_pattern, kl4_found), (track_pattern, track_found)):
+                match = pattern.match(name)
+                if match:
+                    if match.group(2):
+                        rank += 1
+                    date_str = match.group(1)
+                    if date_str not in found or rank < found[date_str][0]:
+                        found[date_str] = (rank, name, full_path)
+                    return
+
+        try:
+            for filename in os.listdir(log_folder):
+                full_path = os.path.join(log_folder, filename)
+                token.check()
+                if filename.lower().endswith(".zip"):
+                    try:
+                        with zipfile.ZipFile(full_path) as zf:
+                            members = [m for m in zf.namelist()
+                                       if not m.endswith("/") and not m.lower().endswith(".gz")]
+                    except (OSError, zipfile.BadZipFile) as e:
+                        print(f"Error reading log archive {filename}: {e}")
+                        continue
+                    for member in members:
+                        add_log(member.rsplit("/", 1)[-1], full_path + _ARCHIVE_MEMBER_SEP + member, 2)
+                else:
+                    add_log(filename, full_path, 0)
+        except TaskCancelled:
+            raise
+        except Exception as e:
+            print(f"Error scanning log folder: {e}")
 
-    def _show_logs(self, channel: dict):
+        kl4_files = [(fn, ds, fp) for ds, (_, fn, fp) in kl4_found.items()]  # (filename, date_str, full_path)
+        track_files = [(fn, ds, fp) for ds, (_, fn, fp) in track_found.items()]  # (filename, date_str, full_path)
+
+        mcservice_log_path = os.path.join(log_folder, "McServiceAppLog.log")
+        return {
+            'log_folder': log_folder,
+            'exists': True,
+            'mcservice_log': mcservice_log_path if os.path.exists(mcservice_log_path) else None,
+            'kl4_files': kl4_files,
+            'track_files': track_files,
+        }
+
+    def _show_logs(self, channel: dict, data: dict):
         """Display Logs content with 2-column file list sorted by date (newest first)."""
         import subprocess
-        import re
 
         # Get channel number and name
         channel_num = channel.get('channel_number', 0)
         channel_name = channel.get('name', 'Unknown')
 
         # Check if log folder exists
-        log_folder = r"C:\Kaleidovision\logfiles"
-        if not os.path.exists(log_folder):
+        log_folder = data['log_folder']
+        if not data['exists']:
             ctk.CTkLabel(
                 self._details_content,
                 text=f"'{log_folder}' doesn't exist.",
-                font=ctk.CTkFont(size=12), text_color=TEXT_DIM, anchor="w"
+                font=get_font(12), text_color=TEXT_DIM, anchor="w"
             ).grid(row=1, column=0, sticky="w", pady=(10, 0))
             return
 
@@ -2238,7 +6331,7 @@ class CoresXMLPage(ctk.CTkFrame):
         ctk.CTkButton(
             folder_btn_frame,
             text="📁 Open Log Folder",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             fg_color=DIVIDER,
             hover_color=ACCENT,
             text_color=TEXT_BRIGHT,
@@ -2248,12 +6341,12 @@ class CoresXMLPage(ctk.CTkFrame):
         ).grid(row=0, column=0, sticky="w")
 
         # Check for McServiceAppLog.log and add button if exists
-        mcservice_log_path = os.path.join(log_folder, "McServiceAppLog.log")
-        if os.path.exists(mcservice_log_path):
+        mcservice_log_path = data['mcservice_log']
+        if mcservice_log_path:
             ctk.CTkButton(
                 folder_btn_frame,
                 text="📄 View McServiceAppLog",
-                font=ctk.CTkFont(size=11),
+                font=get_font(11),
                 fg_color=DIVIDER,
                 hover_color=ACCENT,
                 text_color=TEXT_BRIGHT,
@@ -2262,25 +6355,8 @@ class CoresXMLPage(ctk.CTkFrame):
                 command=lambda: view_log_in_popup(mcservice_log_path, "McServiceAppLog.log", "service", "")
             ).grid(row=0, column=1, sticky="w", padx=(10, 0))
 
-        # Scan for log files - now storing full_path as well
-        kl4_pattern = re.compile(rf"^KL4MusicScheduler\.Channel{channel_num}\.(\d{{8}})\.log$")
-        track_pattern = re.compile(rf"^DJVPlaybackDebug\.Channel{channel_num}\.(\d{{8}})\.log$")
-
-        kl4_files = []  # (filename, date_str, full_path)
-        track_files = []  # (filename, date_str, full_path)
-
-        try:
-            for filename in os.listdir(log_folder):
-                full_path = os.path.join(log_folder, filename)
-                kl4_match = kl4_pattern.match(filename)
-                if kl4_match:
-                    kl4_files.append((filename, kl4_match.group(1), full_path))
-                    continue
-                track_match = track_pattern.match(filename)
-                if track_match:
-                    track_files.append((filename, track_match.group(1), full_path))
-        except Exception as e:
-            print(f"Error scanning log folder: {e}")
+        kl4_files = data['kl4_files']  # (filename, date_str, full_path)
+        track_files = data['track_files']  # (filename, date_str, full_path)
 
         # Sort state - default to descending (newest first)
         if not hasattr(self, '_logs_sort_state'):
@@ -2305,7 +6381,7 @@ class CoresXMLPage(ctk.CTkFrame):
         kl4_header.columnconfigure(0, weight=1)
         ctk.CTkLabel(
             kl4_header, text="KL4 Logs",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=get_font(11, "bold"),
             text_color=ACCENT, anchor="center"
         ).grid(row=0, column=0, sticky="ew", padx=10, pady=8)
 
@@ -2316,7 +6392,7 @@ class CoresXMLPage(ctk.CTkFrame):
         sort_btn = ctk.CTkButton(
             date_header,
             text="📅 Date 🔼" if self._logs_sort_state['asc'] else "📅 Date 🔽",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=get_font(11, "bold"),
             fg_color="transparent",
             hover_color=DIVIDER,
             text_color=ACCENT,
@@ -2331,7 +6407,7 @@ class CoresXMLPage(ctk.CTkFrame):
         track_header.columnconfigure(0, weight=1)
         ctk.CTkLabel(
             track_header, text="Track Logs",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=get_font(11, "bold"),
             text_color=ACCENT, anchor="center"
         ).grid(row=0, column=0, sticky="ew", padx=10, pady=8)
 
@@ -2356,7 +6432,7 @@ class CoresXMLPage(ctk.CTkFrame):
                 print(f"Error opening file with Notepad: {e}")
 
         def view_log_in_popup(file_path: str, file_name: str, log_type: str, date_str: str):
-            """Open log file in a popup window with search functionality."""
+            """Open log file as a tab of the shared log workspace window."""
             # Format date for title: YYYYMMDD -> DD/MM/YYYY
             year = date_str[:4]
             month = date_str[4:6]
@@ -2371,442 +6447,24 @@ class CoresXMLPage(ctk.CTkFrame):
             else:
                 title = f"McServiceAppLog ({channel_name})"
             
-            # Create popup window (independent - not modal)
-            popup = ctk.CTkToplevel(self)
-            popup.title(title)
-            popup.geometry("900x700")
-            popup.resizable(True, True)
-            popup.configure(fg_color="#1A0F0A")
-            
-            # Center the popup
-            popup.update_idletasks()
-            sw = popup.winfo_screenwidth()
-            sh = popup.winfo_screenheight()
-            x = (sw - 900) // 2
-            y = (sh - 700) // 2
-            popup.geometry(f"900x700+{x}+{y}")
-            
-            popup.columnconfigure(0, weight=1)
-            popup.rowconfigure(2, weight=1)
-            
-            # Header with file info
-            header_frame = ctk.CTkFrame(popup, fg_color=CARD_BG, corner_radius=CORNER)
-            header_frame.grid(row=0, column=0, sticky="ew", padx=12, pady=(12, 8))
-            header_frame.columnconfigure(0, weight=1)
-            
-            ctk.CTkLabel(
-                header_frame,
-                text=f"📄 {file_name}",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=ACCENT, anchor="w"
-            ).grid(row=0, column=0, sticky="w", padx=12, pady=8)
-            
-            # Search frame
-            search_frame = ctk.CTkFrame(popup, fg_color="transparent")
-            search_frame.grid(row=1, column=0, sticky="ew", padx=12, pady=(0, 8))
-            search_frame.columnconfigure(0, weight=0)  # A- button
-            search_frame.columnconfigure(1, weight=0)  # A+ button
-            search_frame.columnconfigure(2, weight=1)  # Search field
-            search_frame.columnconfigure(3, weight=0)  # Search button
-            
-            # Text size controls
-            def increase_text_size():
-                """Increase font size for both textboxes"""
-                current_font = textbox.cget("font")
-                current_size = current_font.cget("size")
-                new_size = min(current_size + 1, 20)  # Max size 20
-                
-                new_font = ctk.CTkFont(family="Consolas", size=new_size)
-                textbox.configure(font=new_font)
-                line_numbers.configure(font=new_font)
-                popup._current_font_size = new_size
-            
-            def decrease_text_size():
-                """Decrease font size for both textboxes"""
-                current_font = textbox.cget("font")
-                current_size = current_font.cget("size")
-                new_size = max(current_size - 1, 6)  # Min size 6
-                
-                new_font = ctk.CTkFont(family="Consolas", size=new_size)
-                textbox.configure(font=new_font)
-                line_numbers.configure(font=new_font)
-                popup._current_font_size = new_size
-            
-            # Decrease text size button
-            decrease_btn = ctk.CTkButton(
-                search_frame,
-                text="A-",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                fg_color=DIVIDER,
-                hover_color=ACCENT,
-                text_color=TEXT_BRIGHT,
-                width=35,
-                height=32,
-                command=decrease_text_size
-            )
-            decrease_btn.grid(row=0, column=0, padx=(0, 4))
-            
-            # Increase text size button
-            increase_btn = ctk.CTkButton(
-                search_frame,
-                text="A+",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                fg_color=DIVIDER,
-                hover_color=ACCENT,
-                text_color=TEXT_BRIGHT,
-                width=35,
-                height=32,
-                command=increase_text_size
-            )
-            increase_btn.grid(row=0, column=1, padx=(0, 8))
-            
-            search_entry = ctk.CTkEntry(
-                search_frame,
-                placeholder_text="Search in log...",
-                font=ctk.CTkFont(size=12),
-                fg_color="#150D0D",
-                text_color=TEXT_BRIGHT,
-                border_color=DIVIDER,
-                border_width=1,
-                height=32
-            )
-            search_entry.grid(row=0, column=2, sticky="ew", padx=(0, 8))
-            
-            # Content textbox with line numbers
-            content_frame = ctk.CTkFrame(popup, fg_color=CARD_BG, corner_radius=CORNER)
-            content_frame.grid(row=2, column=0, sticky="nsew", padx=12, pady=(0, 12))
-            content_frame.columnconfigure(0, weight=0)  # Line numbers
-            content_frame.columnconfigure(1, weight=1)  # Content
-            content_frame.rowconfigure(0, weight=1)
-            
-            # Line numbers textbox (scrollbar hidden)
-            line_numbers = ctk.CTkTextbox(
-                content_frame,
-                font=ctk.CTkFont(family="Consolas", size=10),
-                fg_color="#1A1A1A",
-                text_color=TEXT_DIM,
-                border_color=DIVIDER,
-                border_width=1,
-                corner_radius=0,
-                wrap="none",
-                width=50,
-                state="disabled",
-                scrollbar_button_color="#1A1A1A",
-                scrollbar_button_hover_color="#1A1A1A"
-            )
-            line_numbers.grid(row=0, column=0, sticky="ns", padx=(8, 0), pady=8)
-            
-            # Content textbox
-            textbox = ctk.CTkTextbox(
-                content_frame,
-                font=ctk.CTkFont(family="Consolas", size=10),
-                fg_color="#1A1A1A",
-                text_color=TEXT_BRIGHT,
-                border_color=DIVIDER,
-                border_width=1,
-                corner_radius=0,
-                wrap="none"
-            )
-            textbox.grid(row=0, column=1, sticky="nsew", padx=(0, 8), pady=8)
-            
-            # Read file content
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    content = ''.join(lines)
-                    total_lines = len(lines)
-            except Exception as e:
-                content = f"[Error reading file: {e}]"
-                total_lines = 1
-            
-            # Insert line numbers
-            line_numbers.configure(state="normal")
-            line_numbers.delete("1.0", "end")
-            line_nums = '\n'.join(str(i) for i in range(1, total_lines + 1))
-            line_numbers.insert("1.0", line_nums)
-            line_numbers.configure(state="disabled")
-            
-            # Insert content
-            textbox.insert("1.0", content)
-            textbox.configure(state="disabled")
-            
-            # Get inner tk Text widgets for direct binding
-            _tb = textbox._textbox
-            _ln = line_numbers._textbox
-            
-            # Sync line numbers on every scroll (mouse wheel AND scrollbar drag)
-            def _on_scroll(first, last):
-                _ln.yview_moveto(first)
-                if textbox._y_scrollbar:
-                    textbox._y_scrollbar.set(first, last)
-            
-            _tb.configure(yscrollcommand=_on_scroll)
-            
-            # Also intercept the scrollbar's own command so dragging syncs line numbers
-            if textbox._y_scrollbar:
-                _sb = textbox._y_scrollbar
-                def _scrollbar_cmd(*args):
-                    _tb.yview(*args)
-                    _ln.yview_moveto(_tb.yview()[0])
-                _sb.configure(command=_scrollbar_cmd)
-            
-            # Block ALL interaction on the inner line_numbers Text widget
-            def _block(event):
-                return "break"
-            
-            def _block_scroll(event):
-                units = int(-event.delta / 120)
-                _tb.yview_scroll(units, "units")
-                return "break"
-            
-            _ln.bind("<MouseWheel>", _block_scroll)
-            _ln.bind("<Button-4>", lambda e: (_tb.yview_scroll(-3, "units"), "break")[-1])
-            _ln.bind("<Button-5>", lambda e: (_tb.yview_scroll(3, "units"), "break")[-1])
-            _ln.bind("<Button-1>", _block)
-            _ln.bind("<B1-Motion>", _block)
-            _ln.bind("<ButtonRelease-1>", _block)
-            _ln.bind("<Key>", _block)
-            _ln.bind("<KeyPress>", _block)
-            _ln.configure(takefocus=0)
-            
-            # Visible date/time tracking based on first visible line
-            import re
-            # KL4 format: "dd/mm/yyyy hh:mm:ss.mmm" (e.g., "18/02/2026 23:50:27.769")
-            kl4_time_pattern = re.compile(r"(\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}\.\d{3})")
-            # DVJ format: '"dd/mm/yyyy hh:mm:ss"' (e.g., '"18/02/2026 06:21:07"')
-            dvj_time_pattern = re.compile(r'"(\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2})"')
-            
-            def update_visible_time(*args):
-                """Update the visible time label based on first visible line with date/time."""
-                try:
-                    # Get first visible line index
-                    first_visible = _tb.index("@0,0")
-                    if first_visible:
-                        line_num = int(first_visible.split(".")[0])
-                        # Search forward for a line with date/time
-                        for offset in range(50):  # Check next 50 lines max
-                            check_line = line_num + offset
-                            line_start = f"{check_line}.0"
-                            line_end = f"{check_line}.end"
-                            line_content = _tb.get(line_start, line_end)
-                            
-                            # Try KL4 pattern first, then DVJ
-                            match = None
-                            if log_type == "kl4":
-                                match = kl4_time_pattern.search(line_content)
-                            elif log_type == "track":
-                                match = dvj_time_pattern.search(line_content)
-                            else:
-                                # Try both patterns for service logs
-                                match = kl4_time_pattern.search(line_content) or dvj_time_pattern.search(line_content)
-                            
-                            if match:
-                                visible_time_lbl.configure(text=match.group(1))
-                                return
-                        
-                        # No date found in visible area
-                        visible_time_lbl.configure(text="")
-                except Exception:
-                    pass
-            
-            # Bind to scroll events with dynamic font size effect
-            _tb.bind("<MouseWheel>", lambda e: (on_scroll_start(), _tb.yview_scroll(int(-e.delta/120), "units"), update_visible_time(), on_scroll_stop(), "break")[4], add=True)
-            _tb.bind("<Button-4>", lambda e: (on_scroll_start(), _tb.yview_scroll(-3, "units"), update_visible_time(), on_scroll_stop(), "break")[4], add=True)
-            _tb.bind("<Button-5>", lambda e: (on_scroll_start(), _tb.yview_scroll(3, "units"), update_visible_time(), on_scroll_stop(), "break")[4], add=True)
-            
-            # Also update on scrollbar drag (hook into existing scrollbar command) with dynamic font
-            if textbox._y_scrollbar:
-                orig_cmd = textbox._y_scrollbar.cget("command")
-                def _scrollbar_with_time(*args):
-                    on_scroll_start()
-                    _tb.yview(*args)
-                    _ln.yview_moveto(_tb.yview()[0])
-                    update_visible_time()
-                    on_scroll_stop()
-                textbox._y_scrollbar.configure(command=_scrollbar_with_time)
-                
-                # Bind scrollbar button press/release for font size effect
-                textbox._y_scrollbar.bind("<ButtonPress-1>", lambda e: on_scroll_start())
-                textbox._y_scrollbar.bind("<ButtonRelease-1>", lambda e: on_scroll_stop())
-                textbox._y_scrollbar.bind("<B1-Motion>", lambda e: on_scroll_start())
-            
-            # Initial update
-            popup.after(100, update_visible_time)
-            
-            # Search state for cycling through matches
-            popup._search_matches = []
-            popup._current_match_index = -1
-            popup._current_query = ""
-            
-            # Search functionality with cycling
-            def search_text():
-                query = search_entry.get().strip()
-                if not query:
-                    return
-                
-                textbox.configure(state="normal")
-                textbox.tag_remove("highlight", "1.0", "end")
-                textbox.tag_remove("current_highlight", "1.0", "end")
-                
-                # If new search or same query, find all matches
-                if query != popup._current_query:
-                    popup._current_query = query
-                    popup._search_matches = []
-                    popup._current_match_index = -1
-                    
-                    start_pos = "1.0"
-                    while True:
-                        pos = textbox.search(query, start_pos, stopindex="end", nocase=True)
-                        if not pos:
-                            break
-                        end_pos = f"{pos}+{len(query)}c"
-                        popup._search_matches.append((pos, end_pos))
-                        textbox.tag_add("highlight", pos, end_pos)
-                        start_pos = end_pos
-                    
-                    if popup._search_matches:
-                        textbox.tag_config("highlight", background="#5A4A3A", foreground=TEXT_BRIGHT)
-                
-                # Cycle to next match
-                if popup._search_matches:
-                    popup._current_match_index = (popup._current_match_index + 1) % len(popup._search_matches)
-                    pos, end_pos = popup._search_matches[popup._current_match_index]
-                    
-                    # Clear previous current highlight and set new one
-                    textbox.tag_remove("current_highlight", "1.0", "end")
-                    textbox.tag_add("current_highlight", pos, end_pos)
-                    textbox.tag_config("current_highlight", background="#C1784A", foreground="#1A0F0A")
-                    
-                    # Scroll to show the match
-                    textbox.see(pos)
-                    popup.after(1, update_visible_time)
-                
-                textbox.configure(state="disabled")
-            
-            def clear_search():
-                textbox.configure(state="normal")
-                textbox.tag_remove("highlight", "1.0", "end")
-                textbox.tag_remove("current_highlight", "1.0", "end")
-                textbox.configure(state="disabled")
-                search_entry.delete(0, "end")
-                popup._search_matches = []
-                popup._current_match_index = -1
-                popup._current_query = ""
-            
-            search_btn = ctk.CTkButton(
-                search_frame,
-                text="🔍 Search",
-                font=ctk.CTkFont(size=11),
-                fg_color=DIVIDER,
-                hover_color=ACCENT,
-                text_color=TEXT_BRIGHT,
-                width=80,
-                height=32,
-                command=search_text
-            )
-            search_btn.grid(row=0, column=3, sticky="e")
-            
-            # Bind Enter key to search
-            search_entry.bind("<Return>", lambda e: search_text())
-            
-            # Button frame with visible time at center-bottom
-            btn_frame = ctk.CTkFrame(popup, fg_color="transparent")
-            btn_frame.grid(row=3, column=0, sticky="ew", padx=12, pady=(0, 12))
-            btn_frame.columnconfigure(0, weight=1)  # Left side (clear btn)
-            btn_frame.columnconfigure(1, weight=0)  # Center (time)
-            btn_frame.columnconfigure(2, weight=1)  # Right side (close btn)
-            
-            # Clear search button
-            clear_btn = ctk.CTkButton(
-                btn_frame,
-                text="Clear Search",
-                font=ctk.CTkFont(size=11),
-                fg_color=DIVIDER,
-                hover_color=ACCENT,
-                text_color=TEXT_BRIGHT,
-                width=100,
-                height=32,
-                command=clear_search
-            )
-            clear_btn.grid(row=0, column=0, sticky="w")
-            
-            # Visible date/time display at center (updates on scroll)
-            visible_time_lbl = ctk.CTkLabel(
-                btn_frame,
-                text="",
-                font=ctk.CTkFont(size=20, weight="bold"),
-                text_color="#E8A87C",  # Distinct warm color
-                anchor="center"
-            )
-            visible_time_lbl.grid(row=0, column=1, sticky="ew", padx=12)
-            
-            # Close button
-            close_btn = ctk.CTkButton(
-                btn_frame,
-                text="Close",
-                font=ctk.CTkFont(size=11),
-                fg_color=DIVIDER,
-                hover_color=ACCENT,
-                text_color=TEXT_BRIGHT,
-                width=100,
-                height=32,
-                command=popup.destroy
-            )
-            close_btn.grid(row=0, column=2, sticky="e")
-            
-            # Scrolling state for dynamic font size
-            popup._is_scrolling = False
-            popup._scroll_timer = None
-            
-            def set_scrolling_state(is_scrolling):
-                """Update font size and color based on scrolling state."""
-                popup._is_scrolling = is_scrolling
-                if is_scrolling:
-                    visible_time_lbl.configure(
-                        font=ctk.CTkFont(size=24, weight="bold"),
-                        text_color="#FF6B35"  # Bright orange when changing
-                    )
-                else:
-                    visible_time_lbl.configure(
-                        font=ctk.CTkFont(size=20, weight="bold"),
-                        text_color="#E8A87C"  # Warm color normal
-                    )
-            
-            def on_scroll_start(event=None):
-                """Called when user starts scrolling."""
-                if not popup._is_scrolling:
-                    set_scrolling_state(True)
-                # Cancel any pending scroll stop
-                if popup._scroll_timer:
-                    popup.after_cancel(popup._scroll_timer)
-                    popup._scroll_timer = None
-            
-            def on_scroll_stop(event=None):
-                """Called when scrolling stops (delayed)."""
-                if popup._scroll_timer:
-                    popup.after_cancel(popup._scroll_timer)
-                popup._scroll_timer = popup.after(300, lambda: set_scrolling_state(False))
-            
-            # Focus the popup using Windows API on the inner Tk window handle
-            def set_focus():
-                try:
-                    import ctypes
-                    popup_hwnd = ctypes.windll.user32.FindWindowW(None, title)
-                    if popup_hwnd:
-                        ctypes.windll.user32.ShowWindow(popup_hwnd, 9)  # SW_RESTORE
-                        ctypes.windll.user32.SetForegroundWindow(popup_hwnd)
-                except Exception:
-                    pass
-                popup.lift()
-                popup.focus_force()
-            
-            popup.after(200, set_focus)
-            
-            # Ensure proper cleanup when closing
-            def on_closing():
-                popup.destroy()
-            
-            popup.protocol("WM_DELETE_WINDOW", on_closing)
+            LogWorkspace.open_log(self, file_path, file_name, log_type, title)
+
+        def view_log_stream(log_type: str, date_str: str):
+            """Open the run of consecutive daily logs around *date_str* as one stream tab."""
+            files = kl4_files if log_type == "kl4" else track_files
+            segments = consecutive_log_days(files, date_str)
+            if not segments:
+                return
+            stream = LogStream(f"stream:{log_type}:{channel_num}:{segments[0][0]}", segments)
+            start = [ds for ds, _ in segments].index(date_str)
+            first, last = segments[0][0], segments[-1][0]
+            span = f"{first[6:]}/{first[4:6]}/{first[:4]} → {last[6:]}/{last[4:6]}/{last[:4]}"
+            kind = "KL4 logs" if log_type == "kl4" else "Track logs"
+            title = f"[CH{channel_num}] {kind} - {span} ({channel_name})"
+            first_name = next(fn for fn, ds, _ in files if ds == first)
+            file_name = f"{len(segments)} consecutive days: {first_name} …"
+            LogWorkspace.open_log(self, segments[start][1], file_name, log_type, title,
+                                  stream=stream, stream_start=start)
 
         def refresh_file_lists():
             # Clear all three columns
@@ -2835,7 +6493,7 @@ class CoresXMLPage(ctk.CTkFrame):
             if not all_dates:
                 ctk.CTkLabel(
                     date_container, text="No log files found",
-                    font=ctk.CTkFont(size=10), text_color=TEXT_DIM, anchor="center"
+                    font=get_font(10), text_color=TEXT_DIM, anchor="center"
                 ).grid(row=0, column=0, sticky="ew", pady=5)
                 return
 
@@ -2878,15 +6536,23 @@ class CoresXMLPage(ctk.CTkFrame):
                     fn, fp = kl4_by_date[date_str]
                     ctk.CTkButton(
                         kl4_cell, text="View KL4Logs",
-                        font=ctk.CTkFont(size=10),
+                        font=get_font(10),
                         fg_color=DIVIDER, hover_color=ACCENT,
                         text_color=TEXT_BRIGHT, height=32,
                         command=lambda path=fp, name=fn, ds=date_str: view_log_in_popup(path, name, "kl4", ds)
-                    ).grid(row=0, column=0, sticky="ew", padx=12, pady=8)
+                    ).grid(row=0, column=0, sticky="ew", padx=(12, 4), pady=8)
+                    # Continuous view across consecutive days (scrolls past midnight)
+                    ctk.CTkButton(
+                        kl4_cell, text="⇅",
+                        font=get_font(12),
+                        fg_color=DIVIDER, hover_color=ACCENT,
+                        text_color=TEXT_BRIGHT, height=32, width=32,
+                        command=lambda ds=date_str: view_log_stream("kl4", ds)
+                    ).grid(row=0, column=1, padx=(0, 12), pady=8)
                 else:
                     ctk.CTkLabel(
                         kl4_cell, text="No KL4 log",
-                        font=ctk.CTkFont(size=10),
+                        font=get_font(10),
                         text_color="#5A4A3A", anchor="center"
                     ).grid(row=0, column=0, sticky="ew", padx=12, pady=8)
 
@@ -2898,7 +6564,7 @@ class CoresXMLPage(ctk.CTkFrame):
                 date_cell.rowconfigure(0, weight=1)
                 ctk.CTkLabel(
                     date_cell, text=f"📅 {display_date}",
-                    font=ctk.CTkFont(size=11, weight="bold"),
+                    font=get_font(11, "bold"),
                     text_color=date_color, anchor="center"
                 ).grid(row=0, column=0, sticky="nsew", padx=6, pady=0)
 
@@ -2913,15 +6579,23 @@ class CoresXMLPage(ctk.CTkFrame):
                     fn, fp = track_by_date[date_str]
                     ctk.CTkButton(
                         track_cell, text="View Track Logs",
-                        font=ctk.CTkFont(size=10),
+                        font=get_font(10),
                         fg_color=DIVIDER, hover_color=ACCENT,
                         text_color=TEXT_BRIGHT, height=32,
                         command=lambda path=fp, name=fn, ds=date_str: view_log_in_popup(path, name, "track", ds)
-                    ).grid(row=0, column=0, sticky="ew", padx=12, pady=8)
+                    ).grid(row=0, column=0, sticky="ew", padx=(12, 4), pady=8)
+                    # Continuous view across consecutive days (scrolls past midnight)
+                    ctk.CTkButton(
+                        track_cell, text="⇅",
+                        font=get_font(12),
+                        fg_color=DIVIDER, hover_color=ACCENT,
+                        text_color=TEXT_BRIGHT, height=32, width=32,
+                        command=lambda ds=date_str: view_log_stream("track", ds)
+                    ).grid(row=0, column=1, padx=(0, 12), pady=8)
                 else:
                     ctk.CTkLabel(
                         track_cell, text="No Track log",
-                        font=ctk.CTkFont(size=10),
+                        font=get_font(10),
                         text_color="#5A4A3A", anchor="center"
                     ).grid(row=0, column=0, sticky="ew", padx=12, pady=8)
 
@@ -2937,8 +6611,15 @@ class CoresXMLPage(ctk.CTkFrame):
         left_width = content_frame.grid_bbox(0, 0)[2] if content_frame.grid_bbox(0, 0) else int(total_width * 0.3)
         self._sash_left_width = left_width
 
-    def _on_sash_drag(self, event, content_frame, left_container, right_container):
-        """Handle sash drag motion to resize panels."""
+        # A plain Tk frame placed over the panels previews the split; moving it
+        # doesn't relayout the channel list or details panel like re-weighting does
+        if self._sash_ghost is not None:
+            self._sash_ghost.destroy()
+        self._sash_ghost = tk.Frame(content_frame, bg=ACCENT, width=3, cursor="sb_h_double_arrow")
+        self._sash_ghost.place(x=left_width, y=0, relheight=1)
+
+    def _on_sash_drag(self, event, content_frame):
+        """Handle sash drag motion by moving the ghost line only."""
         if not self._sash_dragging:
             return
         
@@ -2949,26 +6630,50 @@ class CoresXMLPage(ctk.CTkFrame):
         # Update left width
         self._sash_left_width += delta_x
         
-        # Constrain to reasonable bounds
+        # Keep both panels at or above their grid minsizes
         total_width = content_frame.winfo_width()
-        min_left = 200
-        max_left = total_width - 304  # Leave room for sash (4) + right panel min (300)
-        new_left_width = max(min_left, min(self._sash_left_width, max_left))
-        
-        # Update stored width
-        self._sash_left_width = new_left_width
-        new_right_width = total_width - 4 - new_left_width
-        
-        # Update weights proportionally (use larger numbers for finer control)
-        left_weight = max(1, int(new_left_width / 10))
-        right_weight = max(1, int(new_right_width / 10))
-        
-        content_frame.columnconfigure(0, weight=left_weight)
-        content_frame.columnconfigure(2, weight=right_weight)
+        max_left = max(self.CHANNELS_MIN_WIDTH, total_width - self.SASH_WIDTH - self.DETAILS_MIN_WIDTH)
+        self._sash_left_width = max(self.CHANNELS_MIN_WIDTH, min(self._sash_left_width, max_left))
 
-    def _end_sash_drag(self):
-        """End sash dragging."""
+        if self._sash_ghost is not None:
+            self._sash_ghost.place_configure(x=self._sash_left_width)
+
+    def _end_sash_drag(self, content_frame):
+        """End sash dragging: apply the previewed split once and remember it."""
+        if not self._sash_dragging:
+            return
         self._sash_dragging = False
+        if self._sash_ghost is not None:
+            self._sash_ghost.destroy()
+            self._sash_ghost = None
+
+        usable_width = content_frame.winfo_width() - self.SASH_WIDTH
+        if usable_width <= 0:
+            return
+        split = self._sash_left_width / usable_width
+        self._apply_sash_split(content_frame, split)
+        save_ui_setting("channel_split", round(split, 4))
+
+    def _apply_sash_split(self, content_frame, split: float):
+        """Give the channel list *split* of the current usable width, the details panel the rest."""
+        if content_frame.winfo_width() <= 1:
+            self._pending_split = split  # not laid out yet
+            return
+        self._pending_split = None
+        usable_width = content_frame.winfo_width() - self.SASH_WIDTH
+        # Grid hands each column its minsize and shares only the rest by weight,
+        # so weight the space beyond the minsizes to land the sash at split
+        spare = usable_width - self.CHANNELS_MIN_WIDTH - self.DETAILS_MIN_WIDTH
+        if spare <= 0:
+            return
+        left = min(max(split * usable_width, self.CHANNELS_MIN_WIDTH), usable_width - self.DETAILS_MIN_WIDTH)
+        left_weight = round((left - self.CHANNELS_MIN_WIDTH) / spare * 10000)
+        content_frame.columnconfigure(0, weight=left_weight)
+        content_frame.columnconfigure(2, weight=10000 - left_weight)
+
+    def _on_content_configure(self, content_frame):
+        if self._pending_split is not None:
+            self._apply_sash_split(content_frame, self._pending_split)
 
 
 # ── Main Dashboard ─────────────────────────────────────────────────────────────
@@ -3003,13 +6708,20 @@ class DashboardApp(ctk.CTk):
 
     def __init__(self):
         super().__init__()
+        RENDER_MODE.load()
+        SCHEDULER.attach(self)
+        FILE_WATCHER.start(self)
         self.title("Music Concierge — Support Dashboard")
         self.geometry("1280x780")
         self._center_window(1280, 780)
         self.minsize(960, 640)
 
         self._build_ui()
-        self.bind("<Configure>", self._on_resize)
+        # Components that need to follow the window size subscribe here
+        self.resize_coordinator = ResizeCoordinator(self)
+        self.resize_coordinator.subscribe(self._on_resize)
+        RENDER_MODE.subscribe(self._on_render_mode_changed)
+        RENDER_MODE.apply(self)
 
     # ── Centering ──────────────────────────────────────────────────────────────
     def _center_window(self, w: int, h: int):
@@ -3022,7 +6734,7 @@ class DashboardApp(ctk.CTk):
 
     # ── UI Construction ────────────────────────────────────────────────────────
     def _build_ui(self):
-        self._canvas = Canvas(self, highlightthickness=0, bd=0)
+        self._canvas = Canvas(self, highlightthickness=0, bd=0, bg=BG_COLOR)
         self._canvas.place(x=0, y=0, relwidth=1, relheight=1)
 
         overlay = ctk.CTkFrame(self, fg_color="transparent")
@@ -3046,7 +6758,7 @@ class DashboardApp(ctk.CTk):
 
         # Start on Overview and start time updates
         self._navigate("Overview")
-        self._update_time()
+        SCHEDULER.every("clock", 1000, self._update_time, priority=10, first_ms=0)
 
         self.update_idletasks()
         set_background(self._canvas, self.winfo_width(), self.winfo_height())
@@ -3114,14 +6826,14 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             frame,
             text="⚠️ Unlock Windows Shell?",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=ACCENT, anchor="center"
         ).grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 10))
         
         ctk.CTkLabel(
             frame,
             text="This will launch Windows Explorer.\nDo you want to continue?",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=TEXT_BRIGHT, anchor="center", justify="center"
         ).grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 20))
         
@@ -3144,7 +6856,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="Yes",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color=ACCENT,
             hover_color="#E8A87C",
             text_color="#1A0F0A",
@@ -3156,7 +6868,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="No",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color=DIVIDER,
             hover_color=ACCENT,
             text_color=TEXT_BRIGHT,
@@ -3200,14 +6912,14 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             frame,
             text="📊 Windows Reliability Reports?",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=ACCENT, anchor="center"
         ).grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 10))
         
         ctk.CTkLabel(
             frame,
             text="This will launch Windows Reliability Reports.\nDo you want to continue?",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=TEXT_BRIGHT, anchor="center", justify="center"
         ).grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 20))
         
@@ -3230,7 +6942,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="Yes",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color=ACCENT,
             hover_color="#E8A87C",
             text_color="#1A0F0A",
@@ -3242,7 +6954,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="No",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color=DIVIDER,
             hover_color=ACCENT,
             text_color=TEXT_BRIGHT,
@@ -3286,14 +6998,14 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             frame,
             text="📝 Windows Event Viewer?",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=ACCENT, anchor="center"
         ).grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 10))
         
         ctk.CTkLabel(
             frame,
             text="This will launch Windows Event Viewer.\nDo you want to continue?",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=TEXT_BRIGHT, anchor="center", justify="center"
         ).grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 20))
         
@@ -3316,7 +7028,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="Yes",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color=ACCENT,
             hover_color="#E8A87C",
             text_color="#1A0F0A",
@@ -3328,7 +7040,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="No",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color=DIVIDER,
             hover_color=ACCENT,
             text_color=TEXT_BRIGHT,
@@ -3341,8 +7053,22 @@ class DashboardApp(ctk.CTk):
         dialog.wait_window(dialog)
 
     def _update_time(self):
-        self._sidebar.update_time()
-        self._time_after_id = self.after(1000, self._update_time)
+        # Seconds only while someone is looking; otherwise tick on the minute boundary
+        show_seconds = SCHEDULER.focused and not RENDER_MODE.low_redraw
+        self._sidebar.update_time(show_seconds)
+        if not show_seconds:
+            now = datetime.now()
+            return (60 - now.second) * 1000 - now.microsecond // 1000
+
+    def _on_render_mode_changed(self, low_redraw: bool):
+        RENDER_MODE.apply(self, force=True)
+        for window in self.winfo_children():
+            if isinstance(window, ctk.CTkToplevel):
+                RENDER_MODE.apply(window, force=True)
+        # Tick now so the clock picks up the new rate straight away
+        SCHEDULER.wake("clock")
+        if not low_redraw:
+            self._on_resize(self.winfo_width(), self.winfo_height())
 
     # ── Top Bar ────────────────────────────────────────────────────────────────
     def _build_topbar(self, parent):
@@ -3352,13 +7078,13 @@ class DashboardApp(ctk.CTk):
 
         ctk.CTkLabel(
             bar, text="Support Dashboard",
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=get_font(22, "bold"),
             text_color=TEXT_BRIGHT, anchor="w"
         ).grid(row=0, column=0, sticky="w")
 
         ctk.CTkLabel(
             bar, text="Wednesday, February 19, 2026",
-            font=ctk.CTkFont(size=12), text_color=TEXT_DIM, anchor="w"
+            font=get_font(12), text_color=TEXT_DIM, anchor="w"
         ).grid(row=1, column=0, sticky="w")
 
     # ── Stat Cards ─────────────────────────────────────────────────────────────
@@ -3386,7 +7112,7 @@ class DashboardApp(ctk.CTk):
 
         ctk.CTkLabel(
             shortcuts_frame, text="IMPORTANT SHORTCUTS",
-            font=ctk.CTkFont(size=10), text_color=TEXT_DIM, anchor="w"
+            font=get_font(10), text_color=TEXT_DIM, anchor="w"
         ).pack(fill="x", padx=14, pady=(14, 8))
 
         grid = ctk.CTkFrame(shortcuts_frame, fg_color="transparent")
@@ -3405,13 +7131,13 @@ class DashboardApp(ctk.CTk):
 
         ctk.CTkLabel(
             note_frame, text="QUICK NOTE",
-            font=ctk.CTkFont(size=10), text_color=TEXT_DIM, anchor="w"
+            font=get_font(10), text_color=TEXT_DIM, anchor="w"
         ).pack(fill="x", padx=14, pady=(14, 6))
 
         note_box = ctk.CTkTextbox(
             note_frame, height=120, corner_radius=8,
             fg_color="#251818", text_color=TEXT_BRIGHT,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             border_color=DIVIDER, border_width=1,
         )
         note_box.pack(fill="both", expand=True, padx=10, pady=(0, 10))
@@ -3420,7 +7146,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkButton(
             note_frame, text="Save Note",
             fg_color=ACCENT, hover_color="#A06840",
-            text_color="#1A0F0A", font=ctk.CTkFont(size=12, weight="bold"),
+            text_color="#1A0F0A", font=get_font(12, "bold"),
             corner_radius=8, height=32,
         ).pack(fill="x", padx=10, pady=(0, 14))
 
@@ -3432,7 +7158,7 @@ class DashboardApp(ctk.CTk):
 
         ctk.CTkLabel(
             frame, text="RECENT ACTIVITY",
-            font=ctk.CTkFont(size=10), text_color=TEXT_DIM, anchor="w"
+            font=get_font(10), text_color=TEXT_DIM, anchor="w"
         ).pack(fill="x", padx=14, pady=(14, 4))
 
         # Header row
@@ -3442,7 +7168,7 @@ class DashboardApp(ctk.CTk):
         for col, text in enumerate(["Time", "Client", "Action", "Status"]):
             ctk.CTkLabel(
                 header, text=text.upper(),
-                font=ctk.CTkFont(size=10), text_color=TEXT_DIM, anchor="w"
+                font=get_font(10), text_color=TEXT_DIM, anchor="w"
             ).grid(row=0, column=col, sticky="ew", padx=8, pady=6)
 
         for time, client, action, status, ok in self._ACTIVITY:
@@ -3454,11 +7180,11 @@ class DashboardApp(ctk.CTk):
         ctk.CTkFrame(frame, height=8, fg_color="transparent").pack()
 
     # ── Resize handler ─────────────────────────────────────────────────────────
-    def _on_resize(self, event=None):
-        w = self.winfo_width()
-        h = self.winfo_height()
-        if w > 1 and h > 1:
-            set_background(self._canvas, w, h)
+    def _on_resize(self, width: int, height: int):
+        # The canvas' own bg colour already covers the window, so remote sessions skip the redraw
+        if RENDER_MODE.low_redraw:
+            return
+        set_background(self._canvas, width, height)
 
 
 # ── Entry Point ────────────────────────────────────────────────────────────────
@@ -3471,6 +7197,34 @@ def _get_config_path() -> str:
     return os.path.join(base, "config.env")
 
 
+def _get_settings_path() -> str:
+    """Return the path to settings.json (persisted UI state) next to config.env."""
+    return os.path.join(os.path.dirname(_get_config_path()), "settings.json")
+
+
+def load_ui_settings() -> dict:
+    """Load persisted UI state; a missing or unreadable file gives {}."""
+    try:
+        with open(_get_settings_path(), "r", encoding="utf-8") as f:
+            settings = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return settings if isinstance(settings, dict) else {}
+
+
+def save_ui_setting(key: str, value):
+    """Store one UI setting, keeping the others."""
+    settings = load_ui_settings()
+    settings[key] = value
+    path = _get_settings_path()
+    try:
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(settings, f, indent=2)
+        os.replace(path + ".tmp", path)
+    except OSError as e:
+        print(f"Error saving settings: {e}")
+
+
 def _get_edit_cores_password():
     """Load edit cores password from config.env file."""
     config_path = _get_config_path()
@@ -3518,20 +7272,20 @@ def check_password(root: ctk.CTk) -> bool:
 
     ctk.CTkLabel(
         frame, text="🔒 Enter Password",
-        font=ctk.CTkFont(size=18, weight="bold"),
+        font=get_font(18, "bold"),
         text_color="#C1784A"
     ).grid(row=0, column=0, pady=(20, 10))
 
     error_label = ctk.CTkLabel(
         frame, text="",
-        font=ctk.CTkFont(size=11),
+        font=get_font(11),
         text_color="#E74C3C"
     )
     error_label.grid(row=1, column=0, pady=(0, 5))
 
     password_entry = ctk.CTkEntry(
         frame, show="●",
-        font=ctk.CTkFont(size=14),
+        font=get_font(14),
         fg_color="#150D0D",
         text_color="#F0E6DC",
         border_color="#5A4A3A",
@@ -3555,7 +7309,7 @@ def check_password(root: ctk.CTk) -> bool:
 
     ctk.CTkButton(
         frame, text="Unlock",
-        font=ctk.CTkFont(size=13, weight="bold"),
+        font=get_font(13, "bold"),
         fg_color="#C1784A",
         hover_color="#A06840",
         text_color="#1A0F0A",
@@ -3603,9 +7357,8 @@ if __name__ == "__main__":
         # Add proper cleanup handler
         def on_main_closing():
             try:
-                # Cancel all after callbacks
-                if hasattr(_root, '_time_after_id'):
-                    _root.after_cancel(_root._time_after_id)
+                # Cancel all scheduled jobs
+                SCHEDULER.shutdown()
                 # Force close all child windows
                 for widget in _root.winfo_children():
                     if isinstance(widget, ctk.CTkToplevel):
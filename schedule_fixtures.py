@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Profile and overlay file entries, shaped like _load_music_schedules builds them, for the schedule tests"""
+
+ALWAYS_FROM = "202001010000"
+ALWAYS_TO = "212112310000"
+
+
+def profile(name, start="0000", end="0000", day="0", indate=ALWAYS_FROM, outdate=ALWAYS_TO):
+    """A .djv profile playing start–end on DayOfWeek *day* (0 = every day)."""
+    return {'name': f"{name}.djv", 'path': f"/profiles/{name}.djv", 'schedule': {
+        'name': name, 'raw_start': start, 'raw_end': end, 'raw_day': day,
+        'indate': indate, 'outdate': outdate, 'hidden': "NO", 'frequency_ranges': [],
+    }}
+
+
+def overlay(name, ranges=(), start="0600", end="0559", indate=ALWAYS_FROM, outdate=ALWAYS_TO):
+    """An .olp overlay with FREQUENCY-RANGEs given as (frequency, indate, outdate, starttime, endtime)."""
+    file_info = profile(name, start, end, indate=indate, outdate=outdate)
+    file_info['name'] = f"{name}.olp"
+    file_info['path'] = f"/profiles/{name}.olp"
+    file_info['schedule']['frequency_ranges'] = [
+        {'frequency': frequency, 'indate': range_in, 'outdate': range_out, 'starttime': range_start,
+         'endtime': range_end}
+        for frequency, range_in, range_out, range_start, range_end in ranges
+    ]
+    return file_info
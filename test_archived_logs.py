@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Test reading ranges of .gz logs and .zip members through inflate checkpoints"""
+import gzip
+import os
+import random
+import shutil
+import tempfile
+import zipfile
+
+import app
+from app import ArchivedLogReader, is_archived_log, read_log_bytes, split_archive_path
+
+
+def _log_bytes(lines=6000, seed=7):
+    rng = random.Random(seed)
+    return "".join(
+        f"18/02/2026 23:{n // 60 % 60:02d}:{n % 60:02d}.{rng.randrange(1000):03d} track {rng.getrandbits(64):016x}\r\n"
+        for n in range(lines)
+    ).encode()
+
+
+def _ranges(length, seed=3):
+    rng = random.Random(seed)
+    spans = [(0, 10), (length - 10, length), (length // 2, length // 2 + 5000)]
+    for _ in range(20):
+        start = rng.randrange(length)
+        spans.append((start, min(length, start + rng.randrange(1, 20000))))
+    return spans
+
+
+def _with_small_checkpoints(test):
+    """Run *test* with checkpoints every 16 KB and 4 KB reads, so small files get several."""
+    def run():
+        spacing, chunk = app._CHECKPOINT_SPACING, app._INFLATE_CHUNK
+        app._CHECKPOINT_SPACING, app._INFLATE_CHUNK = 16 * 1024, 4 * 1024
+        base = tempfile.mkdtemp(prefix="archive-test-")
+        try:
+            test(base)
+        finally:
+            app._CHECKPOINT_SPACING, app._INFLATE_CHUNK = spacing, chunk
+            shutil.rmtree(base)
+    run.__name__ = test.__name__
+    return run
+
+
+@_with_small_checkpoints
+def test_gz_ranges_use_checkpoints(base):
+    data = _log_bytes()
+    path = os.path.join(base, "KL4MusicScheduler.Channel1.20260218.log.gz")
+    with gzip.open(path, "wb") as f:
+        f.write(data)
+
+    assert is_archived_log(path)
+    reader = ArchivedLogReader(path)
+    assert reader.read_all() == data
+    assert len(reader._checkpoints) > 3
+    # Reads after the checkpoints exist, in any order, start from the nearest one
+    for start, end in _ranges(len(data)):
+        assert reader.read_range(start, end) == data[start:end]
+    assert reader.read_range(len(data), len(data) + 10) == b""
+
+
+@_with_small_checkpoints
+def test_gz_with_several_members(base):
+    first, second = _log_bytes(2000, seed=1), _log_bytes(2000, seed=2)
+    path = os.path.join(base, "joined.log.gz")
+    with open(path, "wb") as f:
+        f.write(gzip.compress(first) + gzip.compress(second))
+
+    reader = ArchivedLogReader(path)
+    data = first + second
+    # A cold read across the member boundary, then the whole file
+    boundary = len(first)
+    assert reader.read_range(boundary - 100, boundary + 100) == data[boundary - 100:boundary + 100]
+    assert reader.read_all() == data
+
+
+@_with_small_checkpoints
+def test_zip_members(base):
+    data = _log_bytes()
+    small = b"only a few bytes\r\n"
+    container = os.path.join(base, "logs.zip")
+    with zipfile.ZipFile(container, "w") as zf:
+        zf.writestr("deflated.log", data, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("stored.log", small, compress_type=zipfile.ZIP_STORED)
+
+    path = container + "::deflated.log"
+    assert split_archive_path(path) == (container, "deflated.log")
+    assert is_archived_log(path)
+    assert read_log_bytes(path) == data
+    reader = app.archived_log_reader(path)
+    assert reader is app.archived_log_reader(path)  # cached with its checkpoints
+    for start, end in _ranges(len(data)):
+        assert reader.read_range(start, end) == data[start:end]
+
+    stored = ArchivedLogReader(container + "::stored.log")
+    assert stored.read_all() == small
+    assert stored.read_range(5, 8) == small[5:8]
+    assert stored.read_range(5, 1000) == small[5:]
+
+
+@_with_small_checkpoints
+def test_corrupt_archive_raises_oserror(base):
+    path = os.path.join(base, "broken.log.gz")
+    with open(path, "wb") as f:
+        f.write(gzip.compress(_log_bytes(500))[:40] + b"\x00" * 200)
+    try:
+        ArchivedLogReader(path).read_all()
+    except OSError:
+        pass
+    else:
+        raise AssertionError("corrupt archive was read without an error")
+
+
+if __name__ == "__main__":
+    print("Testing archived log reader:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All archived log tests passed")
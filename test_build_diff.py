@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Test diffing cores.xml between snapshot builds"""
+import os
+import shutil
+import tempfile
+from xml.etree import ElementTree as ET
+
+from app import diff_xml_trees, hash_xml_tree, load_hashed_xml
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "example_cores.xml")
+
+
+def _example():
+    return ET.parse(EXAMPLE).getroot()
+
+
+def _core(root, core_id):
+    return next(core for core in root.iter("KvCore") if core.get("ID") == core_id)
+
+
+def _summary(changes):
+    return [(c["kind"], c["path"]) for c in changes]
+
+
+def test_identical_builds():
+    assert diff_xml_trees(hash_xml_tree(_example()), hash_xml_tree(_example())) == []
+
+
+def test_release_change():
+    new = _example()
+    _core(new, "30385").set("RELEASENAME", "v1_2")
+    changes = diff_xml_trees(hash_xml_tree(_example()), hash_xml_tree(new))
+    assert _summary(changes) == [("changed", ("KvCore[kvutils/30385]",))]
+    assert changes[0]["attrs"] == [("RELEASENAME", "v1_1", "v1_2")]
+    assert changes[0]["text"] is None
+
+
+def test_added_removed_and_reordered():
+    old = _example()
+    new = _example()
+    unzip = _core(new, "30386")
+    new.remove(unzip)
+    ET.SubElement(new, "KvCore", APPLICATION="NewTool", RELEASENAME="v1", ID="99999")
+    # Moving a core is not a change: children are matched by APPLICATION/ID
+    kvutils = _core(new, "30385")
+    new.remove(kvutils)
+    new.append(kvutils)
+
+    changes = diff_xml_trees(hash_xml_tree(old), hash_xml_tree(new))
+    assert sorted(_summary(changes)) == [
+        ("added", ("KvCore[NewTool/99999]",)),
+        ("removed", ("KvCore[Unzip/30386]",)),
+    ]
+    added = next(c for c in changes if c["kind"] == "added")
+    assert added["node"].attrib["APPLICATION"] == "NewTool"
+
+
+def test_nested_param_change():
+    new = _example()
+    param = _core(new, "145380").find("Programs/Program/Params/Param")
+    param.set("Name", r"-p D:\Logs")
+    changes = diff_xml_trees(hash_xml_tree(_example()), hash_xml_tree(new))
+    prefix = ("KvCore[winEvents/145380]", "Programs", "Program[winEvents.exe]", "Params")
+    assert sorted(_summary(changes)) == [
+        ("added", prefix + (r"Param[-p D:\Logs]",)),
+        ("removed", prefix + (r"Param[-p C:\Kaleidovision\SharedLogfiles]",)),
+    ]
+
+
+def test_text_change():
+    old = ET.fromstring("<Cores><Note>first</Note></Cores>")
+    new = ET.fromstring("<Cores><Note>second</Note></Cores>")
+    changes = diff_xml_trees(hash_xml_tree(old), hash_xml_tree(new))
+    assert _summary(changes) == [("changed", ("Note",))]
+    assert changes[0]["text"] == ("first", "second")
+
+
+def test_load_hashed_xml_is_cached():
+    base = tempfile.mkdtemp(prefix="build-diff-test-")
+    try:
+        path = os.path.join(base, "cores.xml")
+        shutil.copy(EXAMPLE, path)
+        first = load_hashed_xml(path)
+        assert load_hashed_xml(path) is first
+        assert first.digest == hash_xml_tree(_example()).digest
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    print("Testing cores.xml build diff:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All build diff tests passed")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Test the shared, reference-counted log buffer cache"""
+import os
+import shutil
+import tempfile
+
+from app import LogBufferCache
+
+LINE = "2025-10-02 09:00:00 Café playlist loaded\r\n"  # 'é' is two bytes in UTF-8
+SIZE = len((LINE * 10).encode("utf-8"))
+
+
+def _write_logs(base, *names):
+    paths = []
+    for name in names:
+        paths.append(os.path.join(base, f"{name}.log"))
+        with open(paths[-1], "w", encoding="utf-8", newline="") as f:
+            f.write(LINE * 10)
+    return paths
+
+
+def _cached(cache):
+    return sorted(os.path.basename(key[0]) for key in cache._buffers)
+
+
+def test_acquire_shares_one_buffer():
+    base = tempfile.mkdtemp(prefix="log-buffers-test-")
+    try:
+        path, = _write_logs(base, "a")
+        cache = LogBufferCache()
+        first = cache.acquire(path)
+        assert cache.acquire(path) is first and first.refs == 2
+        # Sized by the bytes read, not the decoded characters
+        assert first.nbytes == SIZE and len(first.text) < SIZE
+        assert "\r" not in first.text and first.index.line_count == 10
+        cache.release(first)
+        cache.release(first)
+        assert first.refs == 0 and _cached(cache) == ["a.log"]  # idle but within budget
+        cache.release(first)
+        assert first.refs == 0
+    finally:
+        shutil.rmtree(base)
+
+
+def test_held_buffers_are_never_evicted():
+    base = tempfile.mkdtemp(prefix="log-buffers-test-")
+    try:
+        a, b = _write_logs(base, "a", "b")
+        cache = LogBufferCache(budget_bytes=SIZE + SIZE // 2)
+        buffer_a, buffer_b = cache.acquire(a), cache.acquire(b)
+        assert _cached(cache) == ["a.log", "b.log"] and cache._total == 2 * SIZE
+        cache.release(buffer_a)
+        assert _cached(cache) == ["b.log"] and cache._total == SIZE
+        cache.release(buffer_b)
+        assert _cached(cache) == ["b.log"]
+    finally:
+        shutil.rmtree(base)
+
+
+def test_idle_buffers_evicted_least_recently_used_first():
+    base = tempfile.mkdtemp(prefix="log-buffers-test-")
+    try:
+        a, b, c = _write_logs(base, "a", "b", "c")
+        cache = LogBufferCache(budget_bytes=2 * SIZE)
+        for path in (a, b, a):
+            cache.release(cache.acquire(path))
+        cache.release(cache.acquire(c))
+        assert _cached(cache) == ["a.log", "c.log"]
+    finally:
+        shutil.rmtree(base)
+
+
+def test_changed_file_drops_old_version():
+    base = tempfile.mkdtemp(prefix="log-buffers-test-")
+    try:
+        path, = _write_logs(base, "a")
+        cache = LogBufferCache()
+        old = cache.acquire(path)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("2025-10-02 09:00:01 Error: more\n")
+        # Released after the file changed: it can never be hit again
+        cache.release(old)
+        assert _cached(cache) == [] and cache._total == 0
+
+        cache.release(cache.acquire(path))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("2025-10-02 09:00:02 again\n")
+        new = cache.acquire(path)
+        assert len(cache._buffers) == 1 and new.index.line_count == 12
+        assert cache._total == new.nbytes
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    print("Testing log buffer cache:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All log buffer cache tests passed")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test indexing log lines and their error/warning markers"""
+import os
+import shutil
+import tempfile
+
+import app
+from app import LogIndex, get_log_index
+
+LOG = (
+    b"2025-10-02 09:00:00 Service started\r\n"
+    b"2025-10-02 09:00:01 Error: playlist missing\n"
+    b"2025-10-02 09:00:02 Warning: disk 91% full\n"
+    b"2025-10-02 09:00:03 ErrorCount=0 noerror terror\n"
+    b"2025-10-02 09:00:04 Download FAILED, will warn later\n"
+    b"2025-10-02 09:00:05 done\n"
+)
+
+
+def test_line_offsets():
+    index = LogIndex(LOG)
+    assert index.line_count == 6
+    assert index.length == len(LOG)
+    lines = LOG.split(b"\n")
+    for n, offset in enumerate(index.line_offsets[:index.line_count]):
+        assert LOG[offset:].startswith(lines[n])
+    # Without the final newline the last line still counts
+    assert LogIndex(LOG.rstrip(b"\n")).line_count == 6
+    assert LogIndex(b"").line_count == 0
+
+
+def test_error_and_warning_lines():
+    index = LogIndex(LOG)
+    # Line numbers are 1-based; keywords need a word boundary on both sides
+    assert list(index.error_lines) == [2, 5]
+    # A line with an error is not listed as a warning as well
+    assert list(index.warning_lines) == [3]
+
+
+def test_density():
+    index = LogIndex(LOG)
+    assert index.density(2) == [(1, 1), (1, 0)]
+    assert index.density(1) == [(2, 1)]
+    assert sum(e for e, _ in index.density(100)) == 2
+    assert LogIndex(b"").density(3) == [(0, 0)] * 3
+
+
+def test_get_log_index_is_cached_by_content():
+    base = tempfile.mkdtemp(prefix="log-index-test-")
+    try:
+        path = os.path.join(base, "McServiceAppLog.log")
+        with open(path, "wb") as f:
+            f.write(LOG)
+        first = get_log_index(path)
+        assert get_log_index(path) is first
+        assert first.path == os.path.abspath(path) and first.size == len(LOG)
+
+        # Appending changes the size, so the file is indexed again
+        with open(path, "ab") as f:
+            f.write(b"2025-10-02 09:00:06 Fatal: stopped\n")
+        second = get_log_index(path)
+        assert second is not first
+        assert list(second.error_lines) == [2, 5, 7]
+    finally:
+        shutil.rmtree(base)
+
+
+def test_index_cache_is_bounded():
+    base = tempfile.mkdtemp(prefix="log-index-test-")
+    limit = app._LOG_INDEX_CACHE_MAX
+    app._LOG_INDEX_CACHE_MAX = 2
+    try:
+        paths = []
+        for n in range(3):
+            paths.append(os.path.join(base, f"log{n}.log"))
+            with open(paths[-1], "wb") as f:
+                f.write(LOG)
+            get_log_index(paths[-1])
+        assert len(app._log_index_cache) <= 2
+        assert [key[0] for key in app._log_index_cache] == [os.path.abspath(p) for p in paths[1:]]
+    finally:
+        app._LOG_INDEX_CACHE_MAX = limit
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    print("Testing log index:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All log index tests passed")
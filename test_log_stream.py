@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Test paging a multi-day log stream across day boundaries"""
+import os
+import shutil
+import tempfile
+
+from app import LogStream, consecutive_log_days
+
+
+class SmallPages(LogStream):
+    PAGE_LINES = 3
+
+
+def _make_logs():
+    base = tempfile.mkdtemp(prefix="stream-test-")
+    files = []
+    # 1-3 Oct are consecutive, 5 Oct starts a new run
+    for date_str, lines in (("20251001", 7), ("20251002", 3), ("20251003", 1), ("20251005", 2)):
+        path = os.path.join(base, f"KL4MusicScheduler.Channel1.{date_str}.log")
+        with open(path, "w", newline="") as f:
+            f.write("".join(f"{date_str} line {n}\r\n" for n in range(1, lines + 1)))
+        files.append((os.path.basename(path), date_str, path))
+    return base, files
+
+
+def test_consecutive_days():
+    base, files = _make_logs()
+    try:
+        run = consecutive_log_days(files, "20251002")
+        assert [d for d, _ in run] == ["20251001", "20251002", "20251003"]
+        assert [d for d, _ in consecutive_log_days(files, "20251005")] == ["20251005"]
+        assert consecutive_log_days(files, "20251004") == []
+    finally:
+        shutil.rmtree(base)
+
+
+def test_page_of():
+    assert LogStream.page_of(1) == 0
+    assert LogStream.page_of(LogStream.PAGE_LINES) == 0
+    assert LogStream.page_of(LogStream.PAGE_LINES + 1) == 1
+    assert SmallPages.page_of(0) == 0
+    assert SmallPages.page_of(7) == 2
+    stream = SmallPages("kl4", [])
+    assert stream.page_of(4) == 1
+
+
+def test_read_pages_across_days():
+    base, files = _make_logs()
+    try:
+        stream = SmallPages("kl4", consecutive_log_days(files, "20251001"))
+        assert [stream.page_count(seg) for seg in range(3)] == [3, 1, 1]
+
+        # Reading every page of every day gives each day's lines once, in order
+        seen = []
+        for seg in range(len(stream.segments)):
+            for page in range(stream.page_count(seg)):
+                text, first = stream.read_page(seg, page)
+                assert first == page * SmallPages.PAGE_LINES + 1
+                seen.extend(text.split("\n"))
+        expected = ([f"20251001 line {n}" for n in range(1, 8)] + [f"20251002 line {n}" for n in range(1, 4)]
+                    + ["20251003 line 1"])
+        assert seen == expected
+
+        # The page page_of() picks holds that line
+        text, first = stream.read_page(0, stream.page_of(7))
+        assert text.split("\n")[7 - first] == "20251001 line 7"
+        text, first = stream.read_page(1, stream.page_of(3))
+        assert text.split("\n")[3 - first] == "20251002 line 3"
+
+        # Past the last line is empty
+        assert stream.read_page(2, 1) == ("", 4)
+        assert "Wed 01/10/2025" in stream.separator(0)
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    print("Testing log stream:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All log stream tests passed")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Test forecasting overlay insertions from FREQUENCY-RANGES"""
+from datetime import datetime
+
+from app import TRACKS_PER_HOUR, OverlayForecast, ScheduleIndex
+from schedule_fixtures import overlay, profile
+
+START = datetime(2026, 12, 7)
+
+
+def _close(a, b):
+    return abs(a - b) < 1e-9
+
+
+def test_all_day_overlay_rate():
+    files = [profile("All Day"), overlay("Promo", [("3", "YYYY01010000", "YYYY12310000", "0000", "0000")])]
+    forecast = OverlayForecast(ScheduleIndex(files, START, days=2))
+    # FREQUENCY 3 plays 1 in every 4 tracks
+    assert len(forecast.per_hour) == 48
+    assert all(_close(value, TRACKS_PER_HOUR / 4) for value in forecast.per_hour)
+    assert all(_close(value, 24 * TRACKS_PER_HOUR / 4) for value in forecast.per_day())
+    assert all(_close(value, TRACKS_PER_HOUR / 4) for value in forecast.hour_of_day())
+    assert _close(forecast.total, forecast.by_overlay["Promo"])
+
+
+def test_windows_ranges_and_hosts():
+    files = [
+        profile("Day", "0800", "2200"),
+        overlay("Festive", [("4", "YYYY09010000", "YYYY12080000", "1100", "0000"),
+                             ("2", "YYYY12090000", "YYYY12150000", "1100", "0000")]),
+    ]
+    forecast = OverlayForecast(ScheduleIndex(files, START, days=3), tracks_per_hour=12)
+    # Only from 11:00 until the host profile stops at 22:00: 11 hours a day
+    hours = forecast.hour_of_day()
+    assert all(_close(hours[h], 0) for h in list(range(11)) + [22, 23])
+    # 7 and 8 Dec use FREQUENCY 4 (the OUTDATE day counts), 9 Dec FREQUENCY 2
+    assert [round(value, 6) for value in forecast.per_day()] == [11 * 12 / 5, 11 * 12 / 5, 11 * 12 / 3]
+    assert _close(forecast.per_hour[11], 12 / 5) and _close(forecast.per_hour[10], 0)
+
+
+def test_overlays_share_at_most_every_track():
+    files = [profile("All Day"),
+             overlay("A", [("0", "YYYY01010000", "YYYY12310000", "0000", "0000")]),
+             overlay("B", [("1", "YYYY01010000", "YYYY12310000", "0000", "0000")])]
+    forecast = OverlayForecast(ScheduleIndex(files, START, days=1))
+    # 1 + 1/2 of every track is more than there are; scaled down to all of them, 2:1
+    assert all(_close(value, TRACKS_PER_HOUR) for value in forecast.per_hour)
+    assert _close(forecast.by_overlay["A"], 2 * forecast.by_overlay["B"])
+
+
+def test_no_host_profile_no_insertions():
+    files = [overlay("Lonely", [("3", "YYYY01010000", "YYYY12310000", "0000", "0000")])]
+    forecast = OverlayForecast(ScheduleIndex(files, START, days=7))
+    assert forecast.total == 0 and forecast.by_overlay == {}
+    assert forecast.per_day() == [0.0] * 7
+
+
+if __name__ == "__main__":
+    print("Testing overlay forecast:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All overlay forecast tests passed")
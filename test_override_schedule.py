@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Test parsing and diffing the music override schedule feed"""
+import os
+import shutil
+import tempfile
+
+from app import diff_override_entries, parse_override_schedule
+
+FEED = """<?xml version="1.0"?>
+<Schedules>
+    <Channel id="1">
+        <Override ID="a1" ProfileName="Lunch Upbeat" DayOfWeek="2" StartTime="1200" EndTime="1400"/>
+        <Override ProfileName="Evening Chill" StartTime="1800" FinishTime="2200">
+            <InDate>20251201</InDate>
+            <OutDate>20251224</OutDate>
+        </Override>
+        <Override ProfileName="Evening Chill" StartTime="2200" FinishTime="2300"/>
+        <Note>no time window here</Note>
+    </Channel>
+</Schedules>
+"""
+
+
+def _write_feed(base, text, bump=0):
+    path = os.path.join(base, "xmlfeed.musicoverrideschedule.Channel1.xml")
+    with open(path, "w") as f:
+        f.write(text)
+    # Make sure the cache sees a new modification even within the same clock tick
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump * 1000))
+    return path
+
+
+def test_parse_fields_and_keys():
+    base = tempfile.mkdtemp(prefix="override-test-")
+    try:
+        entries = parse_override_schedule(_write_feed(base, FEED))
+        assert [e["key"] for e in entries] == ["a1", "Evening Chill", "Evening Chill#2"]
+
+        lunch, evening, late = entries
+        assert lunch["profile"] == "Lunch Upbeat" and lunch["days"] == "2"
+        assert (lunch["start"], lunch["end"]) == ("1200", "1400")
+        assert lunch["id"] == "a1"
+        # Child element text counts as well as attributes
+        assert (evening["from_date"], evening["to_date"]) == ("20251201", "20251224")
+        assert evening["end"] == "2200" and evening["id"] is None
+        assert late["start"] == "2200"
+    finally:
+        shutil.rmtree(base)
+
+
+def test_parse_is_cached_per_modification():
+    base = tempfile.mkdtemp(prefix="override-test-")
+    try:
+        path = _write_feed(base, FEED)
+        first = parse_override_schedule(path)
+        assert parse_override_schedule(path) is first
+
+        _write_feed(base, FEED.replace('EndTime="1400"', 'EndTime="1500"'), bump=1)
+        second = parse_override_schedule(path)
+        assert second is not first
+        assert second[0]["end"] == "1500"
+    finally:
+        shutil.rmtree(base)
+
+
+def test_diff_entries():
+    base = tempfile.mkdtemp(prefix="override-test-")
+    try:
+        path = _write_feed(base, FEED)
+        old = parse_override_schedule(path)
+        new_text = (FEED.replace('EndTime="1400"', 'EndTime="1500"')
+                    .replace('<Override ProfileName="Evening Chill" StartTime="2200" FinishTime="2300"/>',
+                             '<Override ID="b2" ProfileName="Breakfast" StartTime="0700" EndTime="0900"/>'))
+        new = parse_override_schedule(_write_feed(base, new_text, bump=1))
+        added, changed, removed = diff_override_entries(old, new)
+        assert added == {"b2"}
+        assert changed == {"a1"}
+        assert removed == {"Evening Chill#2"}
+        assert diff_override_entries(new, new) == (set(), set(), set())
+    finally:
+        shutil.rmtree(base)
+
+
+def test_unrecognised_attributes_still_count_as_changes():
+    base = tempfile.mkdtemp(prefix="override-test-")
+    try:
+        path = _write_feed(base, FEED)
+        old = parse_override_schedule(path)
+        new = parse_override_schedule(_write_feed(base, FEED.replace('ID="a1"', 'ID="a1" Volume="80"'), bump=1))
+        assert diff_override_entries(old, new) == (set(), {"a1"}, set())
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    print("Testing override schedule feed:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All override schedule tests passed")
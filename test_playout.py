@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Test simulating a profile's playout with RANDOM-ORDER and ARTIST-CLASH-DISTANCE"""
+import os
+
+from app import PlayoutSimulation, load_profile_playlist
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "example_profile.djv")
+
+
+def _playlist(clips=40, random_order=True, distance=0):
+    return {'random': random_order, 'clash_distance': distance, 'uids': [f"{{clip-{n}}}" for n in range(clips)]}
+
+
+def _artist_gaps(sim, artists):
+    last = {}
+    gaps = []
+    for pos, clip in enumerate(sim.sequence):
+        artist = artists.get(sim.uids[clip], sim.uids[clip])
+        if artist in last:
+            gaps.append(pos - last[artist])
+        last[artist] = pos
+    return gaps
+
+
+def test_load_example_profile():
+    playlist = load_profile_playlist(EXAMPLE)
+    assert playlist['random'] is True
+    assert playlist['clash_distance'] == 0
+    assert len(playlist['uids']) == 91
+    assert playlist['uids'][0] == "{9d0021a8-0661-29a3-0853-a8e2563024ee}"
+
+
+def test_in_order_cycles():
+    sim = PlayoutSimulation(_playlist(5, random_order=False), 12)
+    assert list(sim.sequence) == [0, 1, 2, 3, 4, 0, 1, 2, 3, 4, 0, 1]
+    assert sim.unique == 5 and sim.min_gap == 5 and sim.clashes == 0
+    assert sim.repeat_rate == 7 / 12
+    assert sim.most_played(1) == [("{clip-0}", 3)]
+
+
+def test_same_seed_same_sequence():
+    playlist = _playlist(60, distance=10)
+    first = PlayoutSimulation(playlist, 2000, seed=42)
+    assert first.sequence == PlayoutSimulation(playlist, 2000, seed=42).sequence
+    assert first.sequence != PlayoutSimulation(playlist, 2000, seed=43).sequence
+
+
+def test_shuffled_passes_play_every_clip():
+    sim = PlayoutSimulation(_playlist(30), 300, seed=1)
+    # Each pass plays every clip once before any comes round again
+    for start in range(0, 300, 30):
+        assert sorted(sim.sequence[start:start + 30]) == list(range(30))
+
+
+def test_clash_distance_is_kept():
+    playlist = _playlist(60, distance=8)
+    artists = {uid: f"artist-{n % 15}" for n, uid in enumerate(playlist['uids'])}
+    sim = PlayoutSimulation(playlist, 3000, seed=7, artists=artists)
+    assert sim.clashes == 0
+    assert min(_artist_gaps(sim, artists)) > 8
+
+    # Without artists each clip is its own artist
+    sim = PlayoutSimulation(_playlist(60, distance=30), 3000, seed=7)
+    assert sim.clashes == 0 and sim.min_gap > 30
+
+
+def test_distance_capped_by_artist_count():
+    sim = PlayoutSimulation(_playlist(20, distance=200), 1000, seed=3)
+    assert sim.clash_distance == 200
+    assert sim.effective_distance == 19
+    assert sim.clashes == 0 and sim.min_gap == 20
+
+
+def test_repeat_rates():
+    sim = PlayoutSimulation(_playlist(10), 1000, seed=5)
+    assert sim.plays == 1000 and sim.unique == 10
+    assert sim.repeat_rate == 0.99
+    assert sim.repeats_within(1000) == 0.99
+    assert sim.repeats_within(0) == 0
+    assert PlayoutSimulation(_playlist(0), 100).plays == 0
+
+
+def test_ten_thousand_tracks():
+    playlist = load_profile_playlist(EXAMPLE)
+    sim = PlayoutSimulation(dict(playlist, clash_distance=30), 10000, seed=1)
+    # One compact array slot per track, every clip played, distance kept throughout
+    assert sim.sequence.typecode == "I" and len(sim.sequence) == 10000
+    assert sim.plays == 10000 and sim.unique == 91
+    assert sim.clashes == 0 and sim.min_gap > 30
+
+
+if __name__ == "__main__":
+    print("Testing playout simulation:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All playout tests passed")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Test comparing profile sets between music snapshot folders"""
+import os
+import shutil
+import tempfile
+
+import app
+from app import compare_profile_sets, list_profile_files, profile_fingerprint
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _read(name):
+    with open(os.path.join(HERE, name)) as f:
+        return f.read()
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _make_snapshots():
+    base = tempfile.mkdtemp(prefix="profiles-test-")
+    profile, overlay = _read("example_profile.djv"), _read("example_overlay.olp")
+    old = os.path.join(base, "2025-10-01-0900", "Profiles")
+    new = os.path.join(base, "2025-10-02-0900", "Profiles")
+    for folder in (old, new):
+        _write(os.path.join(folder, "Christmas", "upbeat.djv"), profile)
+        _write(os.path.join(folder, "notes.txt"), "not a profile")
+    _write(os.path.join(old, "Christmas", "overlay.olp"), overlay)
+    _write(os.path.join(new, "Christmas", "overlay.olp"), overlay.replace('FREQUENCY="4"', 'FREQUENCY="6"'))
+    _write(os.path.join(old, "Lunch", "old.djv"), profile)
+    _write(os.path.join(new, "Evening", "new.djv"), profile.replace('StartTime="0000"', 'StartTime="1800"'))
+    # Same fields, different clip order
+    _write(os.path.join(old, "Lunch", "reordered.djv"), profile)
+    first = profile.index("<PLAY>")
+    second = profile.index("<PLAY>", first + 1)
+    _write(os.path.join(new, "Lunch", "reordered.djv"),
+           profile[:first] + profile[second:profile.index("<PLAY>", second + 1)] + profile[first:second]
+           + profile[profile.index("<PLAY>", second + 1):])
+    return base, old, new
+
+
+def test_list_profile_files():
+    base, old, new = _make_snapshots()
+    try:
+        assert sorted(list_profile_files(old)) == sorted([
+            os.path.join("Christmas", "upbeat.djv"), os.path.join("Christmas", "overlay.olp"),
+            os.path.join("Lunch", "old.djv"), os.path.join("Lunch", "reordered.djv"),
+        ])
+    finally:
+        shutil.rmtree(base)
+
+
+def test_compare_profile_sets():
+    base, old, new = _make_snapshots()
+    try:
+        changes = {c["path"]: c for c in compare_profile_sets(old, new)}
+        assert {path: c["kind"] for path, c in changes.items()} == {
+            os.path.join("Christmas", "overlay.olp"): "changed",
+            os.path.join("Evening", "new.djv"): "added",
+            os.path.join("Lunch", "old.djv"): "removed",
+            os.path.join("Lunch", "reordered.djv"): "changed",
+        }
+        overlay = changes[os.path.join("Christmas", "overlay.olp")]
+        assert [name for name, _, _ in overlay["fields"]] == ["FREQUENCY-RANGE 1"]
+        assert "FREQUENCY=4" in overlay["fields"][0][1] and "FREQUENCY=6" in overlay["fields"][0][2]
+        # Only the content changed: no parsed field differs
+        assert changes[os.path.join("Lunch", "reordered.djv")]["fields"] == []
+        assert compare_profile_sets(old, old) == []
+    finally:
+        shutil.rmtree(base)
+
+
+def test_fingerprint_fields_and_cache():
+    base, old, new = _make_snapshots()
+    try:
+        path = os.path.join(old, "Christmas", "overlay.olp")
+        digest, fields = profile_fingerprint(path)
+        assert fields["StartTime"] == "0600" and fields["FinishTime"] == "0559"
+        assert fields["clips"] == 0
+        assert len([name for name in fields if name.startswith("FREQUENCY-RANGE")]) == 3
+        assert profile_fingerprint(path) is profile_fingerprint(path)
+    finally:
+        shutil.rmtree(base)
+
+
+def test_fingerprint_cache_is_bounded():
+    base, old, new = _make_snapshots()
+    limit = app._PROFILE_FINGERPRINTS_MAX
+    app._PROFILE_FINGERPRINTS_MAX = 2
+    try:
+        paths = list(list_profile_files(old).values())
+        for path in paths:
+            profile_fingerprint(path)
+        assert len(app._profile_fingerprints) == 2
+        # The most recently used entries are the ones kept
+        assert [key[0] for key in app._profile_fingerprints] == paths[-2:]
+    finally:
+        app._PROFILE_FINGERPRINTS_MAX = limit
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    print("Testing profile snapshot comparison:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All profile comparison tests passed")
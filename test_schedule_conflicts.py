@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Test finding overlapping profiles, gaps and overnight wraps in a channel's week"""
+from datetime import datetime
+
+from app import _format_week_span, analyse_profile_schedules
+from schedule_fixtures import overlay, profile
+
+TODAY = datetime(2026, 10, 18)
+DAY = 24 * 60
+
+
+def _overlaps(result):
+    return [(a['schedule']['name'], b['schedule']['name'], spans) for a, b, spans, _ in result['overlaps']]
+
+
+def _gaps(result):
+    return [(start, end) for start, end, _ in result['gaps']]
+
+
+def test_back_to_back_profiles_do_not_overlap():
+    result = analyse_profile_schedules([profile("Morning", "0000", "1200"), profile("Afternoon", "1200", "0000")], TODAY)
+    assert result['overlaps'] == [] and result['gaps'] == [] and result['wraps'] == []
+    assert result['by_file'] == {}
+
+
+def test_overlap_spans_and_card_messages():
+    result = analyse_profile_schedules([profile("Day", "0600", "1800"), profile("Lunch", "1200", "1400", day="2")],
+                                       TODAY)
+    assert _overlaps(result) == [("Day", "Lunch", [(12 * 60, 14 * 60)])]
+    assert result['by_file']["/profiles/Lunch.djv"] == ["Overlaps Day (Mon 12:00–14:00)"]
+    assert result['by_file']["/profiles/Day.djv"] == ["Overlaps Lunch (Mon 12:00–14:00)"]
+
+
+def test_finish_time_ending_59_runs_to_end_of_minute():
+    result = analyse_profile_schedules([profile("Morning", "0000", "1159"), profile("Afternoon", "1200", "2359")],
+                                       TODAY)
+    assert result['gaps'] == [] and result['overlaps'] == []
+
+
+def test_gap_over_sunday_night_is_one_gap():
+    # Every day 06:00–22:00: the Sunday 22:00 → Monday 06:00 gap is one entry
+    result = analyse_profile_schedules([profile("Day", "0600", "2200")], TODAY)
+    gaps = _gaps(result)
+    assert len(gaps) == 7
+    assert (6 * DAY + 22 * 60, 7 * DAY + 6 * 60) in gaps
+    assert (0, 6 * 60) not in gaps
+    assert _format_week_span(*gaps[-1]) == "Sun 22:00 → Mon 06:00"
+    assert _format_week_span(*gaps[0]) == "Mon 22:00 → Tue 06:00"
+
+
+def test_overnight_wraps():
+    files = [profile("Almost All Day", "0600", "0559"), profile("Friday Late", "2000", "0200", day="6"),
+             profile("Same Time", "0900", "0900", indate="202001010000")]
+    result = analyse_profile_schedules(files, TODAY)
+    messages = {f['schedule']['name']: message for f, message in result['wraps']}
+    assert messages["Almost All Day"].startswith("Finishes 1 minute before it starts (06:00–05:59)")
+    assert messages["Friday Late"] == "Runs past midnight (20:00–02:00) into Saturday"
+    assert messages["Same Time"].startswith("Starts and finishes at 09:00")
+    # 0000/0000 is the normal whole day and is not flagged
+    assert analyse_profile_schedules([profile("All Day", "0000", "0000")], TODAY)['wraps'] == []
+    # Friday's spill into Saturday morning overlaps the every-day profile there
+    spans = dict(((a['schedule']['name'], b['schedule']['name']), s) for a, b, s, _ in result['overlaps'])
+    assert (4 * DAY + 20 * 60, 5 * DAY + 2 * 60) in spans[("Almost All Day", "Friday Late")]
+
+
+def test_profiles_running_out():
+    # Gaps once profiles expire are reported from that date, within the coming year only
+    result = analyse_profile_schedules([profile("Until Spring", "0000", "0000", outdate="202703010000")], TODAY)
+    assert result['gaps'] == [(0, 7 * DAY, datetime(2027, 3, 1))]
+
+
+def test_dates_and_overlays():
+    files = [
+        profile("Always", "0000", "0000"),
+        profile("Christmas", "1000", "1200", indate="202612010000", outdate="202612270000"),
+        profile("Expired", "1000", "1200", indate="202001010000", outdate="202101010000"),
+        overlay("Overlay", start="0000", end="0000", indate="", outdate=""),
+    ]
+    result = analyse_profile_schedules(files, TODAY)
+    assert [(a, b) for a, b, _ in _overlaps(result)] == [("Always", "Christmas")]
+    assert result['overlaps'][0][3] == datetime(2026, 12, 1)  # first date it happens
+    # Before December the week is fully covered; expired profiles and overlays are left out
+    assert result['gaps'] == []
+    assert "/profiles/Expired.djv" not in result['by_file']
+    assert "/profiles/Overlay.olp" not in result['by_file']
+
+
+def test_hundreds_of_profiles():
+    # 400 profiles in twelve back-to-back two-hour slots, with staggered dates
+    files = [profile(f"P{i}", f"{(i % 12) * 2:02d}00", f"{(i % 12) * 2 + 1:02d}59", str(i % 8),
+                     indate=f"2026{i % 12 + 1:02d}010000", outdate=f"2027{i % 12 + 1:02d}010000")
+             for i in range(400)]
+    result = analyse_profile_schedules(files, TODAY)
+    assert result['overlaps']
+    # Only profiles sharing a slot overlap, and only within that slot
+    for a, b, spans, _ in result['overlaps']:
+        slot = int(a['schedule']['name'][1:]) % 12
+        assert int(b['schedule']['name'][1:]) % 12 == slot
+        assert all(start % DAY >= slot * 120 and (end - start) <= 120 for start, end in spans)
+
+
+if __name__ == "__main__":
+    print("Testing schedule conflicts:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All schedule conflict tests passed")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Test resolving channel profiles and overlays into a schedule index"""
+from datetime import datetime, timedelta
+
+from app import ScheduleIndex, _dow_matches, _hhmm_minutes, profile_windows, week_start
+from schedule_fixtures import overlay, profile
+
+MONDAY, TUESDAY, FRIDAY, SATURDAY, SUNDAY = 0, 1, 4, 5, 6
+
+
+def _names(entries):
+    return sorted(entry['name'] for entry in entries)
+
+
+def test_hhmm_minutes():
+    assert _hhmm_minutes("0000") == 0
+    assert _hhmm_minutes("12:30") == 750
+    assert _hhmm_minutes("2359") == 1439
+    assert _hhmm_minutes("2400") == 1440
+    for bad in ("2459", "2401", "2360", "2500", "930", "ab12", "", None):
+        assert _hhmm_minutes(bad) is None, bad
+
+
+def test_day_of_week_mapping():
+    sunday = datetime(2026, 10, 18)
+    assert sunday.weekday() == SUNDAY
+    assert _dow_matches("1", sunday)
+    assert _dow_matches("2", sunday + timedelta(days=1))  # Monday
+    assert _dow_matches("7", sunday - timedelta(days=1))  # Saturday
+    assert not _dow_matches("2", sunday)
+    assert _dow_matches("0", sunday) and _dow_matches("", sunday)
+    assert not _dow_matches("8", sunday) and not _dow_matches("x", sunday)
+
+
+def test_active_at_weekday_with_overnight_window():
+    start = week_start(datetime(2026, 10, 14))
+    assert start == datetime(2026, 10, 12)
+    files = [profile("Day", "0800", "2000"), profile("Friday Night", "2000", "0800", day="6")]
+    index = ScheduleIndex(files, start)
+
+    assert _names(index.active_at_weekday(MONDAY, 12 * 60)) == ["Day"]
+    assert _names(index.active_at_weekday(FRIDAY, 21 * 60)) == ["Friday Night"]
+    # Friday's window runs on past midnight into Saturday morning
+    assert _names(index.active_at_weekday(SATURDAY, 7 * 60)) == ["Friday Night"]
+    assert _names(index.active_at_weekday(SATURDAY, 8 * 60)) == ["Day"]
+    # No night profile on other days
+    assert index.active_at_weekday(SUNDAY, 7 * 60) == ()
+    assert index.active_at_weekday(MONDAY, 21 * 60) == ()
+    assert index.active_at(start - timedelta(minutes=1)) == ()
+
+
+def test_finish_time_ending_59_runs_to_end_of_minute():
+    start = datetime(2026, 10, 12)
+    files = [profile("Day", "0800", "1659"), profile("Evening", "1700", "2359"), profile("Night", "0000", "0759")]
+    index = ScheduleIndex(files, start)
+    assert _names(index.active_at_weekday(MONDAY, 16 * 60 + 59)) == ["Day"]
+    assert _names(index.active_at_weekday(MONDAY, 17 * 60)) == ["Evening"]
+    assert _names(index.active_at_weekday(MONDAY, 23 * 60 + 59)) == ["Evening"]
+    assert _names(index.active_at_weekday(MONDAY, 7 * 60 + 59)) == ["Night"]
+    # No "No profile" slivers between them
+    assert all(active for _, _, active in index.segments(start, start + timedelta(days=1)))
+    # The usual 0600/0559 profile covers the whole day
+    all_day = ScheduleIndex([profile("All Day", "0600", "0559")], start)
+    assert _names(all_day.active_at_weekday(TUESDAY, 5 * 60 + 59)) == ["All Day"]
+    assert list(profile_windows(profile("All Day", "0600", "0559"), start)) == [
+        (datetime(2026, 10, 12, 6), datetime(2026, 10, 13, 6), None)]
+
+
+def test_indate_outdate_clipping():
+    start = datetime(2026, 10, 12)
+    files = [profile("Promo", "0000", "0000", indate="202610141200", outdate="202610160900")]
+    index = ScheduleIndex(files, start)
+    assert index.active_at(datetime(2026, 10, 14, 11, 59)) == ()
+    assert _names(index.active_at(datetime(2026, 10, 14, 12, 0))) == ["Promo"]
+    assert _names(index.active_at(datetime(2026, 10, 16, 8, 59))) == ["Promo"]
+    assert index.active_at(datetime(2026, 10, 16, 9, 0)) == ()
+
+
+def test_yearly_frequency_range_over_new_year():
+    festive = overlay("Festive", [("3", "YYYY12200000", "YYYY01050000", "1000", "1200")])
+    windows = list(profile_windows(festive, datetime(2027, 1, 2)))
+    assert windows == [(datetime(2027, 1, 2, 10), datetime(2027, 1, 2, 12), 0)]
+
+    index = ScheduleIndex([festive], datetime(2026, 12, 14), days=28)
+    at = lambda *args: index.active_at(datetime(*args))
+    assert at(2026, 12, 19, 11) == ()
+    assert [(e['name'], e['kind'], e['frequency']) for e in at(2026, 12, 20, 11)] == [("Festive", "overlay", 3)]
+    assert _names(at(2026, 12, 31, 11)) == ["Festive"]
+    assert _names(at(2027, 1, 5, 11)) == ["Festive"]  # the OUTDATE day is included
+    assert at(2027, 1, 6, 11) == ()
+    assert at(2026, 12, 31, 13) == ()
+
+
+def test_segments_cover_the_day():
+    start = datetime(2026, 10, 12)
+    files = [profile("Day", "0800", "2000"), profile("Lunch", "1200", "1400", day="2")]
+    index = ScheduleIndex(files, start)
+    segments = index.segments(start, start + timedelta(days=1))
+
+    assert segments[0][0] == start and segments[-1][1] == start + timedelta(days=1)
+    for (_, end, _), (next_start, _, _) in zip(segments, segments[1:]):
+        assert end == next_start
+    assert [(s.hour, e.hour if e.day == 12 else 24, _names(active)) for s, e, active in segments] == [
+        (0, 8, []), (8, 12, ["Day"]), (12, 14, ["Day", "Lunch"]), (14, 20, ["Day"]), (20, 24, []),
+    ]
+    # Profiles sort before overlays, then by name
+    assert [e['kind'] for e in index.active_at(datetime(2026, 10, 12, 13))] == ["profile", "profile"]
+    assert index.segments(start - timedelta(days=2), start - timedelta(days=1)) == []
+
+
+if __name__ == "__main__":
+    print("Testing schedule index:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All schedule index tests passed")
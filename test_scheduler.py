@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Test the single-timer job scheduler against a fake Tk root and clock"""
+from app import Scheduler
+
+
+class _Event:
+    def __init__(self, widget):
+        self.widget = widget
+
+
+class _FakeRoot:
+    """Records after() timers; the test fires them by moving the clock on."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.timers = {}  # id -> (due, callback)
+        self.cancelled = []
+        self.window_state = "normal"
+        self._next_id = 0
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        timer = f"after#{self._next_id}"
+        self.timers[timer] = (self.now + ms, callback)
+        return timer
+
+    def after_cancel(self, timer):
+        self.cancelled.append(timer)
+        self.timers.pop(timer, None)
+
+    def after_idle(self, callback):
+        callback()
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    bind_all = bind
+
+    def state(self):
+        return self.window_state
+
+    def focus_displayof(self):
+        return None
+
+    def advance(self, ms):
+        """Move the clock on by *ms*, firing timers as they fall due."""
+        end = self.now + ms
+        while True:
+            due = [(when, timer) for timer, (when, _) in self.timers.items() if when <= end]
+            if not due:
+                break
+            when, timer = min(due)
+            self.now = max(self.now, when)
+            _, callback = self.timers.pop(timer)
+            callback()
+        self.now = end
+
+
+def _scheduler():
+    root = _FakeRoot()
+    scheduler = Scheduler()
+    scheduler._now = lambda: root.now
+    scheduler.attach(root)
+    return scheduler, root
+
+
+def test_jobs_within_merge_window_share_a_wakeup():
+    scheduler, root = _scheduler()
+    ran = []
+    scheduler.once("low", 100, lambda: ran.append(("low", root.now)))
+    scheduler.once("high", 100 + Scheduler.MERGE_MS - 10, lambda: ran.append(("high", root.now)), priority=5)
+    scheduler.once("later", 100 + Scheduler.MERGE_MS + 10, lambda: ran.append(("later", root.now)))
+    assert len(root.timers) == 1
+    root.advance(100)
+    # One wakeup ran both, highest priority first; the third is still pending
+    assert ran == [("high", 100), ("low", 100)]
+    assert scheduler.scheduled("later") and len(root.timers) == 1
+    root.advance(100)
+    assert ran[-1] == ("later", 100 + Scheduler.MERGE_MS + 10)
+    assert root.timers == {}
+
+
+def test_same_name_replaces_pending_job():
+    scheduler, root = _scheduler()
+    ran = []
+    scheduler.once("refresh", 100, lambda: ran.append("first"))
+    scheduler.once("refresh", 300, lambda: ran.append("second"))
+    # The earlier timer was swapped for the new due time
+    assert len(root.timers) == 1 and len(root.cancelled) == 1
+    root.advance(200)
+    assert ran == []
+    root.advance(200)
+    assert ran == ["second"]
+    scheduler.once("gone", 100, lambda: ran.append("gone"))
+    scheduler.cancel("gone")
+    root.advance(500)
+    assert ran == ["second"] and root.timers == {}
+
+
+def test_periodic_interval_and_returned_delay():
+    scheduler, root = _scheduler()
+    runs = []
+
+    def tick():
+        runs.append(root.now)
+        return 500 if len(runs) == 2 else None
+
+    scheduler.every("poll", 100, tick, first_ms=0)
+    root.advance(1000)
+    assert runs == [0, 100, 600, 700, 800, 900, 1000]
+    scheduler.wake("poll")
+    root.advance(0)
+    assert runs[-1] == 1000 and len(runs) == 8
+
+
+def test_failing_job_keeps_its_schedule():
+    scheduler, root = _scheduler()
+    runs = []
+
+    def broken():
+        runs.append(root.now)
+        raise RuntimeError("boom")
+
+    scheduler.every("broken", 100, broken)
+    root.advance(300)
+    assert runs == [100, 200, 300]
+
+
+def test_hidden_window_pauses_periodic_jobs():
+    scheduler, root = _scheduler()
+    ran = []
+    scheduler.every("poll", 100, lambda: ran.append(("poll", root.now)))
+    scheduler.every("always", 100, lambda: ran.append(("always", root.now)), run_when_hidden=True)
+    root.advance(100)
+    assert sorted(name for name, _ in ran) == ["always", "poll"]
+
+    root.window_state = "iconic"
+    scheduler._on_visibility_event(_Event(root))
+    assert scheduler.hidden
+    ran.clear()
+    scheduler.once("deferred", 50, lambda: ran.append(("deferred", root.now)))
+    root.advance(1000)
+    assert all(name != "poll" for name, _ in ran)
+    # The deferred job ran, and pulled the next "always" run into its wakeup
+    assert ran[:2] == [("always", 150), ("deferred", 150)]
+    assert len([name for name, _ in ran if name == "always"]) == 10
+    # Once the paused job is parked only the hidden-safe job keeps the timer going
+    scheduler.cancel("always")
+    assert root.timers == {}
+
+    root.window_state = "normal"
+    scheduler._on_visibility_event(_Event(root))
+    assert not scheduler.hidden
+    root.advance(0)
+    assert ran[-1] == ("poll", 1100)
+
+
+def test_unfocused_jobs_stretch_to_background_interval():
+    scheduler, root = _scheduler()
+    runs = []
+    scheduler.every("poll", 100, lambda: runs.append(root.now), background_ms=1000)
+    scheduler._on_focus_event(None)  # the fake root reports no focus
+    assert not scheduler.focused
+    root.advance(2500)
+    assert runs == [100, 1100, 2100]
+
+    root.focus_displayof = lambda: root
+    scheduler._on_focus_event(None)
+    assert scheduler.focused
+    # Back to the normal rate straight away rather than after the stretched wait
+    root.advance(0)
+    assert runs[-1] == 2500
+
+
+if __name__ == "__main__":
+    print("Testing scheduler:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All scheduler tests passed")
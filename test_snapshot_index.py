@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Test the cached index of dated snapshot folders"""
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+from app import SnapshotIndex, find_latest_xml_file
+
+FOLDERS = ["2025-10-02-0242", "2025-09-30-2359", "2025-10-02-1500", "2025-11-01-0000"]
+
+
+def _make_base():
+    base = tempfile.mkdtemp(prefix="snapshot-test-")
+    for name in FOLDERS + ["not-a-snapshot", "2025-13-01-0000"]:
+        os.makedirs(os.path.join(base, name))
+    # A file with a snapshot-like name is not a snapshot
+    open(os.path.join(base, "2025-12-01-0000"), "w").close()
+    return base
+
+
+def _touch_dir(path, bump):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump * 1000))
+
+
+def test_folders_sorted_and_filtered():
+    base = _make_base()
+    try:
+        index = SnapshotIndex()
+        assert [name for _, name in index.folders(base)] == sorted(FOLDERS)
+        assert index.folders(base)[0][0] == datetime(2025, 9, 30, 23, 59)
+        assert index.folders(os.path.join(base, "missing")) == []
+    finally:
+        shutil.rmtree(base)
+
+
+def test_latest_and_previous():
+    base = _make_base()
+    try:
+        index = SnapshotIndex()
+        assert index.latest(base) == "2025-11-01-0000"
+        assert index.previous(base, "2025-10-02-1500") == "2025-10-02-0242"
+        assert index.previous(base, "2025-10-02-0242") == "2025-09-30-2359"
+        assert index.previous(base, "2025-09-30-2359") is None
+        assert index.previous(base, "2025-10-03-0000") is None  # not in the index
+        assert index.previous(base, "not-a-snapshot") is None
+        assert SnapshotIndex().latest(os.path.join(base, "missing")) is None
+    finally:
+        shutil.rmtree(base)
+
+
+def test_between_is_inclusive():
+    base = _make_base()
+    try:
+        index = SnapshotIndex()
+        assert index.between(base, datetime(2025, 10, 2, 2, 42), datetime(2025, 10, 2, 15, 0)) == [
+            "2025-10-02-0242", "2025-10-02-1500"]
+        assert index.between(base, datetime(2025, 10, 1), datetime(2025, 10, 31)) == [
+            "2025-10-02-0242", "2025-10-02-1500"]
+        assert index.between(base, datetime(2026, 1, 1), datetime(2026, 2, 1)) == []
+    finally:
+        shutil.rmtree(base)
+
+
+def test_rescanned_when_base_changes():
+    base = _make_base()
+    try:
+        index = SnapshotIndex()
+        first = index.folders(base)
+        assert index.folders(base) is first  # cached while the base is unchanged
+
+        os.makedirs(os.path.join(base, "2025-12-24-0900"))
+        _touch_dir(base, 1)
+        assert index.latest(base) == "2025-12-24-0900"
+
+        shutil.rmtree(os.path.join(base, "2025-12-24-0900"))
+        _touch_dir(base, 2)
+        assert index.latest(base) == "2025-11-01-0000"
+    finally:
+        shutil.rmtree(base)
+
+
+def test_find_latest_xml_file():
+    base = _make_base()
+    try:
+        folder, path = find_latest_xml_file("cores.xml", base)
+        assert folder == "2025-11-01-0000"
+        assert path == os.path.join(base, "2025-11-01-0000", "cores.xml")
+        assert find_latest_xml_file("cores.xml", os.path.join(base, "missing")) == (None, None)
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    print("Testing snapshot index:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All snapshot index tests passed")
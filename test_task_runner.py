@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Test handing background work back to the Tk thread with LatestTaskRunner"""
+import threading
+import time
+
+from app import LatestTaskRunner
+
+
+class _FakeWidget:
+    """Stands in for a Tk widget: after() callbacks run when the test pumps them."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+
+    def pump(self, timeout=2.0):
+        """Run poll callbacks until the runner stops re-arming them."""
+        deadline = time.monotonic() + timeout
+        while self.pending:
+            assert time.monotonic() < deadline, "runner kept polling"
+            callbacks, self.pending = self.pending, []
+            for callback in callbacks:
+                callback()
+            time.sleep(0.005)
+
+
+def test_result_delivered_and_polling_stops():
+    widget = _FakeWidget()
+    runner = LatestTaskRunner(widget)
+    results = []
+    runner.start(lambda token: 42, results.append)
+    widget.pump()
+    assert results == [42]
+    assert runner._token is None and widget.pending == []
+
+
+def test_failure_without_on_error_stops_polling():
+    widget = _FakeWidget()
+    runner = LatestTaskRunner(widget)
+    results = []
+
+    def work(token):
+        raise OSError("share went away")
+
+    runner.start(work, results.append)
+    widget.pump()
+    assert results == []
+    assert runner._token is None and widget.pending == []
+
+
+def test_failure_goes_to_on_error():
+    widget = _FakeWidget()
+    runner = LatestTaskRunner(widget)
+    errors = []
+
+    def work(token):
+        raise ValueError("bad data")
+
+    runner.start(work, lambda result: None, errors.append)
+    widget.pump()
+    assert [str(e) for e in errors] == ["bad data"]
+    assert runner._token is None
+
+
+def test_only_latest_task_is_delivered():
+    widget = _FakeWidget()
+    runner = LatestTaskRunner(widget)
+    release = threading.Event()
+    results = []
+
+    def slow(token):
+        release.wait(2)
+        return "stale"
+
+    first = runner.start(slow, results.append)
+    runner.start(lambda token: "fresh", results.append)
+    assert first.cancelled
+    release.set()
+    widget.pump()
+    time.sleep(0.05)  # give the superseded worker time to finish
+    widget.pending.append(runner._poll)
+    widget.pump()
+    assert results == ["fresh"]
+
+
+def test_cancel_discards_result():
+    widget = _FakeWidget()
+    runner = LatestTaskRunner(widget)
+    results = []
+    runner.start(lambda token: 1, results.append)
+    runner.cancel()
+    widget.pump()
+    assert results == [] and widget.pending == []
+
+
+if __name__ == "__main__":
+    print("Testing latest-task runner:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All task runner tests passed")
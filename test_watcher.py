@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Test the filesystem watcher against a temporary directory tree"""
+import os
+import shutil
+import tempfile
+
+from app import FileChange, FileWatcher
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _kinds(changes):
+    return sorted((c.kind, os.path.basename(c.path)) for c in changes)
+
+
+def _make_tree():
+    base = tempfile.mkdtemp(prefix="watcher-test-")
+    _write(os.path.join(base, "2025-10-02-0242", "cores.xml"), "<Cores/>")
+    _write(os.path.join(base, "2025-10-02-0242", "Profiles", "Lunch", "a.djv"), "a")
+    return base
+
+
+def test_new_snapshot_folder():
+    base = _make_tree()
+    try:
+        seen = []
+        watcher = FileWatcher(native=False)
+        watcher.watch("kv-base", base, seen.extend, pattern=r"^\d{4}-\d{2}-\d{2}-\d{4}$")
+        # watch() does not scan; the first poll only takes the snapshot
+        assert watcher._watches["kv-base"].snapshot is None
+        assert watcher.poll() == []
+        assert "2025-10-02-0242" in str(watcher._watches["kv-base"].snapshot)
+
+        os.makedirs(os.path.join(base, "2025-10-03-0900"))
+        os.makedirs(os.path.join(base, "not-a-snapshot"))
+        changes = watcher.poll()
+        assert _kinds(changes) == [("created", "2025-10-03-0900")]
+        assert changes[0].is_dir and changes[0].watch == "kv-base"
+        assert seen == changes
+        assert watcher.poll() == []
+    finally:
+        shutil.rmtree(base)
+
+
+def test_file_modified_and_deleted():
+    base = _make_tree()
+    try:
+        xml_path = os.path.join(base, "2025-10-02-0242", "cores.xml")
+        watcher = FileWatcher(native=False)
+        watcher.watch("cores-xml", xml_path, lambda changes: None)
+        assert watcher.poll() == []
+
+        _write(xml_path, "<Cores><KvCore/></Cores>")
+        assert _kinds(watcher.poll()) == [("modified", "cores.xml")]
+
+        os.remove(xml_path)
+        assert _kinds(watcher.poll()) == [("deleted", "cores.xml")]
+
+        _write(xml_path, "<Cores/>")
+        assert _kinds(watcher.poll()) == [("created", "cores.xml")]
+    finally:
+        shutil.rmtree(base)
+
+
+def test_recursive_profiles():
+    base = _make_tree()
+    try:
+        profiles = os.path.join(base, "2025-10-02-0242", "Profiles")
+        watcher = FileWatcher(native=False)
+        watcher.watch("profiles", profiles, lambda changes: None, depth=None)
+        assert watcher.poll() == []
+
+        _write(os.path.join(profiles, "Evening", "b.olp"), "b")
+        _write(os.path.join(profiles, "Lunch", "a.djv"), "changed")
+        assert _kinds(watcher.poll()) == [("created", "Evening"), ("created", "b.olp"), ("modified", "a.djv")]
+
+        # Only the top level is watched at depth 0
+        watcher.watch("profiles", profiles, lambda changes: None, depth=0)
+        assert watcher.poll() == []
+        _write(os.path.join(profiles, "Lunch", "c.djv"), "c")
+        assert watcher.poll() == []
+    finally:
+        shutil.rmtree(base)
+
+
+def test_presence_only_and_rewatch():
+    base = _make_tree()
+    try:
+        logs = os.path.join(base, "logfiles")
+        _write(os.path.join(logs, "KL4MusicScheduler.Channel1.20251002.log"), "x")
+        watcher = FileWatcher(native=False)
+        watcher.watch("logs", logs, lambda changes: None, modifications=False, pattern=r"\.Channel1\.")
+        assert watcher.poll() == []
+
+        # Appending to a log is not reported, a new day's log is
+        _write(os.path.join(logs, "KL4MusicScheduler.Channel1.20251002.log"), "xx")
+        _write(os.path.join(logs, "KL4MusicScheduler.Channel2.20251003.log"), "y")
+        _write(os.path.join(logs, "KL4MusicScheduler.Channel1.20251003.log"), "z")
+
+        # Watching the same target again keeps the snapshot, so the change is still reported once
+        calls = []
+        watcher.watch("logs", logs, calls.append, modifications=False, pattern=r"\.Channel1\.")
+        assert _kinds(watcher.poll()) == [("created", "KL4MusicScheduler.Channel1.20251003.log")]
+        assert len(calls) == 1
+
+        watcher.unwatch("logs")
+        assert not watcher.watching("logs")
+        assert watcher.poll() == []
+    finally:
+        shutil.rmtree(base)
+
+
+def test_missing_folder_appears():
+    base = _make_tree()
+    try:
+        feeds = os.path.join(base, "xmlFeeds")
+        feed = os.path.join(feeds, "xmlfeed.musicoverrideschedule.Channel1.xml")
+        watcher = FileWatcher(native=False)
+        watcher.watch("override", feed, lambda changes: None)
+        assert watcher.poll() == []
+
+        _write(feed, "<Schedules/>")
+        changes = watcher.poll()
+        assert [(c.kind, c.path) for c in changes] == [(FileChange.CREATED, feed)]
+    finally:
+        shutil.rmtree(base)
+
+
+def test_callback_errors_do_not_stop_other_watches():
+    base = _make_tree()
+    try:
+        seen = []
+
+        def broken(changes):
+            raise RuntimeError("boom")
+
+        watcher = FileWatcher(native=False)
+        watcher.watch("a", base, broken)
+        watcher.watch("b", base, seen.extend)
+        assert watcher.poll() == []
+        os.makedirs(os.path.join(base, "2025-10-04-1200"))
+        assert len(watcher.poll()) == 2
+        assert len(seen) == 1
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    print("Testing file watcher:")
+    print("=" * 60)
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"  {name}: OK")
+    print("=" * 60)
+    print("All watcher tests passed")